@@ -1,9 +1,14 @@
 import tkinter as tk
-import random
-from PIL import Image, ImageTk
-import pygame
+import getpass
 import os
 
+from animation import AnimationScheduler, BubbleField
+from audio import AudioService
+from background import BackgroundRenderer
+from leaderboard import Leaderboard
+from quiz_engine import ADAPTIVE_LEVEL, QuizEngine
+from session_log import SessionLog
+
 class QuizApp:
     def __init__(self, master):
         self.master = master
@@ -33,8 +38,10 @@ class QuizApp:
 
         master.configure(bg=self.BG_DARK)
 
-        # AUDIO SETUP
-        self.setup_audio()
+        # AUDIO (mixer set up and sounds preloaded on the audio thread once the window is up)
+        self.audio = AudioService(self.script_dir, music=["chill.mp3"],
+                                  effects={"correct": "correct.wav", "incorrect": "incorrect.wav"})
+        master.after_idle(self.audio.start)
 
         # BACKGROUND IMAGE
         self.set_image_background("math.jpg")
@@ -44,32 +51,32 @@ class QuizApp:
         self.header_font = ("Segoe UI", 22, "bold")
         self.problem_font = ("Segoe UI", 34, "bold")
 
-        # GAME VARIABLES
-        self.difficulty = 0
-        self.score = 0
-        self.question_count = 0
-        self.current_problem = {}
-        self.attempts = 0
+        # GAME STATE (all quiz rules live in the engine; this class only draws them)
+        self.engine = QuizEngine()
+
+        # SESSION LOG (timings of every question, answer and popup; flushed in batches)
+        self.session_log = SessionLog(os.path.join(self.script_dir, "session_logs"))
+        self.popup_shown_at = None
+
+        # LEADERBOARD (every finished round; saved by a background thread)
+        self.leaderboard = Leaderboard(os.path.join(self.script_dir, "leaderboard.db"))
+        self.player_name = tk.StringVar(value=self.default_player_name())
+        self.level_names = {1: "EASY", 2: "MODERATE", 3: "ADVANCED", ADAPTIVE_LEVEL: "ADAPTIVE"}
 
+        # SCREENS (built once on first use, then only shown, hidden and updated)
         self.current_frame = None
+        self.menu_frame = None
+        self.quiz_frame = None
+        self.results_frame = None
+        self.answer_popup = None
+        self.animations = AnimationScheduler(master)
         self.display_menu()
 
-    # --- AUDIO METHODS ---
-    def setup_audio(self):
-        try:
-            pygame.mixer.init()
-        except pygame.error as e:
-            print(f"Audio setup failed: {e}")
-
-    def play_background_music(self, music_file="chill.mp3"):
+    def default_player_name(self):
         try:
-            full_path = os.path.join(self.script_dir, music_file)
-            if not pygame.mixer.music.get_busy():
-                pygame.mixer.music.load(full_path)
-                pygame.mixer.music.set_volume(0.25)
-                pygame.mixer.music.play(-1)
-        except pygame.error as e:
-            print(f"Could not play music: {e}.")
+            return getpass.getuser()
+        except Exception:
+            return "Player"
 
     # --- FULL SCREEN EXIT ---
     def end_fullscreen(self, event=None):
@@ -77,52 +84,14 @@ class QuizApp:
         self.master.unbind('<Escape>')
         self.master.bind('<Escape>', lambda e: self.master.destroy())
 
-        if pygame.mixer.get_init():
-            pygame.mixer.music.stop()
+        self.audio.stop_music()
 
     # --- IMAGE HANDLING ---
     def set_image_background(self, image_path):
-        try:
-            screen_width = self.master.winfo_screenwidth()
-            screen_height = self.master.winfo_screenheight()
-            full_path = os.path.join(self.script_dir, image_path)
-            original_image = Image.open(full_path)
-            resized_image = original_image.resize((screen_width, screen_height), Image.Resampling.LANCZOS)
-            overlay = Image.new('RGBA', resized_image.size, (255, 255, 255, 200))
-            self.bg_image_pil = Image.blend(resized_image.convert('RGBA'), overlay, 0.2)
-            self.bg_image_tk = ImageTk.PhotoImage(self.bg_image_pil)
-            self.bg_canvas = tk.Canvas(self.master, width=screen_width, height=screen_height, highlightthickness=0)
-            self.bg_canvas.place(x=0, y=0, relwidth=1, relheight=1)
-            self.bg_canvas.create_image(0, 0, image=self.bg_image_tk, anchor="nw")
-        except Exception as e:
-            print(f"Image Error: {e}")
-            self.master.configure(bg=self.BG_DARK)
-
-    # --- CORE GAME LOGIC ---
-    def random_int(self, difficulty_level):
-        if difficulty_level == 1: return 1, 9
-        elif difficulty_level == 2: return 10, 99
-        elif difficulty_level == 3: return 1000, 9999
-        return 1, 9
-
-    def decide_operation(self):
-        return random.choice(['+', '-'])
-
-    def is_correct(self, user_answer):
-        try:
-            return int(user_answer) == self.current_problem['answer']
-        except ValueError:
-            return False
-
-    def generate_problem(self):
-        min_val, max_val = self.random_int(self.difficulty)
-        num1 = random.randint(min_val, max_val)
-        num2 = random.randint(min_val, max_val)
-        op = self.decide_operation()
-        if op == '-' and num1 < num2:
-            num1, num2 = num2, num1
-        answer = num1 + num2 if op == '+' else num1 - num2
-        self.current_problem = {'num1': num1, 'num2': num2, 'op': op, 'answer': answer}
+        # BG_DARK shows until the worker thread has the (usually cached) image ready
+        self.background = BackgroundRenderer(self.master, os.path.join(self.script_dir, image_path),
+                                             os.path.join(self.script_dir, "background_cache"), self.BG_DARK)
+        self.background.request(self.master.winfo_screenwidth(), self.master.winfo_screenheight())
 
     # --- HELPER: CREATE CUSTOM POPUP ---
     def create_custom_popup(self, title, width=300, height=150):
@@ -136,27 +105,35 @@ class QuizApp:
         except tk.TclError:
             pass
 
-        # Center the popup
-        x = self.master.winfo_rootx() + self.master.winfo_width() // 2 - (width // 2)
-        y = self.master.winfo_rooty() + self.master.winfo_height() // 2 - (height // 2)
-        popup.geometry(f"{width}x{height}+{x}+{y}")
+        self.center_popup(popup, width, height)
         popup.resizable(False, False)
         popup.transient(self.master)
         popup.grab_set() # Make modal
         return popup
 
+    def center_popup(self, popup, width, height):
+        x = self.master.winfo_rootx() + self.master.winfo_width() // 2 - (width // 2)
+        y = self.master.winfo_rooty() + self.master.winfo_height() // 2 - (height // 2)
+        popup.geometry(f"{width}x{height}+{x}+{y}")
+
     # --- GUI FRAME MANAGEMENT ---
-    def switch_frame(self, new_frame_func):
-        if self.current_frame:
-            self.current_frame.destroy()
-        new_frame_func()
-
-    def reset_game(self):
-        self.difficulty = 0
-        self.score = 0
-        self.question_count = 0
-        self.current_problem = {}
-        self.attempts = 0
+    def create_screen_frame(self, padx, pady):
+        return tk.Frame(self.master, padx=padx, pady=pady, bg=self.BG_LIGHT,
+                        relief=tk.RIDGE, borderwidth=0, highlightthickness=2,
+                        highlightbackground=self.ACCENT_YELLOW)
+
+    def show_screen(self, frame, animation=None):
+        # Screens are hidden rather than destroyed, so switching costs no widget creation;
+        # a hidden screen's animations are cancelled with it
+        if self.current_frame is frame:
+            return
+        if self.current_frame is not None:
+            self.animations.cancel(self.current_frame)
+            self.current_frame.place_forget()
+        frame.place(relx=0.5, rely=0.5, anchor="center")
+        self.current_frame = frame
+        if animation is not None:
+            self.animations.add(frame, animation)
 
     # --- CUSTOM QUIT POPUP (Replaces messagebox.askyesno) ---
     def quit_game(self):
@@ -173,7 +150,9 @@ class QuizApp:
         def confirm():
             popup.destroy()
             self.master.unbind('<Return>')
-            self.switch_frame(self.display_menu)
+            self.session_log.record("round_quit", question=self.engine.question_count, score=self.engine.score)
+            self.session_log.flush()
+            self.display_menu()
             
         # Custom styled buttons
         tk.Button(btn_frame, text="YES", command=confirm, 
@@ -186,49 +165,27 @@ class QuizApp:
 
     # --- DISPLAY MENU ---
     def display_menu(self):
-        self.reset_game()
-        menu_frame = tk.Frame(self.master, padx=40, pady=30, bg=self.BG_LIGHT,
-                              relief=tk.RIDGE, borderwidth=0, highlightthickness=2,
-                              highlightbackground=self.ACCENT_YELLOW)
-        menu_frame.place(relx=0.5, rely=0.5, anchor="center")
-        self.current_frame = menu_frame
+        self.engine.reset()
+        if self.menu_frame is None:
+            self.build_menu_screen()
+        self.show_screen(self.menu_frame, self.menu_bubbles.step)
+
+    def build_menu_screen(self):
+        menu_frame = self.menu_frame = self.create_screen_frame(40, 30)
 
         # Bubbles background
-        bubble_canvas = tk.Canvas(menu_frame, bg=self.BG_LIGHT, highlightthickness=0)
-        bubble_canvas.place(x=0, y=0, relwidth=1, relheight=1)
-        
-        bubbles = []
-        symbols = ['+', '-', '×', '÷', '=', 'π', '∞', '∑']
-        
-        for _ in range(6):
-            x = random.randint(20, 380)
-            y = random.randint(20, 380)
-            size = random.randint(30, 60)
-            symbol = random.choice(symbols)
-            speed = random.uniform(0.3, 1.5)
-            
-            bubble = bubble_canvas.create_oval(x, y, x+size, y+size, 
-                                        fill=self.BG_LIGHT, outline=self.ACCENT_YELLOW, width=2)
-            text = bubble_canvas.create_text(x+size/2, y+size/2, text=symbol, 
-                                    font=("Segoe UI", size//3), fill=self.ACCENT_BLACK)
-            bubbles.append({'bubble': bubble, 'text': text, 'x': x, 'y': y, 'dx': random.choice([-1, 1])*speed, 'dy': random.choice([-1, 1])*speed, 'size': size})
-        
-        def animate_bubbles():
-            for bubble_data in bubbles:
-                bubble_canvas.move(bubble_data['bubble'], bubble_data['dx'], bubble_data['dy'])
-                bubble_canvas.move(bubble_data['text'], bubble_data['dx'], bubble_data['dy'])
-                bubble_data['x'] += bubble_data['dx']
-                bubble_data['y'] += bubble_data['dy']
-                if bubble_data['x'] <= 0 or bubble_data['x'] >= 400 - bubble_data['size']: bubble_data['dx'] *= -1
-                if bubble_data['y'] <= 0 or bubble_data['y'] >= 400 - bubble_data['size']: bubble_data['dy'] *= -1
-            menu_frame.after(50, animate_bubbles)
-        animate_bubbles()
+        self.menu_bubbles = BubbleField(menu_frame, 6, self.BG_LIGHT, self.ACCENT_YELLOW, self.ACCENT_BLACK)
 
         tk.Label(menu_frame, text="➕ MATH MASTER", font=self.header_font, bg=self.BG_LIGHT, fg=self.ACCENT_YELLOW).pack(pady=(0, 10))
+        name_row = tk.Frame(menu_frame, bg=self.BG_LIGHT)
+        name_row.pack(pady=(0, 10))
+        tk.Label(name_row, text="Player:", font=self.font_style, bg=self.BG_LIGHT, fg=self.TEXT_COLOR).pack(side=tk.LEFT, padx=5)
+        tk.Entry(name_row, textvariable=self.player_name, font=self.font_style, justify='center', width=16, bd=2,
+                 relief=tk.FLAT, bg="#F5F5F5", fg=self.ACCENT_BLACK).pack(side=tk.LEFT)
+
         tk.Label(menu_frame, text="Select Difficulty Level", font=("Segoe UI", 14), bg=self.BG_LIGHT, fg=self.TEXT_COLOR).pack(pady=(0, 20))
 
-        options = [("EASY", 1), ("MODERATE", 2), ("ADVANCED", 3)]
-        for text, level in options:
+        for level, text in self.level_names.items():
             btn = tk.Button(menu_frame, text=text, font=self.font_style, bg=self.ACCENT_BLACK, fg=self.BG_LIGHT,
                             activebackground=self.ACCENT_YELLOW, activeforeground=self.BG_DARK,
                             command=lambda l=level: self.start_quiz(l), width=18, height=1, bd=0, relief=tk.FLAT, cursor="hand2")
@@ -245,40 +202,55 @@ class QuizApp:
 
     # --- START QUIZ ---
     def start_quiz(self, level):
-        self.difficulty = level
-        self.question_count = 0
-        self.score = 0
-        self.play_background_music()
-        self.switch_frame(self.display_problem)
+        self.engine.start(level)
+        self.session_log.record("round_start", level=level)
+        self.audio.play_music("chill.mp3", volume=0.25)
+        self.display_problem()
 
     # --- DISPLAY PROBLEM ---
     def display_problem(self):
-        self.question_count += 1
-        self.attempts = 0
-
-        if self.question_count > 10:
-            self.switch_frame(self.display_results)
+        problem = self.engine.next_problem()
+        if problem is None:
+            self.display_results()
             return
 
-        self.generate_problem()
+        if self.quiz_frame is None:
+            self.build_quiz_screen()
+
+        # Only the texts change between questions
+        counter = f"Question {self.engine.question_count} of {self.engine.questions}  |  Score: {self.engine.score}"
+        if self.engine.is_adaptive:
+            counter += f"  |  Skill: {self.engine.adaptive.skill:.0f}"
+        self.counter_label.config(text=counter)
+        self.problem_label.config(text=f"{problem.text} = ?")
+        self.answer_entry.delete(0, tk.END)
+        self.feedback_label.config(text="")
+        self.show_screen(self.quiz_frame)
+        self.answer_entry.focus_set()
+
+        self.master.bind('<Return>', lambda event: self.check_answer())
+
+        self.session_log.record("problem_shown", question=self.engine.question_count, problem=problem.text, op=problem.op)
+        # Runs once Tk has drawn the question, so the gap is how long the UI took to catch up
+        self.master.after_idle(self.log_render_lag, self.engine.question_count, self.session_log.elapsed())
+
+    def log_render_lag(self, question, shown_at):
+        self.session_log.record("problem_rendered", question=question,
+                                lag_ms=round((self.session_log.elapsed() - shown_at) * 1000, 2))
 
-        quiz_frame = tk.Frame(self.master, padx=30, pady=25, bg=self.BG_LIGHT,
-                              relief=tk.RIDGE, borderwidth=0, highlightthickness=2,
-                              highlightbackground=self.ACCENT_YELLOW)
-        quiz_frame.place(relx=0.5, rely=0.5, anchor="center")
-        self.current_frame = quiz_frame
+    def build_quiz_screen(self):
+        quiz_frame = self.quiz_frame = self.create_screen_frame(30, 25)
 
-        tk.Label(quiz_frame, text=f"Question {self.question_count} of 10  |  Score: {self.score}",
-                 font=("Segoe UI", 12, "bold"), bg=self.BG_LIGHT, fg=self.ACCENT_BLACK).pack(pady=(0, 20))
+        self.counter_label = tk.Label(quiz_frame, text="", font=("Segoe UI", 12, "bold"), bg=self.BG_LIGHT, fg=self.ACCENT_BLACK)
+        self.counter_label.pack(pady=(0, 20))
 
-        tk.Label(quiz_frame, text=f"{self.current_problem['num1']} {self.current_problem['op']} {self.current_problem['num2']} = ?", 
-                 font=self.problem_font, bg=self.BG_LIGHT, fg=self.ACCENT_YELLOW).pack(pady=10)
+        self.problem_label = tk.Label(quiz_frame, text="", font=self.problem_font, bg=self.BG_LIGHT, fg=self.ACCENT_YELLOW)
+        self.problem_label.pack(pady=10)
 
         self.answer_entry = tk.Entry(quiz_frame, font=self.header_font, justify='center', width=12, bd=2, 
                                      bg=self.ACCENT_BLACK, fg=self.BG_LIGHT, insertbackground=self.ACCENT_YELLOW, 
                                      relief=tk.FLAT, highlightthickness=2, highlightcolor=self.ACCENT_YELLOW, highlightbackground=self.ACCENT_BLACK)
         self.answer_entry.pack(pady=20)
-        self.answer_entry.focus_set()
 
         self.feedback_label = tk.Label(quiz_frame, text="", font=self.font_style, bg=self.BG_LIGHT, fg=self.ACCENT_BLACK)
         self.feedback_label.pack(pady=5)
@@ -300,31 +272,25 @@ class QuizApp:
         quit_btn.bind("<Enter>", lambda e: quit_btn.config(bg="#FF5252"))
         quit_btn.bind("<Leave>", lambda e: quit_btn.config(bg=self.QUIT_COLOR))
 
-        self.master.bind('<Return>', lambda event: self.check_answer())
-
     # --- CHECK ANSWER ---
     def check_answer(self):
         self.master.unbind('<Return>')
         user_answer = self.answer_entry.get().strip()
-
-        if self.is_correct(user_answer):
-            points = 10 if self.attempts == 0 else 5
-            self.score += points
-
+        result = self.engine.submit_answer(user_answer)
+        self.session_log.record("answer_submitted", question=self.engine.question_count,
+                                problem=self.engine.current_problem.text, op=self.engine.current_problem.op,
+                                answer=user_answer, correct=result.correct, done=result.done,
+                                attempt=self.engine.attempts + (1 if result.correct else 0),
+                                seconds=round(result.seconds, 3))
+
+        self.audio.play_effect("correct" if result.correct else "incorrect")
+        if result.correct:
             # Custom Success Popup (No Feather)
-            popup = self.create_custom_popup("➕ Correct!")
-            
-            tk.Label(popup, text="✅ CORRECT!", font=("Segoe UI", 16, "bold"), bg=self.BG_LIGHT, fg=self.ACCENT_BLACK).pack(pady=10)
-            tk.Label(popup, text=f"+{points} points!", font=("Segoe UI", 14), bg=self.BG_LIGHT, fg=self.ACCENT_YELLOW).pack(pady=5)
-            
-            tk.Button(popup, text="CONTINUE", font=self.font_style, bg=self.ACCENT_BLACK, fg=self.BG_LIGHT,
-                      activebackground=self.ACCENT_YELLOW, activeforeground=self.BG_DARK,
-                      command=lambda: [popup.destroy(), self.switch_frame(self.display_problem)],
-                      width=10, bd=0, relief=tk.FLAT, cursor="hand2").pack(pady=10)
+            self.show_answer_popup("➕ Correct!", "✅ CORRECT!", self.ACCENT_BLACK,
+                                   f"+{result.points} points!", ("Segoe UI", 14), self.ACCENT_YELLOW, "CONTINUE")
 
         else:
-            self.attempts += 1
-            if self.attempts < 2:
+            if not result.done:
                 self.feedback_label.config(text="Incorrect. Try again!")
                 self.answer_entry.delete(0, tk.END)
                 self.answer_entry.focus_set()
@@ -332,72 +298,86 @@ class QuizApp:
             else:
                 # Custom Incorrect Popup (No Feather)
                 # Replaces messagebox.showerror
-                popup = self.create_custom_popup("Incorrect")
-                
-                tk.Label(popup, text="❌ Incorrect", font=("Segoe UI", 16, "bold"), bg=self.BG_LIGHT, fg="#FF6B6B").pack(pady=10)
-                tk.Label(popup, text=f"The correct answer was {self.current_problem['answer']}.", font=("Segoe UI", 11), bg=self.BG_LIGHT, fg=self.ACCENT_BLACK).pack(pady=5)
-                
-                tk.Button(popup, text="OK", font=self.font_style, bg=self.ACCENT_BLACK, fg=self.BG_LIGHT,
-                          activebackground=self.ACCENT_YELLOW, activeforeground=self.BG_DARK,
-                          command=lambda: [popup.destroy(), self.switch_frame(self.display_problem)],
-                          width=10, bd=0, relief=tk.FLAT, cursor="hand2").pack(pady=15)
-                
-                # Ensure closing via X works too
-                popup.protocol("WM_DELETE_WINDOW", lambda: [popup.destroy(), self.switch_frame(self.display_problem)])
-
-    # --- GRADING ---
-    def get_grade(self, final_score):
-        if final_score > 90: return "A+ (Math Master!)"
-        elif final_score >= 80: return "A (Excellent!)"
-        elif final_score >= 70: return "B (Great Job!)"
-        elif final_score >= 60: return "C (Good Work)"
-        else: return "D (Keep Practicing)"
+                self.show_answer_popup("Incorrect", "❌ Incorrect", "#FF6B6B",
+                                       f"The correct answer was {result.answer}.", ("Segoe UI", 11),
+                                       self.ACCENT_BLACK, "OK")
+
+    # --- ANSWER POPUP (built once, then hidden and shown again) ---
+    def show_answer_popup(self, title, heading, heading_color, detail, detail_font, detail_color, button_text):
+        if self.answer_popup is None:
+            self.build_answer_popup()
+        else:
+            self.center_popup(self.answer_popup, 300, 150)
+            self.answer_popup.deiconify()
+            self.answer_popup.grab_set()
+        self.answer_popup.title(title)
+        self.popup_shown_at = self.session_log.elapsed()
+        self.session_log.record("popup_shown", question=self.engine.question_count, title=title)
+        self.popup_heading.config(text=heading, fg=heading_color)
+        self.popup_detail.config(text=detail, font=detail_font, fg=detail_color)
+        self.popup_button.config(text=button_text)
+
+    def build_answer_popup(self):
+        popup = self.answer_popup = self.create_custom_popup("")
+
+        self.popup_heading = tk.Label(popup, text="", font=("Segoe UI", 16, "bold"), bg=self.BG_LIGHT)
+        self.popup_heading.pack(pady=10)
+        self.popup_detail = tk.Label(popup, text="", bg=self.BG_LIGHT)
+        self.popup_detail.pack(pady=5)
+
+        self.popup_button = tk.Button(popup, text="", font=self.font_style, bg=self.ACCENT_BLACK, fg=self.BG_LIGHT,
+                                      activebackground=self.ACCENT_YELLOW, activeforeground=self.BG_DARK,
+                                      command=self.dismiss_answer_popup, width=10, bd=0, relief=tk.FLAT, cursor="hand2")
+        self.popup_button.pack(pady=10)
+
+        # Ensure closing via X works too
+        popup.protocol("WM_DELETE_WINDOW", self.dismiss_answer_popup)
+
+    def dismiss_answer_popup(self):
+        self.answer_popup.grab_release()
+        self.answer_popup.withdraw()
+        self.session_log.record("popup_dismissed", question=self.engine.question_count,
+                                seconds=round(self.session_log.elapsed() - self.popup_shown_at, 3))
+        self.display_problem()
 
     # --- RESULTS SCREEN ---
     def display_results(self):
-        max_score = 100
-        grade = self.get_grade(self.score)
-
-        results_frame = tk.Frame(self.master, padx=40, pady=30, bg=self.BG_LIGHT,
-                                 relief=tk.RIDGE, borderwidth=0, highlightthickness=2,
-                                 highlightbackground=self.ACCENT_YELLOW)
-        results_frame.place(relx=0.5, rely=0.5, anchor="center")
-        self.current_frame = results_frame
+        results = self.engine.results()
+        level = self.engine.difficulty
+        self.session_log.record("round_end", level=level, score=results.score, grade=results.grade,
+                                seconds=round(results.seconds, 1))
+        self.session_log.flush()
+        # Only queued here; top() already counts it while the writer saves it
+        player = self.player_name.get().strip()[:20] or "Player"
+        entry = self.leaderboard.record(player, level, results.score, results.seconds)
+
+        if self.results_frame is None:
+            self.build_results_screen()
+        self.final_score_label.config(text=f"Final Score: {results.score} / {results.max_score}")
+        self.grade_label.config(text=f"Grade: {results.grade}")
+        self.leaderboard_title.config(text=f"🏅 TOP 5 — {self.level_names[level]}")
+        rows = []
+        for rank, best in enumerate(self.leaderboard.top(level, 5), 1):
+            marker = "  ◀" if best.result_id == entry.result_id else ""
+            rows.append(f"{rank}. {best.player:<20} {best.score:>3}   {best.duration:>6.1f} s{marker}")
+        self.leaderboard_label.config(text="\n".join(rows))
+        self.show_screen(self.results_frame, self.results_bubbles.step)
+
+    def build_results_screen(self):
+        results_frame = self.results_frame = self.create_screen_frame(40, 30)
 
         # Bubbles background
-        bubble_canvas = tk.Canvas(results_frame, bg=self.BG_LIGHT, highlightthickness=0)
-        bubble_canvas.place(x=0, y=0, relwidth=1, relheight=1)
-        
-        bubbles = []
-        symbols = ['+', '-', '×', '÷', '=', 'π', '∞', '∑']
-        
-        for _ in range(6):
-            x = random.randint(20, 380)
-            y = random.randint(20, 380)
-            size = random.randint(30, 60)
-            symbol = random.choice(symbols)
-            speed = random.uniform(0.3, 1.5)
-            
-            bubble = bubble_canvas.create_oval(x, y, x+size, y+size, 
-                                        fill=self.BG_LIGHT, outline=self.ACCENT_YELLOW, width=2)
-            text = bubble_canvas.create_text(x+size/2, y+size/2, text=symbol, 
-                                    font=("Segoe UI", size//3), fill=self.ACCENT_BLACK)
-            bubbles.append({'bubble': bubble, 'text': text, 'x': x, 'y': y, 'dx': random.choice([-1, 1])*speed, 'dy': random.choice([-1, 1])*speed, 'size': size})
-        
-        def animate_bubbles():
-            for bubble_data in bubbles:
-                bubble_canvas.move(bubble_data['bubble'], bubble_data['dx'], bubble_data['dy'])
-                bubble_canvas.move(bubble_data['text'], bubble_data['dx'], bubble_data['dy'])
-                bubble_data['x'] += bubble_data['dx']
-                bubble_data['y'] += bubble_data['dy']
-                if bubble_data['x'] <= 0 or bubble_data['x'] >= 400 - bubble_data['size']: bubble_data['dx'] *= -1
-                if bubble_data['y'] <= 0 or bubble_data['y'] >= 400 - bubble_data['size']: bubble_data['dy'] *= -1
-            results_frame.after(50, animate_bubbles)
-        animate_bubbles()
+        self.results_bubbles = BubbleField(results_frame, 6, self.BG_LIGHT, self.ACCENT_YELLOW, self.ACCENT_BLACK)
 
         tk.Label(results_frame, text="🏆 QUIZ COMPLETE!", font=self.header_font, bg=self.BG_LIGHT, fg=self.ACCENT_YELLOW).pack(pady=15)
-        tk.Label(results_frame, text=f"Final Score: {self.score} / {max_score}", font=("Segoe UI", 18, "bold"), bg=self.BG_LIGHT, fg=self.ACCENT_BLACK).pack(pady=10)
-        tk.Label(results_frame, text=f"Grade: {grade}", font=("Segoe UI", 14), bg=self.BG_LIGHT, fg=self.ACCENT_BLACK).pack(pady=5)
+        self.final_score_label = tk.Label(results_frame, text="", font=("Segoe UI", 18, "bold"), bg=self.BG_LIGHT, fg=self.ACCENT_BLACK)
+        self.final_score_label.pack(pady=10)
+        self.grade_label = tk.Label(results_frame, text="", font=("Segoe UI", 14), bg=self.BG_LIGHT, fg=self.ACCENT_BLACK)
+        self.grade_label.pack(pady=5)
+        self.leaderboard_title = tk.Label(results_frame, text="", font=("Segoe UI", 12, "bold"), bg=self.BG_LIGHT, fg=self.ACCENT_YELLOW)
+        self.leaderboard_title.pack(pady=(15, 5))
+        self.leaderboard_label = tk.Label(results_frame, text="", font=("Consolas", 11), justify=tk.LEFT, bg=self.BG_LIGHT, fg=self.ACCENT_BLACK)
+        self.leaderboard_label.pack()
         tk.Label(results_frame, text="Play again?", font=("Segoe UI", 12), bg=self.BG_LIGHT, fg=self.TEXT_COLOR).pack(pady=20)
 
         btn_container = tk.Frame(results_frame, bg=self.BG_LIGHT)
@@ -405,7 +385,7 @@ class QuizApp:
 
         replay_btn = tk.Button(btn_container, text="PLAY AGAIN", font=self.font_style, bg=self.ACCENT_BLACK, fg=self.BG_LIGHT,
                                activebackground=self.ACCENT_YELLOW, activeforeground=self.BG_DARK,
-                               command=lambda: self.switch_frame(self.display_menu), width=12, height=1, bd=0, relief=tk.FLAT, cursor="hand2")
+                               command=self.display_menu, width=12, height=1, bd=0, relief=tk.FLAT, cursor="hand2")
         replay_btn.pack(side=tk.LEFT, padx=10)
         replay_btn.bind("<Enter>", lambda e: replay_btn.config(bg=self.ACCENT_YELLOW, fg=self.BG_DARK))
         replay_btn.bind("<Leave>", lambda e: replay_btn.config(bg=self.ACCENT_BLACK, fg=self.BG_LIGHT))
@@ -420,4 +400,7 @@ class QuizApp:
 if __name__ == "__main__":
     root = tk.Tk()
     app = QuizApp(root)
-    root.mainloop()
\ No newline at end of file
+    root.mainloop()
+    app.session_log.flush()
+    app.leaderboard.close()
+    app.audio.close()
\ No newline at end of file
@@ -0,0 +1,98 @@
+import math
+import random
+from typing import NamedTuple
+
+from problems import ProblemGenerator
+
+
+class Tier(NamedTuple):
+    op: str
+    minimum: int
+    maximum: int
+    # Starting difficulty on the same Elo-style scale as the player's skill
+    rating: float
+    # Seconds a confident first-try answer takes; slower correct answers count for less
+    target_seconds: float
+
+
+TIERS = (
+    Tier('+', 1, 9, 800, 4),
+    Tier('-', 1, 9, 850, 4),
+    Tier('×', 2, 9, 1000, 5),
+    Tier('÷', 2, 9, 1050, 6),
+    Tier('+', 10, 99, 1100, 7),
+    Tier('-', 10, 99, 1150, 8),
+    Tier('×', 10, 20, 1350, 10),
+    Tier('÷', 10, 20, 1400, 12),
+    Tier('+', 1000, 9999, 1500, 12),
+    Tier('-', 1000, 9999, 1550, 14),
+    Tier('×', 10, 99, 1700, 20),
+    Tier('÷', 10, 99, 1750, 24),
+)
+
+
+def expected_success(skill, rating):
+    return 1 / (1 + 10 ** ((rating - skill) / 400))
+
+
+def answer_outcome(attempts, correct, seconds, target_seconds):
+    # 1.0 for a quick first-try answer, fading to 0.75 at three times the target time;
+    # 0.5 for a second-try answer and 0 for a miss
+    if not correct:
+        return 0.0
+    if attempts > 0:
+        return 0.5
+    slowness = (seconds - target_seconds) / (2 * target_seconds)
+    return 1.0 - 0.25 * min(max(slowness, 0.0), 1.0)
+
+
+class AdaptiveDifficulty:
+    # Elo-style: the player has a skill and each tier (operator and operand range) a
+    # rating. After every answer both move by the gap between the outcome and the
+    # predicted success, and the next problem comes from the tier whose predicted
+    # success is closest to the target rate. Each update and pick is O(1) in the
+    # number of answers (the tier list is fixed and short)
+    def __init__(self, operators=('+', '-', '×', '÷'), skill=1000.0, target_success=0.75,
+                 k_player=32.0, k_tier=8.0, seed=None):
+        if not 0 < target_success < 1:
+            raise ValueError("Target success rate must be between 0 and 1")
+        self.tiers = [tier for tier in TIERS if tier.op in operators]
+        if not self.tiers:
+            raise ValueError("No tiers use the chosen operators")
+        self.ratings = [tier.rating for tier in self.tiers]
+        self.skill = skill
+        self.target_success = target_success
+        self.k_player = k_player
+        self.k_tier = k_tier
+        self.rng = random.Random(seed)
+        self.generators = [ProblemGenerator(tier.minimum, tier.maximum, (tier.op,), self.rng.getrandbits(64))
+                           for tier in self.tiers]
+        self.answers = 0
+
+    def target_rating(self):
+        # The rating a problem needs for the player to succeed at the target rate
+        return self.skill + 400 * math.log10(1 / self.target_success - 1)
+
+    def pick_tier(self):
+        goal = self.target_rating()
+        best = min(abs(rating - goal) for rating in self.ratings)
+        # Tiers about as close as the best one take turns, for variety
+        close = [index for index, rating in enumerate(self.ratings) if abs(rating - goal) <= best + 50]
+        return self.rng.choice(close)
+
+    def next_problem(self, exclude=()):
+        tier = self.pick_tier()
+        generator = self.generators[tier]
+        problem = generator.batch(1)[0]
+        if problem in exclude and len(exclude) < generator.capacity():
+            while problem in exclude:
+                problem = generator.batch(1)[0]
+        return tier, problem
+
+    def record(self, tier, attempts, correct, seconds):
+        predicted = expected_success(self.skill, self.ratings[tier])
+        outcome = answer_outcome(attempts, correct, seconds, self.tiers[tier].target_seconds)
+        self.skill += self.k_player * (outcome - predicted)
+        self.ratings[tier] -= self.k_tier * (outcome - predicted)
+        self.answers += 1
+        return outcome
@@ -0,0 +1,120 @@
+import random
+import time
+import tkinter as tk
+
+
+class AnimationScheduler:
+    # One after() loop drives every animation in the app. Each animation belongs to an
+    # owner (a screen frame) and is cancelled with it, so hiding a screen leaves no
+    # callback behind. All steps of a frame run in one callback, so Tk redraws the
+    # canvases once per frame at idle time instead of once per animation
+    def __init__(self, widget, fps=20, min_fps=8):
+        self.widget = widget
+        self.target_interval = 1000 / fps
+        self.max_interval = 1000 / min_fps
+        self.interval = self.target_interval
+        self.animations = {}
+        self.after_id = None
+        self.frames = 0
+        self.last_frame_ms = 0.0
+
+    def add(self, owner, step):
+        # step(scale) advances one frame; scale is 1.0 at the target frame rate and grows
+        # when frames are dropped, so animations keep the same speed on screen
+        self.animations.setdefault(owner, []).append(step)
+        if self.after_id is None:
+            self.after_id = self.widget.after(round(self.interval), self.tick)
+
+    def cancel(self, owner):
+        self.animations.pop(owner, None)
+        if not self.animations:
+            self.stop()
+
+    def cancel_all(self):
+        self.animations.clear()
+        self.stop()
+
+    def stop(self):
+        if self.after_id is not None:
+            self.widget.after_cancel(self.after_id)
+            self.after_id = None
+
+    def tick(self):
+        self.after_id = None
+        start = time.perf_counter()
+        scale = self.interval / self.target_interval
+        for steps in list(self.animations.values()):
+            for step in steps:
+                step(scale)
+        self.frames += 1
+        self.last_frame_ms = (time.perf_counter() - start) * 1000
+
+        # Drop the frame rate while frames take over half their slot, and win it back slowly
+        if self.last_frame_ms > self.interval / 2:
+            self.interval = min(self.max_interval, self.interval * 1.25)
+        elif self.last_frame_ms < self.interval / 4:
+            self.interval = max(self.target_interval, self.interval * 0.95)
+
+        if self.animations:
+            self.after_id = self.widget.after(round(self.interval), self.tick)
+
+
+class BubbleField:
+    # Floating maths-symbol bubbles on a canvas filling its parent. Each bubble's oval and
+    # symbol share one tag, so a frame costs a single canvas move per bubble, and the
+    # bounce edges follow the canvas's real size
+    SYMBOLS = ('+', '-', '×', '÷', '=', 'π', '∞', '∑')
+
+    def __init__(self, parent, count, bg, outline, text_color, rng=random):
+        self.canvas = tk.Canvas(parent, bg=bg, highlightthickness=0)
+        self.canvas.place(x=0, y=0, relwidth=1, relheight=1)
+        self.outline = outline
+        self.text_color = text_color
+        self.rng = rng
+        # Until the canvas is first laid out, assume the 400px square the screens roughly fill
+        self.width = 400
+        self.height = 400
+        self.canvas.bind('<Configure>', self.on_resize)
+        # One [tag, x, y, dx, dy, size] list per bubble
+        self.bubbles = []
+        for _ in range(count):
+            self.add_bubble()
+
+    def add_bubble(self):
+        rng = self.rng
+        size = rng.randint(30, 60)
+        x = rng.randint(0, max(0, self.width - size))
+        y = rng.randint(0, max(0, self.height - size))
+        speed = rng.uniform(0.3, 1.5)
+        tag = f"bubble{len(self.bubbles)}"
+        self.canvas.create_oval(x, y, x + size, y + size, fill=self.canvas['bg'], outline=self.outline,
+                                width=2, tags=(tag,))
+        self.canvas.create_text(x + size / 2, y + size / 2, text=rng.choice(self.SYMBOLS),
+                                font=("Segoe UI", size // 3), fill=self.text_color, tags=(tag,))
+        self.bubbles.append([tag, x, y, rng.choice([-1, 1]) * speed, rng.choice([-1, 1]) * speed, size])
+
+    def on_resize(self, event):
+        self.width = event.width
+        self.height = event.height
+
+    def step(self, scale=1.0):
+        move = self.canvas.move
+        width, height = self.width, self.height
+        for bubble in self.bubbles:
+            tag, x, y, dx, dy, size = bubble
+            dx *= scale
+            dy *= scale
+            move(tag, dx, dy)
+            x += dx
+            y += dy
+            # Head back inwards rather than flipping, so a bubble left outside by a shrinking canvas returns
+            if x <= 0:
+                bubble[3] = abs(bubble[3])
+            elif x >= width - size:
+                bubble[3] = -abs(bubble[3])
+            if y <= 0:
+                bubble[4] = abs(bubble[4])
+            elif y >= height - size:
+                bubble[4] = -abs(bubble[4])
+            bubble[1] = x
+            bubble[2] = y
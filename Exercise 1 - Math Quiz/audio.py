@@ -0,0 +1,136 @@
+import io
+import os
+import queue
+import threading
+
+import pygame
+
+
+class AudioService:
+    # Owns pygame's mixer on a thread of its own. start() returns at once: the thread
+    # initialises the mixer, reads the music into memory and decodes the sound effects,
+    # then works through play/stop/fade commands. The UI thread only ever queues a
+    # command, so it never waits on the audio device, the disk or a decoder. Both the
+    # command queue and the effect channels are bounded; when either is full the sound
+    # is dropped rather than delayed
+    def __init__(self, sound_dir, music=(), effects=None, effect_channels=4, max_pending=32):
+        self.sound_dir = sound_dir
+        self.music_files = tuple(music)
+        # Effect name -> file name
+        self.effect_files = dict(effects or {})
+        self.effect_channels = effect_channels
+        self.commands = queue.Queue(maxsize=max_pending)
+        self.music = {}
+        self.effects = {}
+        self.loaded_music = None
+        self.ready = threading.Event()
+        self.thread = None
+
+    def start(self):
+        if self.thread is None:
+            self.thread = threading.Thread(target=self.run, daemon=True)
+            self.thread.start()
+        return self
+
+    # --- UI THREAD (never blocks) ---
+    def send(self, *command):
+        # Commands sent before start() wait in the queue until the mixer is ready
+        try:
+            self.commands.put_nowait(command)
+            return True
+        except queue.Full:
+            return False
+
+    def play_music(self, file_name, volume=0.25, loops=-1, fade_ms=0):
+        return self.send("play_music", file_name, volume, loops, fade_ms)
+
+    def stop_music(self, fade_ms=0):
+        return self.send("stop_music", fade_ms)
+
+    def play_effect(self, name, volume=1.0):
+        return self.send("play_effect", name, volume)
+
+    def fade_out(self, fade_ms=500):
+        return self.send("fade_out", fade_ms)
+
+    def close(self, timeout=1.0):
+        if self.thread is None:
+            return
+        try:
+            self.commands.put(None, timeout=timeout)
+        except queue.Full:
+            return
+        self.thread.join(timeout)
+
+    # --- AUDIO THREAD ---
+    def run(self):
+        try:
+            pygame.mixer.init()
+            pygame.mixer.set_num_channels(self.effect_channels)
+        except pygame.error as e:
+            print(f"Audio setup failed: {e}")
+            self.ready.set()
+            # No sound, but keep taking commands so the queue never fills up
+            while self.commands.get() is not None:
+                pass
+            return
+        self.preload()
+        self.ready.set()
+        while (command := self.commands.get()) is not None:
+            name, *args = command
+            try:
+                getattr(self, "do_" + name)(*args)
+            except pygame.error as e:
+                print(f"Audio error ({name}): {e}")
+        pygame.mixer.quit()
+
+    def preload(self):
+        for file_name in self.music_files:
+            try:
+                with open(os.path.join(self.sound_dir, file_name), 'rb') as file:
+                    self.music[file_name] = file.read()
+            except OSError as e:
+                print(f"Could not load music: {e}.")
+        for name, file_name in self.effect_files.items():
+            try:
+                self.effects[name] = pygame.mixer.Sound(os.path.join(self.sound_dir, file_name))
+            except (OSError, pygame.error) as e:
+                print(f"Could not load sound effect: {e}.")
+        if self.music_files:
+            # Open the first track's stream now, so its first play starts straight away
+            self.load_music(self.music_files[0])
+
+    def load_music(self, file_name):
+        data = self.music.get(file_name)
+        if data is None:
+            return False
+        if self.loaded_music != file_name:
+            pygame.mixer.music.load(io.BytesIO(data), os.path.splitext(file_name)[1].lstrip('.'))
+            self.loaded_music = file_name
+        return True
+
+    def do_play_music(self, file_name, volume, loops, fade_ms):
+        if self.loaded_music == file_name and pygame.mixer.music.get_busy():
+            return
+        if not self.load_music(file_name):
+            return
+        pygame.mixer.music.set_volume(volume)
+        pygame.mixer.music.play(loops, fade_ms=fade_ms)
+
+    def do_stop_music(self, fade_ms):
+        if fade_ms:
+            pygame.mixer.music.fadeout(fade_ms)
+        else:
+            pygame.mixer.music.stop()
+
+    def do_play_effect(self, name, volume):
+        sound = self.effects.get(name)
+        # find_channel() is None when every effect channel is busy: skip this one
+        channel = pygame.mixer.find_channel() if sound else None
+        if channel is not None:
+            channel.set_volume(volume)
+            channel.play(sound)
+
+    def do_fade_out(self, fade_ms):
+        pygame.mixer.fadeout(fade_ms)
+        pygame.mixer.music.fadeout(fade_ms)
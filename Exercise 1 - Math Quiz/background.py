@@ -0,0 +1,134 @@
+import os
+import queue
+import threading
+import tkinter as tk
+from pathlib import Path
+
+from PIL import Image, ImageTk
+
+
+class BackgroundRenderer:
+    # Draws the faded background image on a canvas behind every screen. Each render is
+    # cached on disk, keyed by the source file's mtime and the target resolution, and
+    # decoding (cached or not) happens on a worker thread while the plain background
+    # colour shows. A window resize re-renders once the size has settled
+    def __init__(self, master, image_path, cache_dir, bg_color, resize_delay=250):
+        self.master = master
+        self.image_path = Path(image_path)
+        self.cache_dir = Path(cache_dir)
+        self.resize_delay = resize_delay
+        self.canvas = tk.Canvas(master, bg=bg_color, highlightthickness=0)
+        self.canvas.place(x=0, y=0, relwidth=1, relheight=1)
+        self.image_item = None
+        self.photo = None
+        # Size on screen and size being rendered, as (width, height)
+        self.size = None
+        self.pending_size = None
+        self.results = queue.Queue()
+        # One poll chain at most, however many renders are in flight
+        self.poll_scheduled = False
+        self.resize_after = None
+        self.canvas.bind('<Configure>', self.on_resize)
+
+    def cache_path(self, width, height):
+        mtime = self.image_path.stat().st_mtime_ns
+        return self.cache_dir / f"{self.image_path.stem}_{mtime}_{width}x{height}.png"
+
+    def request(self, width, height):
+        if width <= 1 or height <= 1 or (width, height) == self.pending_size:
+            return
+        if (width, height) == self.size and self.pending_size is None:
+            return
+        # Anything else renders, even the size already on screen: a render of another
+        # size still in flight would otherwise land over it (a cache hit makes this cheap)
+        self.pending_size = (width, height)
+        threading.Thread(target=self.render_worker, args=(width, height), daemon=True).start()
+        self.schedule_poll()
+
+    def on_resize(self, event):
+        if self.resize_after is not None:
+            self.master.after_cancel(self.resize_after)
+        self.resize_after = self.master.after(self.resize_delay, self.request, event.width, event.height)
+
+    # --- WORKER THREAD (no Tk calls here) ---
+    def render_worker(self, width, height):
+        try:
+            image = self.load_or_render(width, height)
+        except Exception as e:
+            image = e
+        self.results.put(((width, height), image))
+
+    def load_or_render(self, width, height):
+        path = self.cache_path(width, height)
+        if path.exists():
+            try:
+                image = Image.open(path)
+                image.load()
+                return image
+            except OSError:
+                pass
+
+        with Image.open(self.image_path) as original_image:
+            resized_image = original_image.resize((width, height), Image.Resampling.LANCZOS)
+        overlay = Image.new('RGBA', resized_image.size, (255, 255, 255, 200))
+        image = Image.blend(resized_image.convert('RGBA'), overlay, 0.2)
+
+        try:
+            self.cache_dir.mkdir(exist_ok=True)
+            # Written aside and renamed, so a reader never sees half a file
+            temp_path = path.with_suffix(".tmp")
+            image.save(temp_path, format="PNG")
+            os.replace(temp_path, path)
+            self.prune_cache(path)
+        except OSError as e:
+            print(f"Could not cache background: {e}")
+        return image
+
+    def prune_cache(self, keep):
+        # Renders of an older version of the source image can never be used again
+        current = keep.name.split("_")[-2]
+        for path in self.cache_dir.glob(f"{self.image_path.stem}_*.png"):
+            if path.name.split("_")[-2] != current:
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+
+    # --- UI THREAD ---
+    def schedule_poll(self):
+        if not self.poll_scheduled:
+            self.poll_scheduled = True
+            self.master.after(50, self.poll)
+
+    def take_result(self):
+        # Drains every finished render, in whatever order they finished, and returns
+        # the one for pending_size as (size, image); None if it is still rendering
+        wanted = None
+        while True:
+            try:
+                size, image = self.results.get_nowait()
+            except queue.Empty:
+                return wanted
+            if size == self.pending_size:
+                wanted = (size, image)
+
+    def poll(self):
+        self.poll_scheduled = False
+        if self.pending_size is None:
+            return
+        result = self.take_result()
+        if result is None:
+            self.schedule_poll()
+            return
+
+        size, image = result
+        self.pending_size = None
+        if isinstance(image, Exception):
+            print(f"Image Error: {image}")
+            return
+        self.photo = ImageTk.PhotoImage(image)
+        if self.image_item is None:
+            self.image_item = self.canvas.create_image(0, 0, image=self.photo, anchor="nw")
+        else:
+            self.canvas.itemconfig(self.image_item, image=self.photo)
+        self.size = size
@@ -0,0 +1,139 @@
+import datetime
+import queue
+import random
+import sqlite3
+import threading
+from typing import NamedTuple
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    id INTEGER PRIMARY KEY,
+    player TEXT NOT NULL,
+    difficulty INTEGER NOT NULL,
+    score INTEGER NOT NULL,
+    duration REAL NOT NULL,
+    recorded_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS results_rank ON results (difficulty, score DESC, duration);
+"""
+
+
+class Entry(NamedTuple):
+    # Chosen when the result is recorded, so a queued result and its saved row match
+    result_id: int
+    player: str
+    difficulty: int
+    score: int
+    # Seconds the round took; the faster of two equal scores ranks higher
+    duration: float
+    recorded_at: str
+
+
+def rank_key(entry):
+    return (-entry.score, entry.duration)
+
+
+class Leaderboard:
+    # Every result ever played, in SQLite. record() only queues the result: a writer
+    # thread commits whatever has queued up in one transaction, so the results screen
+    # never waits on the disk. Top-N reads walk the (difficulty, score, duration) index,
+    # so they cost the same with a million stored results as with ten
+    def __init__(self, path):
+        self.path = str(path)
+        # Holds an in-memory fallback database open; None when saving to disk
+        self.keeper = None
+        try:
+            connection = self.connect()
+            with connection:
+                # WAL lets the UI thread read while the writer commits
+                connection.execute("PRAGMA journal_mode=WAL")
+                connection.executescript(SCHEMA)
+            connection.close()
+        except sqlite3.Error as e:
+            print(f"Could not open the leaderboard ({e}); scores will only last until the game closes")
+            self.path = f"file:leaderboard_{id(self)}?mode=memory&cache=shared"
+            self.keeper = self.connect()
+            self.keeper.executescript(SCHEMA)
+        self.rng = random.Random()
+        self.queue = queue.Queue()
+        # Queued results not yet committed, so top() can already include them
+        self.pending = []
+        self.pending_lock = threading.Lock()
+        self.reader = None
+        self.writer = threading.Thread(target=self.write_loop, daemon=True)
+        self.writer.start()
+
+    def connect(self):
+        return sqlite3.connect(self.path, uri=self.path.startswith("file:"))
+
+    def record(self, player, difficulty, score, duration, recorded_at=None):
+        if recorded_at is None:
+            recorded_at = datetime.datetime.now().isoformat(timespec='seconds')
+        # Random rather than counted, so two copies of the game never pick the same ID
+        entry = Entry(self.rng.getrandbits(62), player, difficulty, score, round(duration, 2), recorded_at)
+        with self.pending_lock:
+            self.pending.append(entry)
+        self.queue.put(entry)
+        return entry
+
+    def top(self, difficulty, limit=10):
+        # Only call from one thread (the UI thread); the writer has its own connection.
+        # Queued results are copied before the query: one committed in between is then
+        # seen twice, never missed, and its ID drops the second copy
+        with self.pending_lock:
+            waiting = [entry for entry in self.pending if entry.difficulty == difficulty]
+        try:
+            if self.reader is None:
+                self.reader = self.connect()
+            rows = self.reader.execute(
+                "SELECT id, player, difficulty, score, duration, recorded_at FROM results "
+                "WHERE difficulty = ? ORDER BY score DESC, duration LIMIT ?", (difficulty, limit)).fetchall()
+        except sqlite3.Error as e:
+            print(f"Could not read the leaderboard: {e}")
+            rows = []
+        entries = [Entry(*row) for row in rows]
+        if waiting:
+            saved = {entry.result_id for entry in entries}
+            entries += [entry for entry in waiting if entry.result_id not in saved]
+            entries = sorted(entries, key=rank_key)[:limit]
+        return entries
+
+    def write_loop(self):
+        connection = self.connect()
+        while True:
+            batch = [self.queue.get()]
+            while True:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            stop = None in batch
+            entries = [entry for entry in batch if entry is not None]
+            if entries:
+                try:
+                    with connection:
+                        connection.executemany("INSERT INTO results (id, player, difficulty, score, duration, recorded_at) "
+                                               "VALUES (?, ?, ?, ?, ?, ?)", entries)
+                except sqlite3.Error as e:
+                    print(f"Could not save results: {e}")
+                with self.pending_lock:
+                    del self.pending[:len(entries)]
+            for _ in batch:
+                self.queue.task_done()
+            if stop:
+                connection.close()
+                return
+
+    def flush(self):
+        # Blocks until everything recorded so far is committed
+        self.queue.join()
+
+    def close(self):
+        self.queue.put(None)
+        self.writer.join()
+        if self.reader is not None:
+            self.reader.close()
+            self.reader = None
+        if self.keeper is not None:
+            self.keeper.close()
+            self.keeper = None
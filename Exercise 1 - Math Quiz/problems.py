@@ -0,0 +1,120 @@
+import random
+from functools import partial
+from itertools import repeat
+from operator import add, mul, sub
+from typing import NamedTuple
+
+OPERATORS = ('+', '-', '×', '÷')
+
+# Operand range for each menu level
+DIFFICULTY_RANGES = {1: (1, 9), 2: (10, 99), 3: (1000, 9999)}
+
+
+class Problem(NamedTuple):
+    num1: int
+    op: str
+    num2: int
+    answer: int
+
+    @property
+    def text(self):
+        return f"{self.num1} {self.op} {self.num2}"
+
+
+# Builds a Problem from a (num1, op, num2, answer) row without running Python code per problem
+new_problem = partial(tuple.__new__, Problem)
+
+
+def build_problems(op, firsts, seconds):
+    # Whole operand columns at once, one operator at a time
+    ops = repeat(op)
+    if op == '+':
+        rows = zip(firsts, ops, seconds, map(add, firsts, seconds))
+    elif op == '-':
+        # Larger operand first, so the answer is never negative (as the quiz always had it)
+        larger = list(map(max, firsts, seconds))
+        smaller = list(map(min, firsts, seconds))
+        rows = zip(larger, ops, smaller, map(sub, larger, smaller))
+    elif op == '×':
+        rows = zip(firsts, ops, seconds, map(mul, firsts, seconds))
+    else:
+        # Division is built backwards from the quotient, so every answer is a whole number
+        rows = zip(map(mul, firsts, seconds), ops, seconds, firsts)
+    return list(map(new_problem, rows))
+
+
+class ProblemGenerator:
+    # Draws problems in whole batches: the operators for a batch come from one rng.choices
+    # call, the operands for each operator from two more, and answers are computed a
+    # column at a time, instead of two randint calls and a choice per question. With a
+    # seed the same batches come out every time
+    def __init__(self, minimum, maximum, operators=('+', '-'), seed=None):
+        if minimum > maximum:
+            raise ValueError("Minimum operand cannot be larger than the maximum")
+        unknown = [op for op in operators if op not in OPERATORS]
+        if unknown or not operators:
+            raise ValueError(f"Operators must be chosen from {' '.join(OPERATORS)}")
+        if '÷' in operators and minimum < 1:
+            raise ValueError("Division needs operands of at least 1")
+        self.minimum = minimum
+        self.maximum = maximum
+        self.operators = tuple(operators)
+        self.rng = random.Random(seed)
+
+    @classmethod
+    def for_difficulty(cls, level, operators=('+', '-'), seed=None):
+        minimum, maximum = DIFFICULTY_RANGES.get(level, DIFFICULTY_RANGES[1])
+        return cls(minimum, maximum, operators, seed)
+
+    def capacity(self):
+        # How many different problems the range and operators allow
+        n = self.maximum - self.minimum + 1
+        return sum(n * (n + 1) // 2 if op == '-' else n * n for op in set(self.operators))
+
+    def batch(self, count):
+        values = range(self.minimum, self.maximum + 1)
+        operators = tuple(dict.fromkeys(self.operators))
+        ops = self.rng.choices(self.operators, k=count) if len(operators) > 1 else None
+        built = {}
+        for op in operators:
+            size = count if ops is None else ops.count(op)
+            firsts = self.rng.choices(values, k=size)
+            seconds = self.rng.choices(values, k=size)
+            built[op] = build_problems(op, firsts, seconds)
+        if ops is None:
+            return built[operators[0]]
+        # Deal the per-operator columns back out in the drawn operator order
+        streams = {op: iter(problems) for op, problems in built.items()}
+        return list(map(next, map(streams.__getitem__, ops)))
+
+    def generate(self, count, unique=False):
+        problems = self.batch(count)
+        if unique and len(set(problems)) < count:
+            problems = self.fill_unique(problems, count)
+        return problems
+
+    def rounds(self, count, size=10):
+        # A deck of rounds with no repeated problem inside a round; the whole deck is one
+        # batch and only the rare round with a repeat draws replacements
+        if size > self.capacity():
+            raise ValueError(f"Only {self.capacity()} different problems exist for this range and operators")
+        problems = self.batch(count * size)
+        deck = []
+        for start in range(0, count * size, size):
+            round_problems = problems[start:start + size]
+            if len(set(round_problems)) < size:
+                round_problems = self.fill_unique(round_problems, size)
+            deck.append(round_problems)
+        return deck
+
+    def fill_unique(self, problems, count):
+        if count > self.capacity():
+            raise ValueError(f"Only {self.capacity()} different problems exist for this range and operators")
+        unique = list(dict.fromkeys(problems))
+        seen = set(unique)
+        while len(unique) < count:
+            for problem in self.batch(count - len(unique)):
+                if problem not in seen:
+                    seen.add(problem)
+                    unique.append(problem)
+        return unique
@@ -0,0 +1,580 @@
+import argparse
+import contextlib
+import importlib.util
+import os
+import queue
+import random
+import statistics
+import tempfile
+import time
+import tkinter as tk
+import wave
+from pathlib import Path
+
+from animation import BubbleField
+from problems import DIFFICULTY_RANGES, ProblemGenerator
+from adaptive import expected_success
+from leaderboard import Leaderboard
+from quiz_engine import ADAPTIVE_LEVEL, QuizEngine
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+
+
+def load_quiz_module():
+    # "Math Quiz.py" is not an importable module name, so load it from its path
+    spec = importlib.util.spec_from_file_location("math_quiz", SCRIPT_DIR / "Math Quiz.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@contextlib.contextmanager
+def quiet():
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        yield
+
+
+def create_app(quiz):
+    root = tk.Tk()
+    with quiet():
+        app = quiz.QuizApp(root)
+    # Benchmark rounds must not land on the real leaderboard
+    app.leaderboard.close()
+    app.leaderboard = Leaderboard(Path(tempfile.mkdtemp()) / "leaderboard.db")
+    root.attributes('-fullscreen', False)
+    root.geometry("800x600")
+    root.update()
+    return root, app
+
+
+def count_widgets(widget) -> int:
+    return 1 + sum(count_widgets(child) for child in widget.winfo_children())
+
+
+def pending_callbacks(root) -> int:
+    return len(root.tk.splitlist(root.tk.call('after', 'info')))
+
+
+def percentile(values, fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def play_round(app, root, level: int, timings):
+    # Answers every question correctly; each timing covers dismissing the popup and
+    # bringing up the next question (or the results screen), including Tk layout
+    app.engine.start(level)
+    app.display_problem()
+    root.update_idletasks()
+    while app.current_frame is app.quiz_frame:
+        app.answer_entry.insert(0, str(app.engine.current_problem.answer))
+        app.check_answer()
+        start = time.perf_counter()
+        app.dismiss_answer_popup()
+        root.update_idletasks()
+        timings.append((time.perf_counter() - start) * 1000)
+    app.display_menu()
+    root.update()
+
+
+def run_transition_benchmark(rounds: int, report_every: int):
+    quiz = load_quiz_module()
+    root, app = create_app(quiz)
+    timings = []
+    print(f"{'round':>7} {'widgets':>8} {'after callbacks':>16}")
+    for round_number in range(1, rounds + 1):
+        play_round(app, root, 1 + round_number % 3, timings)
+        if round_number == 1 or round_number % report_every == 0:
+            print(f"{round_number:>7} {count_widgets(root):>8} {pending_callbacks(root):>16}")
+    root.destroy()
+    print(f"{len(timings)} question transitions: median {statistics.median(timings):.3f} ms, "
+          f"p95 {percentile(timings, 0.95):.3f} ms, max {max(timings):.3f} ms")
+
+
+def run_soak_test(minutes: float, switch_every: float, sample_every: float):
+    # Cycles menu -> quiz -> results for a long time with the event loop running; pending
+    # after() callbacks and CPU use should stay flat however many screen changes happen
+    quiz = load_quiz_module()
+    root, app = create_app(quiz)
+    screens = [app.display_menu, lambda: app.start_quiz(1), app.display_results]
+    switches = 0
+    start = last_switch = last_sample = time.perf_counter()
+    last_cpu, last_frames = time.process_time(), app.animations.frames
+    end = start + minutes * 60
+    print(f"{'elapsed s':>9} {'switches':>9} {'after callbacks':>16} {'fps':>6} {'cpu %':>6} {'widgets':>8}")
+    while time.perf_counter() < end:
+        root.update()
+        time.sleep(0.002)
+        now = time.perf_counter()
+        if now - last_switch >= switch_every:
+            switches += 1
+            screens[switches % len(screens)]()
+            last_switch = now
+        if now - last_sample >= sample_every:
+            cpu, frames = time.process_time(), app.animations.frames
+            print(f"{now - start:>9.0f} {switches:>9} {pending_callbacks(root):>16} "
+                  f"{(frames - last_frames) / (now - last_sample):>6.1f} "
+                  f"{(cpu - last_cpu) / (now - last_sample) * 100:>6.1f} {count_widgets(root):>8}")
+            last_sample, last_cpu, last_frames = now, cpu, frames
+    root.destroy()
+
+
+def legacy_bubble_step(canvas, bubbles):
+    # The old per-screen loop: oval and symbol moved separately, bounds fixed at 400
+    for bubble_data in bubbles:
+        canvas.move(bubble_data['bubble'], bubble_data['dx'], bubble_data['dy'])
+        canvas.move(bubble_data['text'], bubble_data['dx'], bubble_data['dy'])
+        bubble_data['x'] += bubble_data['dx']
+        bubble_data['y'] += bubble_data['dy']
+        if bubble_data['x'] <= 0 or bubble_data['x'] >= 400 - bubble_data['size']: bubble_data['dx'] *= -1
+        if bubble_data['y'] <= 0 or bubble_data['y'] >= 400 - bubble_data['size']: bubble_data['dy'] *= -1
+
+
+def legacy_bubbles(parent, count, rng):
+    canvas = tk.Canvas(parent, bg="#FFFFFF", highlightthickness=0)
+    canvas.place(x=0, y=0, relwidth=1, relheight=1)
+    bubbles = []
+    for _ in range(count):
+        x, y, size = rng.randint(20, 380), rng.randint(20, 380), rng.randint(30, 60)
+        speed = rng.uniform(0.3, 1.5)
+        bubble = canvas.create_oval(x, y, x + size, y + size, fill="#FFFFFF", outline="#FFD700", width=2)
+        text = canvas.create_text(x + size / 2, y + size / 2, text=rng.choice(BubbleField.SYMBOLS),
+                                  font=("Segoe UI", size // 3), fill="#2C2C2C")
+        bubbles.append({'bubble': bubble, 'text': text, 'x': x, 'y': y, 'dx': rng.choice([-1, 1]) * speed,
+                        'dy': rng.choice([-1, 1]) * speed, 'size': size})
+    return canvas, bubbles
+
+
+def time_frames(root, step, frames: int):
+    # Each frame includes the redraw Tk would do at idle time
+    timings = []
+    for _ in range(frames):
+        start = time.perf_counter()
+        step()
+        root.update_idletasks()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings), percentile(timings, 0.95)
+
+
+def run_bubble_benchmark(counts, frames: int):
+    root = tk.Tk()
+    root.geometry("800x600")
+    print(f"{'bubbles':>8} {'field median ms':>16} {'p95':>8} {'legacy median ms':>17} {'p95':>8}")
+    for count in counts:
+        frame = tk.Frame(root)
+        frame.place(x=0, y=0, relwidth=1, relheight=1)
+        field = BubbleField(frame, count, "#FFFFFF", "#FFD700", "#2C2C2C", random.Random(count))
+        root.update()
+        field_median, field_p95 = time_frames(root, field.step, frames)
+        frame.destroy()
+
+        frame = tk.Frame(root)
+        frame.place(x=0, y=0, relwidth=1, relheight=1)
+        canvas, bubbles = legacy_bubbles(frame, count, random.Random(count))
+        root.update()
+        legacy_median, legacy_p95 = time_frames(root, lambda: legacy_bubble_step(canvas, bubbles), frames)
+        frame.destroy()
+        print(f"{count:>8} {field_median:>16.3f} {field_p95:>8.3f} {legacy_median:>17.3f} {legacy_p95:>8.3f}")
+    root.destroy()
+
+
+class FakeMaster:
+    # Just enough of a Tk widget for BackgroundRenderer's poll logic: after() calls are
+    # recorded and run by hand
+    def __init__(self):
+        self.callbacks = []
+
+    def after(self, delay, callback, *args):
+        self.callbacks.append((callback, args))
+        return len(self.callbacks)
+
+    def run_pending(self):
+        callbacks, self.callbacks = self.callbacks, []
+        for callback, args in callbacks:
+            callback(*args)
+
+
+def check_background_results():
+    # Renders finishing out of order must still show the newest request, with a single
+    # poll chain; runs without a display (render failures stand in for images, so no
+    # PhotoImage is needed)
+    from background import BackgroundRenderer
+
+    def renderer():
+        background = BackgroundRenderer.__new__(BackgroundRenderer)
+        background.master = FakeMaster()
+        background.size = (800, 600)
+        background.pending_size = None
+        background.results = queue.Queue()
+        background.poll_scheduled = False
+        background.render_worker = lambda width, height: None
+        return background
+
+    failures = []
+    background = renderer()
+    background.request(1024, 768)
+    background.request(1280, 720)
+    background.request(800, 600)
+    if len(background.master.callbacks) != 1:
+        failures.append(f"{len(background.master.callbacks)} poll chains for three requests, expected 1")
+
+    # The current render lands before a superseded one, in the same poll window
+    background.results.put(((800, 600), RuntimeError("current")))
+    background.results.put(((1280, 720), RuntimeError("superseded")))
+    with quiet():
+        background.master.run_pending()
+    if background.pending_size is not None:
+        failures.append(f"current render thrown away; still waiting for {background.pending_size}")
+    if background.master.callbacks:
+        failures.append("still polling after the current render was taken")
+
+    background = renderer()
+    background.request(1024, 768)
+    background.request(1280, 720)
+    background.results.put(((1024, 768), RuntimeError("superseded")))
+    background.master.run_pending()
+    if background.pending_size != (1280, 720) or len(background.master.callbacks) != 1:
+        failures.append("a superseded render alone should keep one poll going for the current one")
+    background.results.put(((1280, 720), RuntimeError("current")))
+    with quiet():
+        background.master.run_pending()
+    if background.pending_size is not None or background.master.callbacks:
+        failures.append("the current render arriving last was not taken")
+
+    print(f"background result ordering: {len(failures)} failures")
+    for failure in failures:
+        print(f"  {failure}")
+    return not failures
+
+
+def legacy_generate(minimum, maximum, count):
+    # The old per-question path: two randint calls and a choice for every problem
+    problems = []
+    for _ in range(count):
+        num1 = random.randint(minimum, maximum)
+        num2 = random.randint(minimum, maximum)
+        op = random.choice(['+', '-'])
+        if op == '-' and num1 < num2:
+            num1, num2 = num2, num1
+        answer = num1 + num2 if op == '+' else num1 - num2
+        problems.append({'num1': num1, 'num2': num2, 'op': op, 'answer': answer})
+    return problems
+
+
+def run_problem_benchmark(count, difficulty, operators, seed):
+    # Needs no display: the generator has nothing to do with Tk
+    minimum, maximum = DIFFICULTY_RANGES[difficulty]
+    generator = ProblemGenerator(minimum, maximum, operators, seed)
+    cases = [
+        ("batch deck", lambda: generator.generate(count)),
+        ("rounds of 10, no repeats", lambda: generator.rounds(count // 10)),
+        ("legacy per question (+ - only)", lambda: legacy_generate(minimum, maximum, count)),
+    ]
+    print(f"{count} problems, operand range {minimum}-{maximum}, operators {' '.join(operators)}")
+    for label, func in cases:
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        print(f"  {label:<32} {elapsed * 1000:>10.1f} ms   {count / elapsed / 1e6:.2f}M problems/s")
+
+    first = ProblemGenerator(minimum, maximum, operators, seed).rounds(3)
+    again = ProblemGenerator(minimum, maximum, operators, seed).rounds(3)
+    print(f"  same seed gives the same rounds: {first == again}")
+    print(f"  repeats inside a round: {sum(len(problems) - len(set(problems)) for problems in generator.rounds(10_000))}")
+    print(f"  division answers all whole: {all(p.num1 == p.num2 * p.answer for p in generator.generate(10_000) if p.op == '÷')}")
+
+
+def expected_grade(score):
+    # Written out separately from get_grade so the simulator checks it rather than repeats it
+    for minimum, grade in ((91, "A+"), (80, "A"), (70, "B"), (60, "C")):
+        if score >= minimum:
+            return grade
+    return "D"
+
+
+def simulate_round(engine, rng, level, accuracy):
+    # A player who gets each attempt right with the given probability and sometimes
+    # types something that is not a number; returns a list of broken properties
+    engine.start(level)
+    problems = []
+    expected_score = 0
+    while True:
+        problem = engine.next_problem()
+        if problem is None:
+            break
+        problems.append(problem)
+        for attempt in range(3):
+            if rng.random() < accuracy:
+                typed = str(problem.answer)
+            else:
+                typed = "?" if rng.random() < 0.1 else str(problem.answer + rng.choice((-1, 1)))
+            result = engine.submit_answer(typed)
+            if result.correct:
+                expected_score += 10 if attempt == 0 else 5
+            if result.done:
+                break
+        else:
+            return ["question still open after three attempts"]
+
+    failures = []
+    results = engine.results()
+    if len(problems) != engine.questions:
+        failures.append(f"{len(problems)} questions asked instead of {engine.questions}")
+    if len(set(problems)) != len(problems):
+        failures.append("a problem repeated within the round")
+    if results.score != expected_score:
+        failures.append(f"score {results.score}, expected {expected_score}")
+    if not 0 <= results.score <= results.max_score or results.score % 5:
+        failures.append(f"impossible score {results.score}")
+    if results.grade.split()[0] != expected_grade(results.score):
+        failures.append(f"grade {results.grade} for score {results.score}")
+    return failures
+
+
+def check_misuse(operators, seed):
+    # Calls out of order must fail loudly and leave the round untouched
+    failures = []
+    engine = QuizEngine(operators, seed=seed)
+    try:
+        engine.next_problem()
+        failures.append("next_problem() before start() did not raise")
+    except RuntimeError:
+        pass
+    except Exception as e:
+        failures.append(f"next_problem() before start() raised {type(e).__name__}, not RuntimeError")
+
+    for level in range(1, ADAPTIVE_LEVEL + 1):
+        engine.start(level)
+        problem = engine.next_problem()
+        engine.submit_answer(str(problem.answer))
+        skill = engine.adaptive.skill
+        try:
+            engine.submit_answer(str(problem.answer))
+            failures.append(f"level {level}: a second answer to a finished question was accepted")
+        except RuntimeError:
+            pass
+        if engine.score != 10 or len(engine.answer_log) != 1 or engine.adaptive.skill != skill:
+            failures.append(f"level {level}: a second answer changed the round (score {engine.score}, "
+                            f"{len(engine.answer_log)} answers logged)")
+    return failures
+
+
+def run_simulation(rounds, operators, seed):
+    engine = QuizEngine(operators, seed=seed)
+    rng = random.Random(seed)
+    failures = [f"misuse: {failure}" for failure in check_misuse(operators, seed)]
+    grades = {}
+    start = time.perf_counter()
+    for round_number in range(rounds):
+        broken = simulate_round(engine, rng, 1 + round_number % ADAPTIVE_LEVEL, rng.choice((0.3, 0.6, 0.9, 1.0)))
+        failures.extend(f"round {round_number}: {failure}" for failure in broken)
+        grade = engine.results().grade.split()[0]
+        grades[grade] = grades.get(grade, 0) + 1
+    elapsed = time.perf_counter() - start
+    print(f"{rounds} rounds in {elapsed:.2f} s ({rounds / elapsed:,.0f} rounds/s, "
+          f"{rounds * engine.questions / elapsed:,.0f} questions/s)")
+    print("grades: " + ", ".join(f"{grade} {grades[grade]}" for grade in sorted(grades)))
+    print(f"property failures: {len(failures)}")
+    for failure in failures[:10]:
+        print(f"  {failure}")
+    return not failures
+
+
+def run_adaptive_simulation(skills, rounds, target, seed):
+    # Simulated players of known skill answer each tier with the Elo-predicted chance
+    # of its starting rating, more slowly when it is hard; the estimate should settle
+    # near their skill and their success rate near the target
+    print(f"{'true skill':>10} {'estimate':>9} {'first-try success':>18} {'mean tier rating':>17}   (last half of {rounds} rounds)")
+    for true_skill in skills:
+        engine = QuizEngine(seed=seed)
+        engine.adaptive.target_success = target
+        rng = random.Random(seed)
+        first_tries, tier_ratings = [], []
+        for round_number in range(rounds):
+            engine.start(ADAPTIVE_LEVEL)
+            while engine.next_problem() is not None:
+                tier = engine.adaptive.tiers[engine.current_tier]
+                chance = expected_success(true_skill, tier.rating)
+                seconds = tier.target_seconds * rng.uniform(0.5, 1.5) * (2 - chance)
+                for attempt in range(2):
+                    correct = rng.random() < chance
+                    if round_number >= rounds // 2 and attempt == 0:
+                        first_tries.append(correct)
+                        tier_ratings.append(tier.rating)
+                    typed = engine.current_problem.answer if correct else engine.current_problem.answer + 1
+                    if engine.submit_answer(str(typed), seconds).done:
+                        break
+        print(f"{true_skill:>10} {engine.adaptive.skill:>9.0f} {sum(first_tries) / len(first_tries):>18.1%} "
+              f"{statistics.mean(tier_ratings):>17.0f}")
+
+    engine = QuizEngine(seed=seed)
+    adaptive = engine.adaptive
+    updates = 100_000
+    start = time.perf_counter()
+    for index in range(updates):
+        tier, _ = adaptive.next_problem()
+        adaptive.record(tier, index % 2, index % 3 != 0, 5.0)
+    elapsed = time.perf_counter() - start
+    print(f"pick + update: {elapsed / updates * 1e6:.2f} us per answer over {updates} answers")
+
+
+def run_leaderboard_benchmark(rows, queries, seed):
+    # Every record() lands on the UI thread, so its cost is what the results screen
+    # waits for; top() should not slow down as the table grows
+    rng = random.Random(seed)
+    with tempfile.TemporaryDirectory() as directory:
+        board = Leaderboard(Path(directory) / "leaderboard.db")
+        record_times = []
+        start = time.perf_counter()
+        for index in range(rows):
+            began = time.perf_counter()
+            board.record(f"player{rng.randrange(5000)}", 1 + index % ADAPTIVE_LEVEL, rng.randrange(0, 101, 5),
+                         rng.uniform(20, 600), "2026-01-01T00:00:00")
+            record_times.append(time.perf_counter() - began)
+        queued = time.perf_counter() - start
+        board.flush()
+        written = time.perf_counter() - start
+        print(f"{rows:,} results queued in {queued:.2f} s (record() median {statistics.median(record_times) * 1e6:.1f} us, "
+              f"p99 {percentile(record_times, 0.99) * 1e6:.1f} us), all committed after {written:.2f} s")
+
+        for limit in (10, 100):
+            query_times = []
+            for index in range(queries):
+                began = time.perf_counter()
+                board.top(1 + index % ADAPTIVE_LEVEL, limit)
+                query_times.append(time.perf_counter() - began)
+            print(f"top {limit:<3} median {statistics.median(query_times) * 1e3:.3f} ms, "
+                  f"p99 {percentile(query_times, 0.99) * 1e3:.3f} ms over {queries} queries")
+
+        # The same query made to ignore the index, for comparison
+        began = time.perf_counter()
+        board.reader.execute("SELECT player, score, duration FROM results NOT INDEXED WHERE difficulty = 1 "
+                             "ORDER BY score DESC, duration LIMIT 10").fetchall()
+        print(f"top 10 without the index: {(time.perf_counter() - began) * 1e3:.1f} ms")
+        board.close()
+
+
+def write_tone(path, seconds, rate=44100):
+    # A plain 16-bit stereo square wave; enough to load, decode and play
+    period = rate // 440
+    frame = b"".join((8000 if i < period // 2 else -8000).to_bytes(2, "little", signed=True) * 2 for i in range(period))
+    with wave.open(str(path), "wb") as file:
+        file.setnchannels(2)
+        file.setsampwidth(2)
+        file.setframerate(rate)
+        file.writeframes(frame * int(seconds * rate / period))
+
+
+def run_audio_benchmark(music_seconds, effects, driver):
+    # Time spent on the calling (UI) thread: the old synchronous init + load + play
+    # against queuing the same work for the audio service
+    if driver:
+        os.environ["SDL_AUDIODRIVER"] = driver
+    import pygame
+    from audio import AudioService
+
+    with tempfile.TemporaryDirectory() as directory:
+        write_tone(Path(directory) / "music.wav", music_seconds)
+        write_tone(Path(directory) / "effect.wav", 0.3)
+
+        start = time.perf_counter()
+        pygame.mixer.init()
+        initialised = time.perf_counter()
+        pygame.mixer.music.load(str(Path(directory) / "music.wav"))
+        pygame.mixer.music.play(-1)
+        played = time.perf_counter()
+        pygame.mixer.quit()
+        print(f"synchronous: mixer init {(initialised - start) * 1e3:.1f} ms + load and play {(played - initialised) * 1e3:.1f} ms "
+              f"on the UI thread")
+
+        start = time.perf_counter()
+        audio = AudioService(directory, music=["music.wav"], effects={"effect": "effect.wav"}).start()
+        audio.play_music("music.wav")
+        queued = time.perf_counter()
+        audio.ready.wait()
+        ready = time.perf_counter()
+        print(f"service: start + play_music {(queued - start) * 1e3:.3f} ms on the UI thread, "
+              f"mixer ready with sounds preloaded {(ready - start) * 1e3:.1f} ms later")
+
+        call_times = []
+        accepted = 0
+        for _ in range(effects):
+            began = time.perf_counter()
+            accepted += audio.play_effect("effect")
+            call_times.append(time.perf_counter() - began)
+        print(f"{effects} play_effect calls in a burst: median {statistics.median(call_times) * 1e6:.1f} us, "
+              f"max {max(call_times) * 1e6:.1f} us, {effects - accepted} dropped by the bounded queue")
+        audio.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks for the Math Quiz (needs a display)")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    transitions_parser = subparsers.add_parser("transitions", help="question transition latency and Tk object counts over many rounds")
+    transitions_parser.add_argument("--rounds", type=int, default=300)
+    transitions_parser.add_argument("--report-every", type=int, default=50)
+
+    soak_parser = subparsers.add_parser("soak", help="long run with screen changes; after() callbacks and CPU should stay flat")
+    soak_parser.add_argument("--minutes", type=float, default=10.0)
+    soak_parser.add_argument("--switch-every", type=float, default=0.5, help="seconds between screen changes")
+    soak_parser.add_argument("--sample-every", type=float, default=30.0, help="seconds between report lines")
+
+    bubbles_parser = subparsers.add_parser("bubbles", help="bubble animation frame time against bubble count")
+    bubbles_parser.add_argument("--counts", type=int, nargs="+", default=[6, 50, 200, 1000])
+    bubbles_parser.add_argument("--frames", type=int, default=300)
+
+    problems_parser = subparsers.add_parser("problems", help="problem generation throughput (no display needed)")
+    problems_parser.add_argument("--count", type=int, default=2_000_000)
+    problems_parser.add_argument("--difficulty", type=int, choices=sorted(DIFFICULTY_RANGES), default=2)
+    problems_parser.add_argument("--operators", nargs="+", default=['+', '-', '×', '÷'])
+    problems_parser.add_argument("--seed", type=int, default=1)
+
+    simulate_parser = subparsers.add_parser("simulate", help="play many rounds against the headless engine and check scoring/grading")
+    simulate_parser.add_argument("--rounds", type=int, default=20_000)
+    simulate_parser.add_argument("--operators", nargs="+", default=['+', '-', '×', '÷'])
+    simulate_parser.add_argument("--seed", type=int, default=1)
+
+    adaptive_parser = subparsers.add_parser("adaptive", help="adaptive difficulty against simulated players of known skill")
+    adaptive_parser.add_argument("--skills", type=int, nargs="+", default=[700, 1000, 1300, 1600, 1900])
+    adaptive_parser.add_argument("--rounds", type=int, default=100)
+    adaptive_parser.add_argument("--target", type=float, default=0.75, help="target success rate")
+    adaptive_parser.add_argument("--seed", type=int, default=1)
+
+    leaderboard_parser = subparsers.add_parser("leaderboard", help="leaderboard record and top-N query cost at a million results")
+    leaderboard_parser.add_argument("--rows", type=int, default=1_000_000)
+    leaderboard_parser.add_argument("--queries", type=int, default=1000)
+    leaderboard_parser.add_argument("--seed", type=int, default=1)
+
+    audio_parser = subparsers.add_parser("audio", help="UI-thread cost of starting audio and playing sounds (needs pygame)")
+    audio_parser.add_argument("--music-seconds", type=float, default=60.0)
+    audio_parser.add_argument("--effects", type=int, default=1000)
+    audio_parser.add_argument("--driver", help="SDL audio driver, e.g. dummy when there is no sound device")
+
+    subparsers.add_parser("background", help="background render results arriving out of order (no display needed)")
+
+    args = parser.parse_args()
+    if args.command == "transitions":
+        run_transition_benchmark(args.rounds, args.report_every)
+    elif args.command == "soak":
+        run_soak_test(args.minutes, args.switch_every, args.sample_every)
+    elif args.command == "bubbles":
+        run_bubble_benchmark(args.counts, args.frames)
+    elif args.command == "problems":
+        run_problem_benchmark(args.count, args.difficulty, args.operators, args.seed)
+    elif args.command == "simulate":
+        if not run_simulation(args.rounds, args.operators, args.seed):
+            raise SystemExit(1)
+    elif args.command == "adaptive":
+        run_adaptive_simulation(args.skills, args.rounds, args.target, args.seed)
+    elif args.command == "leaderboard":
+        run_leaderboard_benchmark(args.rows, args.queries, args.seed)
+    elif args.command == "background":
+        if not check_background_results():
+            raise SystemExit(1)
+    elif args.command == "audio":
+        run_audio_benchmark(args.music_seconds, args.effects, args.driver)
+
+
+if __name__ == "__main__":
+    main()
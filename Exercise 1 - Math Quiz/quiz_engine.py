@@ -0,0 +1,153 @@
+import time
+from typing import NamedTuple
+
+from adaptive import AdaptiveDifficulty
+from problems import ProblemGenerator
+
+QUESTIONS_PER_ROUND = 10
+FIRST_TRY_POINTS = 10
+SECOND_TRY_POINTS = 5
+MAX_ATTEMPTS = 2
+# Menu level whose problems follow the player's running skill estimate
+ADAPTIVE_LEVEL = 4
+
+
+class AnswerResult(NamedTuple):
+    correct: bool
+    points: int
+    # True once the question is over (answered, or out of attempts); False means try again
+    done: bool
+    answer: int
+    # Since the problem was shown
+    seconds: float
+
+
+class QuestionRecord(NamedTuple):
+    problem: object
+    # Wrong answers given before the question ended
+    attempts: int
+    correct: bool
+    # From the problem being shown to the last answer
+    seconds: float
+
+
+class RoundResults(NamedTuple):
+    score: int
+    max_score: int
+    grade: str
+    # From the first problem being shown to the last answer
+    seconds: float
+
+
+def get_grade(final_score):
+    if final_score > 90: return "A+ (Math Master!)"
+    elif final_score >= 80: return "A (Excellent!)"
+    elif final_score >= 70: return "B (Great Job!)"
+    elif final_score >= 60: return "C (Good Work)"
+    else: return "D (Keep Practicing)"
+
+
+class QuizEngine:
+    # All of the quiz rules with no Tk: start a round, step through its problems,
+    # submit answers, read the results. QuizApp only draws what this holds
+    def __init__(self, operators=('+', '-'), questions=QUESTIONS_PER_ROUND, seed=None,
+                 adaptive_operators=('+', '-', '×', '÷'), clock=time.perf_counter):
+        self.operators = tuple(operators)
+        self.questions = questions
+        self.seed = seed
+        self.clock = clock
+        self.rounds_started = 0
+        # The skill estimate carries over from one adaptive round to the next
+        self.adaptive = AdaptiveDifficulty(adaptive_operators, seed=seed)
+        self.reset()
+
+    def reset(self):
+        self.difficulty = 0
+        self.score = 0
+        self.question_count = 0
+        self.current_problem = None
+        # True once the current question is answered or out of attempts
+        self.question_done = False
+        self.round_problems = []
+        self.attempts = 0
+        self.answer_log = []
+        self.current_tier = None
+        self.shown_at = None
+        self.started_at = None
+        self.ended_at = None
+
+    @property
+    def max_score(self):
+        return self.questions * FIRST_TRY_POINTS
+
+    @property
+    def finished(self):
+        return self.question_count > self.questions
+
+    @property
+    def is_adaptive(self):
+        return self.difficulty == ADAPTIVE_LEVEL
+
+    def start(self, level):
+        self.reset()
+        self.difficulty = level
+        # A seeded engine gives each round its own, still reproducible, seed
+        seed = None if self.seed is None else self.seed + self.rounds_started
+        self.rounds_started += 1
+        if not self.is_adaptive:
+            generator = ProblemGenerator.for_difficulty(level, self.operators, seed)
+            self.round_problems = generator.generate(self.questions, unique=True)
+
+    def next_problem(self):
+        # Moves to the next question; returns None once the round is over
+        if not self.difficulty:
+            raise RuntimeError("No round has been started")
+        self.question_count += 1
+        self.attempts = 0
+        self.question_done = False
+        if self.finished:
+            self.current_problem = None
+            return None
+        if self.is_adaptive:
+            # Picked one at a time, as each depends on the answers so far
+            self.current_tier, problem = self.adaptive.next_problem(set(self.round_problems))
+            self.round_problems.append(problem)
+        self.current_problem = self.round_problems[self.question_count - 1]
+        self.shown_at = self.clock()
+        if self.started_at is None:
+            self.started_at = self.shown_at
+        return self.current_problem
+
+    def is_correct(self, user_answer):
+        try:
+            return int(user_answer) == self.current_problem.answer
+        except ValueError:
+            return False
+
+    def submit_answer(self, user_answer, seconds=None):
+        # seconds overrides the measured time since the problem was shown (for simulations)
+        if self.current_problem is None or self.question_done:
+            raise RuntimeError("No question is being asked")
+        if seconds is None:
+            seconds = self.clock() - self.shown_at
+        if self.is_correct(user_answer):
+            points = FIRST_TRY_POINTS if self.attempts == 0 else SECOND_TRY_POINTS
+            self.score += points
+            self.finish_question(True, seconds)
+            return AnswerResult(True, points, True, self.current_problem.answer, seconds)
+        self.attempts += 1
+        done = self.attempts >= MAX_ATTEMPTS
+        if done:
+            self.finish_question(False, seconds)
+        return AnswerResult(False, 0, done, self.current_problem.answer, seconds)
+
+    def finish_question(self, correct, seconds):
+        self.question_done = True
+        self.answer_log.append(QuestionRecord(self.current_problem, self.attempts, correct, seconds))
+        self.ended_at = self.shown_at + seconds
+        if self.is_adaptive:
+            self.adaptive.record(self.current_tier, self.attempts, correct, seconds)
+
+    def results(self):
+        seconds = 0.0 if self.ended_at is None else self.ended_at - self.started_at
+        return RoundResults(self.score, self.max_score, get_grade(self.score), seconds)
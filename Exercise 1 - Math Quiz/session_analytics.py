@@ -0,0 +1,195 @@
+import argparse
+import json
+import os
+import random
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from quiz_engine import ADAPTIVE_LEVEL, QuizEngine
+from session_log import SessionLog
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+
+
+class SessionSummary:
+    # Totals plus value -> count histograms (answer and popup times to 0.1 s, render lag
+    # to 1 ms), so summaries of any number of files merge by simple addition. counts
+    # holds only events by name
+    def __init__(self):
+        self.counts = Counter()
+        self.op_questions = Counter()
+        self.op_correct = Counter()
+        self.op_first_try = Counter()
+        self.answer_seconds = Counter()
+        self.popup_seconds = Counter()
+        self.render_lag_ms = Counter()
+        self.missed = Counter()
+        self.grades = Counter()
+        # Unreadable lines per log file
+        self.bad_lines = Counter()
+
+    def add_event(self, event):
+        kind = event.get("event")
+        self.counts[kind] += 1
+        if kind == "answer_submitted":
+            if event["done"]:
+                self.op_questions[event["op"]] += 1
+                self.answer_seconds[round(event["seconds"], 1)] += 1
+                if event["correct"]:
+                    self.op_correct[event["op"]] += 1
+                    if event["attempt"] == 1:
+                        self.op_first_try[event["op"]] += 1
+                else:
+                    self.missed[event["problem"]] += 1
+        elif kind == "problem_rendered":
+            self.render_lag_ms[round(event["lag_ms"])] += 1
+        elif kind == "popup_dismissed":
+            self.popup_seconds[round(event["seconds"], 1)] += 1
+        elif kind == "round_end":
+            self.grades[event["grade"].split()[0]] += 1
+
+    def merge(self, other):
+        for name, counter in vars(other).items():
+            getattr(self, name).update(counter)
+        return self
+
+
+def read_events(path, summary):
+    with open(path, 'r', encoding='utf-8') as file:
+        lines = file.read().splitlines()
+    try:
+        # One parse for the whole file is much cheaper than one json.loads per line
+        return json.loads("[" + ",".join(lines) + "]")
+    except ValueError:
+        pass
+    events = []
+    for line in lines:
+        try:
+            events.append(json.loads(line))
+        except ValueError:
+            # A crash can leave a torn last line; skip it rather than the whole file
+            summary.bad_lines[Path(path).name] += 1
+    return events
+
+
+def summarize_file(path):
+    summary = SessionSummary()
+    for event in read_events(path, summary):
+        summary.add_event(event)
+    return summary
+
+
+def summarize_files(paths, workers):
+    total = SessionSummary()
+    if workers <= 1 or len(paths) < 64:
+        for path in paths:
+            total.merge(summarize_file(path))
+        return total
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for summary in pool.map(summarize_file, paths, chunksize=max(1, len(paths) // (workers * 8))):
+            total.merge(summary)
+    return total
+
+
+def percentile(histogram, fraction):
+    total = sum(histogram.values())
+    if not total:
+        return 0.0
+    rank = fraction * (total - 1)
+    seen = 0
+    for value in sorted(histogram):
+        seen += histogram[value]
+        if seen > rank:
+            return value
+    return max(histogram)
+
+
+def print_summary(summary, files, elapsed):
+    counts = summary.counts
+    answered = sum(summary.op_questions.values())
+    print(f"{files} session logs, {sum(counts.values()):,} events in {elapsed:.2f} s")
+    print(f"rounds started {counts['round_start']:,}, finished {counts['round_end']:,}, quit {counts['round_quit']:,}")
+    if answered:
+        print(f"questions answered {answered:,}: {sum(summary.op_correct.values()) / answered:.1%} correct, "
+              f"{sum(summary.op_first_try.values()) / answered:.1%} on the first try")
+    for op in sorted(summary.op_questions):
+        print(f"  {op}  {summary.op_questions[op]:>10,} questions  {summary.op_correct[op] / summary.op_questions[op]:.1%} correct")
+    for label, histogram, unit in (("answer time", summary.answer_seconds, "s"),
+                                   ("popup open", summary.popup_seconds, "s"),
+                                   ("render lag", summary.render_lag_ms, "ms")):
+        if histogram:
+            print(f"{label:<12} median {percentile(histogram, 0.5):g} {unit}, p95 {percentile(histogram, 0.95):g} {unit}, "
+                  f"max {max(histogram):g} {unit}")
+    if summary.grades:
+        print("grades: " + ", ".join(f"{grade} {summary.grades[grade]:,}" for grade in sorted(summary.grades)))
+    if summary.missed:
+        print("most missed: " + ", ".join(f"{problem} ({count})" for problem, count in summary.missed.most_common(5)))
+    if summary.bad_lines:
+        print(f"skipped {sum(summary.bad_lines.values())} unreadable lines in {len(summary.bad_lines)} files")
+
+
+def generate_logs(log_dir, sessions, rounds, seed):
+    # Synthetic sessions from simulated players, recorded the way QuizApp records them
+    rng = random.Random(seed)
+    for index in range(sessions):
+        now = [0.0]
+        log = SessionLog(log_dir, clock=lambda: now[0], session_id=f"sim_{seed}_{index:06d}")
+        engine = QuizEngine(seed=seed * 1_000_003 + index)
+        accuracy = rng.uniform(0.3, 0.98)
+        for _ in range(rounds):
+            level = rng.randint(1, ADAPTIVE_LEVEL)
+            engine.start(level)
+            log.record("round_start", level=level)
+            while (problem := engine.next_problem()) is not None:
+                log.record("problem_shown", question=engine.question_count, problem=problem.text, op=problem.op)
+                log.record("problem_rendered", question=engine.question_count, lag_ms=round(rng.expovariate(1 / 4), 2))
+                while True:
+                    seconds = rng.lognormvariate(1.2 + 0.3 * min(level, 3), 0.5)
+                    now[0] += seconds
+                    typed = str(problem.answer if rng.random() < accuracy else problem.answer + 1)
+                    result = engine.submit_answer(typed, seconds)
+                    log.record("answer_submitted", question=engine.question_count, problem=problem.text, op=problem.op,
+                               answer=typed, correct=result.correct, done=result.done,
+                               attempt=engine.attempts + (1 if result.correct else 0), seconds=round(seconds, 3))
+                    if result.done:
+                        break
+                dwell = rng.uniform(0.3, 2.0)
+                log.record("popup_shown", question=engine.question_count, title="")
+                now[0] += dwell
+                log.record("popup_dismissed", question=engine.question_count, seconds=round(dwell, 3))
+            results = engine.results()
+            log.record("round_end", level=level, score=results.score, grade=results.grade)
+            log.flush()
+        log.flush()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Aggregate Math Quiz session logs")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    summarize_parser = subparsers.add_parser("summarize", help="aggregate every session log in a directory")
+    summarize_parser.add_argument("log_dir", nargs="?", default=str(SCRIPT_DIR / "session_logs"))
+    summarize_parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+
+    generate_parser = subparsers.add_parser("generate", help="write synthetic session logs from simulated players")
+    generate_parser.add_argument("log_dir")
+    generate_parser.add_argument("--sessions", type=int, default=2000)
+    generate_parser.add_argument("--rounds", type=int, default=3)
+    generate_parser.add_argument("--seed", type=int, default=1)
+
+    args = parser.parse_args()
+    if args.command == "summarize":
+        paths = sorted(Path(args.log_dir).glob("session_*.jsonl"))
+        start = time.perf_counter()
+        summary = summarize_files(paths, args.workers)
+        print_summary(summary, len(paths), time.perf_counter() - start)
+    elif args.command == "generate":
+        start = time.perf_counter()
+        generate_logs(Path(args.log_dir), args.sessions, args.rounds, args.seed)
+        print(f"wrote {args.sessions} session logs to {args.log_dir} in {time.perf_counter() - start:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
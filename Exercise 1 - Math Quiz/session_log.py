@@ -0,0 +1,44 @@
+import datetime
+import json
+import os
+import time
+from pathlib import Path
+
+
+class SessionLog:
+    # Quiz events for one run of the app, buffered in memory and appended to a JSON-lines
+    # file a batch at a time (when the buffer fills, at the end of a round and on exit),
+    # so recording an event never touches the disk. Each event carries "t", seconds
+    # since the session started, and "event", its name
+    def __init__(self, log_dir, batch_size=100, clock=time.perf_counter, session_id=None):
+        self.log_dir = Path(log_dir)
+        self.batch_size = batch_size
+        self.clock = clock
+        self.started = clock()
+        now = datetime.datetime.now()
+        self.session_id = session_id or f"{now.strftime('%Y%m%d_%H%M%S')}_{os.getpid()}"
+        self.path = self.log_dir / f"session_{self.session_id}.jsonl"
+        self.buffer = []
+        self.record("session_start", started=now.isoformat(timespec='seconds'))
+
+    def elapsed(self):
+        return self.clock() - self.started
+
+    def record(self, event, **fields):
+        fields["event"] = event
+        fields["t"] = round(self.elapsed(), 4)
+        self.buffer.append(fields)
+        if len(self.buffer) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        if not self.buffer:
+            return
+        lines = "".join(json.dumps(event, ensure_ascii=False) + "\n" for event in self.buffer)
+        self.buffer = []
+        try:
+            self.log_dir.mkdir(exist_ok=True)
+            with open(self.path, 'a', encoding='utf-8') as file:
+                file.write(lines)
+        except OSError as e:
+            print(f"Could not write session log: {e}")
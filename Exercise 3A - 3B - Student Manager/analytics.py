@@ -0,0 +1,147 @@
+import math
+from bisect import bisect_right
+from collections import Counter
+from operator import add, mul
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Sequence, Tuple
+
+if TYPE_CHECKING:
+    from student_data import Student
+
+# (grade, minimum percentage) from the highest band down; the last band should start at 0
+DEFAULT_GRADE_BOUNDARIES: Tuple[Tuple[str, float], ...] = (('A', 70.0), ('B', 60.0), ('C', 50.0), ('D', 40.0), ('F', 0.0))
+
+# Per-assessment columns plus the derived ones histograms can be drawn over
+ASSESSMENTS = ('task1', 'task2', 'task3', 'exam')
+FIELD_MAXIMUMS = {'task1': 20, 'task2': 20, 'task3': 20, 'exam': 100, 'coursework': 60, 'total': 160, 'percentage': 100}
+TOTAL_MARKS = 160
+
+
+class ColumnStats:
+    def __init__(self, count: int, mean: float, variance: float, minimum: int, maximum: int):
+        self.count = count
+        self.mean = mean
+        self.variance = variance
+        self.minimum = minimum
+        self.maximum = maximum
+
+    @property
+    def std_dev(self) -> float:
+        return math.sqrt(self.variance)
+
+
+def check_boundaries(boundaries: Sequence[Tuple[str, float]]):
+    if not boundaries:
+        raise ValueError("At least one grade boundary is required")
+    previous = None
+    for grade, minimum in boundaries:
+        if previous is not None and minimum >= previous:
+            raise ValueError("Grade boundaries must be listed from the highest band down")
+        previous = minimum
+
+
+class RosterAnalytics:
+    # Every mark is a small integer, so the roster is read once into columns and each
+    # column is reduced to a value -> count table; means, variances, quantiles,
+    # histograms and grade bands are then answered from those small tables
+    def __init__(self, students: Iterable['Student']):
+        rows = [(*student.coursework_marks, student.exam_mark) for student in students]
+        self.count = len(rows)
+        self._values: Dict[str, Counter] = {name: Counter() for name in ASSESSMENTS + ('coursework', 'total')}
+        self.columns: Dict[str, ColumnStats] = {}
+        self._correlation: Optional[float] = None
+
+        if rows:
+            task1, task2, task3, exam = zip(*rows)
+            coursework = list(map(add, map(add, task1, task2), task3))
+            columns = {'task1': task1, 'task2': task2, 'task3': task3, 'exam': exam, 'coursework': coursework}
+            for name, column in columns.items():
+                values = self._values[name] = Counter(column)
+                self.columns[name] = self._column_stats(values)
+            self._values['total'] = Counter(map(add, coursework, exam))
+
+            if self.count > 1:
+                n = self.count
+                cw_sum, exam_sum = sum(coursework), sum(exam)
+                covariance = sum(map(mul, coursework, exam)) * n - cw_sum * exam_sum
+                spread = ((self._sum_of_squares(self._values['coursework']) * n - cw_sum ** 2) *
+                          (self._sum_of_squares(self._values['exam']) * n - exam_sum ** 2))
+                if spread > 0:
+                    self._correlation = covariance / math.sqrt(spread)
+
+        # Sorted distinct totals with running counts, for quantile lookups by rank
+        self._total_values = sorted(self._values['total'])
+        self._cumulative: List[int] = []
+        running = 0
+        for value in self._total_values:
+            running += self._values['total'][value]
+            self._cumulative.append(running)
+
+    @staticmethod
+    def _sum_of_squares(values: Counter) -> int:
+        return sum(value * value * count for value, count in values.items())
+
+    def _column_stats(self, values: Counter) -> ColumnStats:
+        total = sum(value * count for value, count in values.items())
+        # Integer sums keep this exact; floating point only enters at the division
+        variance = (self._sum_of_squares(values) * self.count - total ** 2) / (self.count ** 2)
+        return ColumnStats(self.count, total / self.count, variance, min(values), max(values))
+
+    def _counts(self, field: str) -> Dict[int, int]:
+        if field == 'percentage':
+            return self._values['total']
+        if field not in self._values:
+            raise ValueError(f"Unknown field '{field}'. Available: {', '.join(FIELD_MAXIMUMS)}")
+        return self._values[field]
+
+    def _total_at_rank(self, rank: int) -> int:
+        return self._total_values[bisect_right(self._cumulative, rank)]
+
+    def quantile(self, q: float) -> float:
+        # Percentage at quantile q (0..1), interpolating linearly between neighbouring ranks
+        if not self.count:
+            raise ValueError("No students available")
+        if not 0 <= q <= 1:
+            raise ValueError("Quantile must be between 0 and 1")
+        position = (self.count - 1) * q
+        lower = math.floor(position)
+        low_total = self._total_at_rank(lower)
+        high_total = self._total_at_rank(min(lower + 1, self.count - 1))
+        total = low_total + (high_total - low_total) * (position - lower)
+        return total / TOTAL_MARKS * 100
+
+    def quantiles(self, qs: Sequence[float] = (0.25, 0.5, 0.75)) -> Dict[float, float]:
+        return {q: self.quantile(q) for q in qs}
+
+    def median(self) -> float:
+        return self.quantile(0.5)
+
+    def correlation(self) -> Optional[float]:
+        # Pearson correlation between coursework total and exam mark; None if undefined
+        return self._correlation
+
+    def grade_bands(self, boundaries: Sequence[Tuple[str, float]] = DEFAULT_GRADE_BOUNDARIES) -> Dict[str, int]:
+        check_boundaries(boundaries)
+        bands = {grade: 0 for grade, _ in boundaries}
+        for total, count in self._values['total'].items():
+            percentage = total / TOTAL_MARKS * 100
+            for grade, minimum in boundaries:
+                if percentage >= minimum:
+                    bands[grade] += count
+                    break
+        return bands
+
+    def histogram(self, bin_width: float = 10.0, field: str = 'percentage') -> List[Tuple[float, float, int]]:
+        # (low, high, count) bins from 0 to the field's maximum; the last bin includes its top edge
+        if bin_width <= 0:
+            raise ValueError("Bin width must be positive")
+        counts = self._counts(field)
+        maximum = FIELD_MAXIMUMS[field]
+        bin_count = max(1, math.ceil(maximum / bin_width))
+        bins = [0] * bin_count
+        for value, count in counts.items():
+            if field == 'percentage':
+                # Rounding keeps e.g. 29/100 from landing just below its bin edge
+                value = round(value / TOTAL_MARKS * 100, 9)
+            index = min(int(value // bin_width), bin_count - 1)
+            bins[max(index, 0)] += count
+        return [(i * bin_width, min((i + 1) * bin_width, maximum), bins[i]) for i in range(bin_count)]
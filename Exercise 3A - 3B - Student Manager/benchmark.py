@@ -0,0 +1,852 @@
+import argparse
+import contextlib
+import datetime
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from sketches import RosterSketch
+from student_data import Student, StudentManager
+
+FIRST_NAMES = ["John", "Sam", "Jo", "Lee", "Les", "Matt", "Ron", "Amy", "Sara", "Omar",
+               "Priya", "Chen", "Maria", "Ivan", "Fatima", "Noah", "Aisha", "Liam", "Yuki", "Zara"]
+LAST_NAMES = ["Curry", "Sturtivant", "Hyde", "Scott", "Ferdinand", "Thompson", "Herrema", "Khan",
+              "Smith", "Garcia", "Patel", "Wong", "Novak", "Ahmed", "Brown", "Silva", "Kim", "Okafor"]
+
+
+class BenchmarkManager(StudentManager):
+    # The real roster caps IDs at 9999; widen the range so large synthetic rosters stay unique
+    MAX_STUDENT_ID = 99_999_999
+
+
+def write_roster(directory: Path, rows: int, seed: int = 42, filename: str = "studentMarks.txt") -> Path:
+    rng = random.Random(seed)
+    if rows <= 9000:
+        ids = rng.sample(range(1000, 10000), rows)
+    else:
+        ids = range(1000, 1000 + rows)
+    path = directory / filename
+    with open(path, 'w') as file:
+        file.write(f"{rows}\n")
+        for student_id in ids:
+            name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+            marks = [rng.randint(0, 20) for _ in range(3)]
+            file.write(f"{student_id},{name},{marks[0]},{marks[1]},{marks[2]},{rng.randint(0, 100)}\n")
+    return path
+
+
+@contextlib.contextmanager
+def quiet():
+    # StudentManager prints a line per load/save; keep benchmark output readable
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull), contextlib.redirect_stderr(devnull):
+        yield
+
+
+def time_call(func: Callable[[], Any], repeats: int, setup: Optional[Callable[[], Any]] = None) -> Dict[str, float]:
+    timings = []
+    for _ in range(repeats):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+    return {
+        "min_ms": round(min(timings), 4),
+        "median_ms": round(statistics.median(timings), 4),
+        "repeats": repeats,
+    }
+
+
+def benchmark_size(rows: int, repeats: int) -> Dict[str, Dict[str, float]]:
+    results: Dict[str, Dict[str, float]] = {}
+    with tempfile.TemporaryDirectory() as tmp, quiet():
+        write_roster(Path(tmp), rows)
+        manager = BenchmarkManager(data_dir=tmp)
+        new_id = BenchmarkManager.MAX_STUDENT_ID
+        sample_id = next(iter(manager.iter_students())).student_id
+        sample = manager.get_student(sample_id)
+
+        # Large rosters make every save slow, so scale the repeats down
+        io_repeats = max(1, repeats if rows <= 100_000 else repeats // 3)
+
+        results["load_data"] = time_call(manager.load_data, io_repeats)
+        results["save_data"] = time_call(manager.save_data, io_repeats)
+
+        def add_new():
+            manager.add_student(Student(new_id, "Bench Mark", [10, 10, 10], 50))
+
+        def ensure_new():
+            if new_id not in manager._records:
+                add_new()
+
+        results["add_student"] = time_call(add_new, io_repeats, setup=lambda: manager.remove_student(new_id))
+        results["update_student"] = time_call(
+            lambda: manager.update_student(sample_id, Student(sample_id, sample.name, [20, 20, 20], 100)),
+            io_repeats)
+        results["remove_student"] = time_call(lambda: manager.remove_student(new_id), io_repeats, setup=ensure_new)
+
+        results["get_student"] = time_call(lambda: manager.get_student(sample_id), repeats)
+        results["search_students_name"] = time_call(lambda: manager.search_students("curry"), repeats)
+        results["search_students_id"] = time_call(lambda: manager.search_students(str(sample_id)), repeats)
+        results["search_students_miss"] = time_call(lambda: manager.search_students("zzzz"), repeats)
+        manager.fuzzy_search("")  # builds the name index
+        results["fuzzy_search_warm"] = time_call(lambda: manager.fuzzy_search("jon cury"), repeats)
+
+        cold = manager._invalidate_indexes
+        results["get_highest_scoring_student"] = time_call(manager.get_highest_scoring_student, repeats)
+        results["get_lowest_scoring_student"] = time_call(manager.get_lowest_scoring_student, repeats)
+        results["get_average_percentage"] = time_call(manager.get_average_percentage, repeats)
+        results["get_grade_distribution_cold"] = time_call(manager.get_grade_distribution, repeats, setup=cold)
+        results["get_grade_distribution_warm"] = time_call(manager.get_grade_distribution, repeats)
+        results["query_top10_cold"] = time_call(
+            lambda: manager.query().sort_by('-percentage').limit(10).all(), repeats, setup=cold)
+        results["query_top10_warm"] = time_call(
+            lambda: manager.query().sort_by('-percentage').limit(10).all(), repeats)
+        results["query_filtered_multisort"] = time_call(
+            lambda: manager.query().grade('A', 'B').exam_at_least(60).sort_by('grade', '-exam').all(), repeats)
+        results["analytics_cold"] = time_call(manager.analytics, repeats, setup=cold)
+        results["analytics_warm_report"] = time_call(
+            lambda: (manager.analytics().quantiles(), manager.analytics().histogram(5)), repeats)
+        sketch = RosterSketch(manager.iter_students())
+        results["sketch_statistics"] = time_call(
+            lambda: (sketch.marks.mean_percentage(), sketch.marks.quantile(0.5), sketch.marks.grade_counts(),
+                     sketch.distinct_names()), repeats)
+        results["snapshot_cold"] = time_call(manager.snapshot, repeats, setup=cold)
+        results["get_all_students"] = time_call(manager.get_all_students, repeats)
+    return results
+
+
+def git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              cwd=Path(__file__).resolve().parent, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_data_benchmarks(sizes: List[int], repeats: int, output: Optional[str]):
+    report = {
+        "meta": {
+            "timestamp": datetime.datetime.now().isoformat(timespec='seconds'),
+            "git_revision": git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "repeats": repeats,
+        },
+        "results": {},
+    }
+    for rows in sizes:
+        print(f"Benchmarking {rows} students...")
+        results = benchmark_size(rows, repeats)
+        report["results"][str(rows)] = results
+        for name, timing in results.items():
+            print(f"  {name:<32} min {timing['min_ms']:>10.3f} ms   median {timing['median_ms']:>10.3f} ms")
+
+    if output:
+        with open(output, 'w') as file:
+            json.dump(report, file, indent=2)
+        print(f"Results written to {output}")
+
+
+def compare_reports(baseline_path: str, current_path: str, threshold: float):
+    with open(baseline_path) as file:
+        baseline = json.load(file)
+    with open(current_path) as file:
+        current = json.load(file)
+
+    print(f"Baseline {baseline['meta'].get('git_revision')} vs current {current['meta'].get('git_revision')}")
+    regressions = 0
+    for size, results in current["results"].items():
+        base_results = baseline["results"].get(size)
+        if not base_results:
+            continue
+        print(f"\n{size} students")
+        for name, timing in results.items():
+            base = base_results.get(name)
+            if not base or not base["median_ms"]:
+                continue
+            ratio = timing["median_ms"] / base["median_ms"]
+            flag = ""
+            if ratio > 1 + threshold:
+                flag = "  <-- slower"
+                regressions += 1
+            elif ratio < 1 - threshold:
+                flag = "  faster"
+            print(f"  {name:<32} {base['median_ms']:>10.3f} -> {timing['median_ms']:>10.3f} ms  x{ratio:.2f}{flag}")
+    print(f"\n{regressions} regression(s) above {threshold:.0%}")
+
+
+def time_import(module: str, runs: int) -> Optional[Dict[str, Any]]:
+    # Each import runs in a fresh interpreter; subtract the bare interpreter start-up
+    script_dir = Path(__file__).resolve().parent
+
+    def fresh(code: str) -> Optional[float]:
+        timings = []
+        for _ in range(runs):
+            start = time.perf_counter()
+            completed = subprocess.run([sys.executable, "-c", code], cwd=script_dir,
+                                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            if completed.returncode != 0:
+                return None
+            timings.append((time.perf_counter() - start) * 1000)
+        return statistics.median(timings)
+
+    baseline = fresh("pass")
+    total = fresh(f"import {module}")
+    if baseline is None or total is None:
+        return None
+    loaded = subprocess.run(
+        [sys.executable, "-c", f"import sys, {module}; print(sorted(m for m in ('tkinter', 'PIL') if m in sys.modules))"],
+        cwd=script_dir, capture_output=True, text=True)
+    return {
+        "import_only_ms": round(total - baseline, 2),
+        "gui_modules": loaded.stdout.strip(),
+    }
+
+
+def run_import_comparison(runs: int):
+    for module in ("student_data", "manager"):
+        result = time_import(module, runs)
+        if result is None:
+            print(f"import {module:<14} failed (missing dependency?)")
+            continue
+        print(f"import {module:<14} {result['import_only_ms']:>8.2f} ms over interpreter start-up"
+              f"   GUI modules loaded: {result['gui_modules']}")
+
+
+def service_workload(manager: StudentManager, count: int, seed: int = 7) -> List[Tuple[str, str]]:
+    rng = random.Random(seed)
+    ids = [student.student_id for student in manager.iter_students()]
+    workload = []
+    for _ in range(count):
+        roll = rng.random()
+        if roll < 0.25:
+            workload.append(("summary", ""))
+        elif roll < 0.4:
+            workload.append(("distribution", ""))
+        elif roll < 0.7:
+            workload.append(("search", rng.choice(LAST_NAMES).lower()))
+        else:
+            workload.append(("student", str(rng.choice(ids))))
+    return workload
+
+
+def run_service_benchmark(rows: int, requests: int, clients: List[int]):
+    from concurrent.futures import ThreadPoolExecutor
+    from urllib.request import urlopen
+    from student_cli import ReportService, make_server
+
+    with tempfile.TemporaryDirectory() as tmp:
+        write_roster(Path(tmp), min(rows, 9000))
+        with quiet():
+            service = ReportService(tmp)
+        workload = service_workload(service.manager, requests)
+
+        start = time.perf_counter()
+        for command, argument in workload:
+            service.run(command, argument)
+        elapsed = time.perf_counter() - start
+        print(f"{service.manager.count()} students, {requests} mixed queries")
+        print(f"  in-process ReportService      {requests / elapsed:>10.0f} req/s")
+
+        server = make_server(service, port=0, log_requests=False)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        base_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+        def fetch(item: Tuple[str, str]):
+            command, argument = item
+            path = f"/{command}/{argument}" if argument else f"/{command}"
+            with urlopen(base_url + path) as response:
+                response.read()
+
+        try:
+            for client_count in clients:
+                with ThreadPoolExecutor(max_workers=client_count) as pool:
+                    start = time.perf_counter()
+                    list(pool.map(fetch, workload))
+                    elapsed = time.perf_counter() - start
+                print(f"  HTTP, {client_count:>3} concurrent clients  {requests / elapsed:>10.0f} req/s")
+        finally:
+            server.shutdown()
+            server.server_close()
+
+
+SHARED_STUDENT_ID = 9999
+
+
+def stress_writer(data_dir: str, writer: int, ops: int) -> Dict[str, Any]:
+    # Each writer adds its own students, removes every fifth one again and keeps
+    # overwriting one shared record so that real conflicts happen
+    added, removed, saves, conflicts = [], [], 0, 0
+    with quiet():
+        manager = StudentManager(data_dir=data_dir)
+        for op in range(ops):
+            student_id = 1000 + writer * ops + op
+            manager.add_student(Student(student_id, f"Writer{writer} Op{op}", [writer % 21, op % 21, 10], 50))
+            added.append(student_id)
+            saves += 1
+            conflicts += len(manager.last_conflicts)
+            if op % 5 == 4:
+                manager.remove_student(student_id)
+                removed.append(student_id)
+                saves += 1
+                conflicts += len(manager.last_conflicts)
+            if op % 3 == 0:
+                manager.update_student(SHARED_STUDENT_ID, Student(SHARED_STUDENT_ID, "Shared Student", [writer % 21, 0, 0], op % 101))
+                saves += 1
+                conflicts += len(manager.last_conflicts)
+    return {"added": added, "removed": removed, "saves": saves, "conflicts": conflicts}
+
+
+def run_stress_test(writers: int, ops: int) -> bool:
+    import multiprocessing
+
+    if writers * ops > 8999:
+        raise SystemExit("writers * ops must stay below 9000 so every student ID is valid")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        with open(Path(tmp) / "studentMarks.txt", 'w') as file:
+            file.write(f"1\n{SHARED_STUDENT_ID},Shared Student,0,0,0,0\n")
+
+        start = time.perf_counter()
+        with multiprocessing.Pool(writers) as pool:
+            results = pool.starmap(stress_writer, [(tmp, writer, ops) for writer in range(writers)])
+        elapsed = time.perf_counter() - start
+
+        with quiet():
+            final = StudentManager(data_dir=tmp)
+        with open(Path(tmp) / "studentMarks.txt") as file:
+            header_count = int(file.readline())
+
+    expected = {SHARED_STUDENT_ID}
+    for result in results:
+        expected.update(result["added"])
+        expected.difference_update(result["removed"])
+    actual = {student.student_id for student in final.iter_students()}
+    total_saves = sum(result["saves"] for result in results)
+
+    lost = expected - actual
+    resurrected = actual - expected
+    print(f"{writers} writers x {ops} operations: {total_saves} saves in {elapsed:.2f}s "
+          f"({total_saves / elapsed:.0f} saves/s)")
+    print(f"  conflicting edits detected:   {sum(result['conflicts'] for result in results)}")
+    print(f"  final generation:             {final.generation} (expected {total_saves})")
+    print(f"  header count matches rows:    {header_count == final.count()}")
+    print(f"  lost students:                {sorted(lost) or 'none'}")
+    print(f"  removed students reappearing: {sorted(resurrected) or 'none'}")
+    passed = not lost and not resurrected and header_count == final.count() and final.generation == total_saves
+    print("PASS" if passed else "FAIL")
+    return passed
+
+
+def run_durability_benchmark(sizes: List[int], repeats: int):
+    from storage import DURABILITY_LEVELS
+
+    for rows in sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            write_roster(Path(tmp), rows)
+            with quiet():
+                manager = BenchmarkManager(data_dir=tmp)
+                print_line = f"{rows} students - save_data by durability level"
+                timings = {level: time_call(lambda: manager.save_data(level), repeats) for level in DURABILITY_LEVELS}
+            print(print_line)
+            for level, timing in timings.items():
+                print(f"  {level:<6} min {timing['min_ms']:>10.3f} ms   median {timing['median_ms']:>10.3f} ms")
+
+
+def fault_writer(data_dir: str):
+    # Child process for the fault-injection test: save in a tight loop until killed
+    with quiet():
+        manager = BenchmarkManager(data_dir=data_dir, durability="fast")
+    print("ready", flush=True)
+    with quiet():
+        while True:
+            manager.save_data()
+
+
+def run_fault_injection(rows: int, trials: int, seed: int = 3) -> bool:
+    rng = random.Random(seed)
+    failures = 0
+    with tempfile.TemporaryDirectory() as tmp:
+        write_roster(Path(tmp), rows)
+        roster_path = Path(tmp) / "studentMarks.txt"
+        for trial in range(trials):
+            child = subprocess.Popen([sys.executable, str(Path(__file__).resolve()), "fault-writer", tmp],
+                                     stdout=subprocess.PIPE, text=True)
+            child.stdout.readline()
+            time.sleep(rng.uniform(0.0, 0.3))
+            child.kill()
+            child.wait()
+            child.stdout.close()
+
+            with open(roster_path) as file:
+                lines = file.read().splitlines()
+            # The writer may be killed before its first save, so the generation trailer is optional
+            trailer = lines[rows + 1:]
+            header_ok = (int(lines[0]) == rows and len(lines) >= rows + 1 and
+                         trailer in ([], [lines[-1]]) and (not trailer or trailer[0].startswith("#generation=")))
+            with quiet():
+                loaded = BenchmarkManager(data_dir=tmp).count()
+            leftovers = len(list(Path(tmp).glob(".studentMarks.txt.*.tmp")))
+            ok = header_ok and loaded == rows
+            failures += not ok
+            print(f"  trial {trial + 1:>2}: killed writer, roster {'intact' if ok else 'CORRUPT'} "
+                  f"({loaded} students), {leftovers} stale temp file(s)")
+
+        with quiet():
+            BenchmarkManager(data_dir=tmp).save_data()
+        leftovers = len(list(Path(tmp).glob(".studentMarks.txt.*.tmp")))
+        print(f"Stale temp files after the next clean save: {leftovers}")
+
+    print("PASS" if failures == 0 and leftovers == 0 else f"FAIL ({failures} corrupt roster(s))")
+    return failures == 0 and leftovers == 0
+
+
+def measure_allocation(action: Callable[[], object], repeats: int = 5) -> int:
+    action()
+    peaks = []
+    for _ in range(repeats):
+        tracemalloc.reset_peak()
+        baseline = tracemalloc.get_traced_memory()[0]
+        action()
+        peaks.append(tracemalloc.get_traced_memory()[1] - baseline)
+    return min(peaks)
+
+
+def ui_actions(manager: StudentManager) -> Dict[str, Dict[str, Callable[[], object]]]:
+    # Data-layer calls each GUI handler makes before it builds any widgets
+    def legacy_export():
+        for student in manager.get_all_students():
+            student.student_id
+
+    def snapshot_export():
+        for student in manager.iter_students():
+            student.student_id
+
+    return {
+        "header stats": {
+            "get_all_students": lambda: len(manager.get_all_students()),
+            "count": manager.count,
+        },
+        "open search dialog": {
+            "get_all_students": lambda: not manager.get_all_students(),
+            "is_empty": manager.is_empty,
+        },
+        "open remove dialog": {
+            "get_all_students": lambda: not manager.get_all_students(),
+            "is_empty": manager.is_empty,
+        },
+        "export": {
+            "get_all_students": legacy_export,
+            "iter_students": snapshot_export,
+        },
+    }
+
+
+def run_allocations(sizes: List[int]):
+    tracemalloc.start()
+    try:
+        for rows in sizes:
+            with tempfile.TemporaryDirectory() as tmp:
+                write_roster(Path(tmp), rows)
+                with quiet():
+                    manager = BenchmarkManager(data_dir=tmp)
+                print(f"\n{rows} students - bytes allocated per UI action")
+                for action, variants in ui_actions(manager).items():
+                    results = ", ".join(f"{name}: {measure_allocation(func)}"
+                                        for name, func in variants.items())
+                    print(f"  {action:<20} {results}")
+    finally:
+        tracemalloc.stop()
+
+
+def check_view(view) -> List[str]:
+    # Everything derived from one view must describe the same roster
+    problems = []
+    before = [student.to_file_format() for student in view]
+    ids = {student.student_id for student in view}
+    if len(ids) != len(view):
+        problems.append("duplicate IDs")
+    grade_index = view.grade_index()
+    if sum(len(students) for students in grade_index.values()) != len(view):
+        problems.append("grade index size")
+    if len(view.sorted_index('percentage')[0]) != len(view):
+        problems.append("sorted index size")
+    if view.analytics().count != len(view):
+        problems.append("analytics count")
+    if view.query().grade('A').count() != len(grade_index['A']):
+        problems.append("query/grade index mismatch")
+    if [student.to_file_format() for student in view] != before:
+        problems.append("view changed while being read")
+    return problems
+
+
+def run_isolation_test(rows: int, writers: int, readers: int, ops: int) -> bool:
+    # Report-style readers on worker threads while other threads keep editing
+    with tempfile.TemporaryDirectory() as tmp, quiet():
+        write_roster(Path(tmp), rows)
+        manager = BenchmarkManager(data_dir=tmp, durability="fast")
+        long_report = manager.view()
+        long_report_lines = [student.to_file_format() for student in long_report]
+        done = threading.Event()
+        errors: List[str] = []
+        checked = [0] * readers
+        versions = set()
+
+        def writer(index: int):
+            try:
+                for op in range(ops):
+                    student_id = 20_000_000 + index * ops + op
+                    manager.add_student(Student(student_id, f"Writer{index} Op{op}", [op % 21, 5, 5], op % 101))
+                    manager.update_student(student_id, Student(student_id, f"Writer{index} Op{op}", [20, 20, 20], 100))
+                    if op % 2:
+                        manager.remove_student(student_id)
+            except Exception as e:
+                errors.append(f"writer {index}: {e!r}")
+
+        def reader(index: int):
+            try:
+                while not done.is_set():
+                    view = manager.view()
+                    versions.add(view.version)
+                    errors.extend(f"reader {index}, version {view.version}: {problem}" for problem in check_view(view))
+                    manager.get_grade_distribution()
+                    manager.search_students("curry")
+                    manager.get_average_percentage()
+                    checked[index] += 1
+            except Exception as e:
+                errors.append(f"reader {index}: {e!r}")
+
+        writer_threads = [threading.Thread(target=writer, args=(i,)) for i in range(writers)]
+        reader_threads = [threading.Thread(target=reader, args=(i,)) for i in range(readers)]
+        start = time.perf_counter()
+        for thread in reader_threads + writer_threads:
+            thread.start()
+        for thread in writer_threads:
+            thread.join()
+        elapsed = time.perf_counter() - start
+        done.set()
+        for thread in reader_threads:
+            thread.join()
+
+        expected = rows + writers * (ops - ops // 2)
+        final_count = manager.count()
+        long_report_intact = [student.to_file_format() for student in long_report] == long_report_lines
+
+    edits = writers * (2 * ops + ops // 2)
+    print(f"{rows} students, {writers} writer threads x {ops} ops, {readers} reader threads")
+    print(f"  edits:                      {edits} in {elapsed:.2f}s ({edits / elapsed:.0f}/s)")
+    print(f"  consistent view checks:     {sum(checked)} over {len(versions)} roster versions")
+    print(f"  view held for whole run:    {'unchanged' if long_report_intact else 'CHANGED'}")
+    print(f"  final count:                {final_count} (expected {expected})")
+    for error in errors[:10]:
+        print(f"  error: {error}")
+    passed = not errors and long_report_intact and final_count == expected
+    print("PASS" if passed else "FAIL")
+    return passed
+
+
+def stack_ids(stack) -> List[int]:
+    # Student IDs of a history stack's edits, bottom to top
+    return [Student.from_file_format(before or after).student_id for before, after in stack.values()]
+
+
+def run_history_test() -> bool:
+    # Two sessions on one roster interleave edits and undos; a third session that loads
+    # the shared journal afterwards must see each edit where its own session left it,
+    # and be able to undo and redo all of them
+    failures: List[str] = []
+
+    def edit(manager: StudentManager, student_id: int):
+        student = manager.get_student(student_id)
+        manager.update_student(student_id, Student(student_id, student.name, [20, 20, 20], 100))
+
+    def expect(label: str, manager: StudentManager, undo: List[int], redo: List[int]):
+        got = (stack_ids(manager.history._undo), stack_ids(manager.history._redo))
+        if got != (undo, redo):
+            failures.append(f"{label}: undo {got[0]}, redo {got[1]}; expected undo {undo}, redo {redo}")
+            return
+        try:
+            for _ in redo:
+                manager.redo()
+            for _ in undo + redo:
+                manager.undo()
+        except ValueError as e:
+            failures.append(f"{label}: {e}")
+
+    def scenario(label: str, steps, undo: List[int], redo: List[int], ids: List[int]):
+        with tempfile.TemporaryDirectory() as tmp, quiet():
+            write_roster(Path(tmp), 20)
+            first = StudentManager(data_dir=tmp, durability="fast")
+            second = StudentManager(data_dir=tmp, durability="fast")
+            students = [student.student_id for student in first.iter_students()]
+            original = {student_id: first.get_student(student_id).to_file_format() for student_id in students}
+            steps(first, second, students)
+            reloaded = StudentManager(data_dir=tmp, durability="fast")
+            expect(label, reloaded, [students[i] for i in undo], [students[i] for i in redo])
+            # Undoing everything the reload holds must bring back the original records
+            changed = [students[i] for i in ids
+                       if reloaded.get_student(students[i]).to_file_format() != original[students[i]]]
+            if changed:
+                failures.append(f"{label}: {changed} not back to their original records after undoing everything")
+
+    def undo_after_other_edit(first, second, students):
+        edit(first, students[0])
+        edit(second, students[1])
+        first.undo()
+
+    def undos_interleaved(first, second, students):
+        edit(first, students[0])
+        edit(second, students[1])
+        edit(first, students[2])
+        edit(second, students[3])
+        second.undo()
+        first.undo()
+        second.redo()
+
+    def compacted_between(first, second, students):
+        edit(first, students[0])
+        edit(second, students[1])
+        # Enough undo/redo pairs to make the first session compact the journal
+        for _ in range(60):
+            first.undo()
+            first.redo()
+        edit(second, students[2])
+        first.undo()
+
+    scenario("undo after another session's edit", undo_after_other_edit, [1], [0], [0, 1])
+    scenario("interleaved undo and redo", undos_interleaved, [0, 1, 3], [2], [0, 1, 2, 3])
+    scenario("compaction in between", compacted_between, [1, 2], [0], [0, 1, 2])
+
+    print(f"shared undo journal: {len(failures)} failures")
+    for failure in failures:
+        print(f"  {failure}")
+    print("PASS" if not failures else "FAIL")
+    return not failures
+
+
+NAME_SYLLABLES = ["an", "ber", "ca", "dan", "el", "fa", "gor", "ha", "is", "jo", "ka", "li", "ma", "no", "or",
+                  "pe", "qui", "ra", "sa", "ta", "ul", "va", "wen", "xa", "yo", "za", "chen", "ri", "mo", "lu"]
+
+
+def synthetic_names(count: int, seed: int = 11) -> List[str]:
+    # Real first/last names repeat far too much for a million-row test, so mix them
+    # with syllable-built words: many distinct names that still look alike
+    rng = random.Random(seed)
+
+    def word() -> str:
+        return "".join(rng.choice(NAME_SYLLABLES) for _ in range(rng.randint(2, 3))).capitalize()
+
+    return [f"{rng.choice(FIRST_NAMES) if rng.random() < 0.2 else word()} "
+            f"{rng.choice(LAST_NAMES) if rng.random() < 0.2 else word()}" for _ in range(count)]
+
+
+def run_fuzzy_benchmark(count: int, queries: int, limit: int, seed: int = 13):
+    from name_index import FuzzyNameIndex, normalize_name
+
+    names = synthetic_names(count)
+    start = time.perf_counter()
+    index = FuzzyNameIndex(enumerate(names))
+    build_seconds = time.perf_counter() - start
+
+    rng = random.Random(seed)
+
+    def typo(text: str) -> str:
+        # One typo: drop, double or swap a character
+        position = rng.randrange(1, len(text) - 1)
+        edit = rng.choice(("drop", "double", "swap"))
+        if edit == "drop":
+            return text[:position] + text[position + 1:]
+        if edit == "double":
+            return text[:position] + text[position] + text[position:]
+        return text[:position - 1] + text[position] + text[position - 1] + text[position + 1:]
+
+    def full_name(name: str) -> Tuple[str, str]:
+        return typo(name), normalize_name(name)
+
+    def surname(name: str) -> Tuple[str, str]:
+        return name.split()[-1], normalize_name(name.split()[-1])
+
+    def one_word(name: str) -> Tuple[str, str]:
+        # A typo in a two- or three-letter word leaves little to match on
+        words = name.split()
+        word = rng.choice([word for word in words if len(word) > 3] or [max(words, key=len)])
+        return typo(word), normalize_name(word)
+
+    # A full-name query is found when that name is in the results, a single-word one
+    # when any result has the word it was made from
+    kinds = (("full name, one typo", full_name, False), ("surname only", surname, True),
+             ("one word, one typo", one_word, True))
+    rows = []
+    for label, make_query, by_word in kinds:
+        timings, found = [], 0
+        for _ in range(queries):
+            query, target = make_query(names[rng.randrange(count)])
+            begin = time.perf_counter()
+            results = index.search(query, limit)
+            timings.append((time.perf_counter() - begin) * 1000)
+            if by_word:
+                found += any(target in normalize_name(names[student_id]).split() for student_id, _ in results)
+            else:
+                found += any(normalize_name(names[student_id]) == target for student_id, _ in results)
+        timings.sort()
+        rows.append((label, timings, found))
+
+    edit_timing = time_call(lambda: (index.add(count, "Jon Cury"), index.remove(count, "Jon Cury")), 1000)
+    print(f"{count} names ({len(index)} distinct): index built in {build_seconds:.2f}s")
+    for label, timings, found in rows:
+        print(f"  {label + ':':<22} median {statistics.median(timings):.3f} ms   "
+              f"p95 {timings[int(len(timings) * 0.95) - 1]:.3f} ms   max {timings[-1]:.3f} ms   "
+              f"found {found / queries * 100:.1f}%")
+    print(f"  add + remove one name:  median {edit_timing['median_ms']:.4f} ms")
+
+
+def legacy_validate(lines: List[str], min_id: int, max_id: int) -> int:
+    # The per-row checks the loader used before the shared schema, kept as a baseline
+    valid = 0
+    for i in range(1, len(lines)):
+        data = lines[i].strip().split(',')
+        if len(data) >= 6:
+            try:
+                student_id = int(data[0])
+                marks = [int(data[2]), int(data[3]), int(data[4])]
+                exam_mark = int(data[5])
+            except ValueError:
+                continue
+            if (min_id <= student_id <= max_id and len(data[1]) > 0 and
+                    all(0 <= mark <= 20 for mark in marks) and 0 <= exam_mark <= 100):
+                valid += 1
+    return valid
+
+
+def run_validation_benchmark(sizes: List[int], bad_fraction: float, repeats: int):
+    from validation import StudentSchema
+
+    schema = StudentSchema(1000, BenchmarkManager.MAX_STUDENT_ID)
+    for rows in sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = write_roster(Path(tmp), rows)
+            with open(path) as file:
+                lines = file.readlines()
+        rng = random.Random(rows)
+        for index in rng.sample(range(1, rows + 1), int(rows * bad_fraction)):
+            lines[index] = lines[index].replace(",", ",x", 1) if index % 2 else lines[index].rstrip() + "0\n"
+        texts = [line.strip() for line in lines[1:]]
+
+        _, columns, issues = schema.validate_rows(texts, first_line=2)
+        valid = columns[0]
+        schema_timing = time_call(lambda: schema.validate_rows(texts, first_line=2), repeats)
+        legacy_timing = time_call(lambda: legacy_validate(lines, 1000, BenchmarkManager.MAX_STUDENT_ID), repeats)
+        print(f"{rows} rows, {bad_fraction * 100:g}% corrupted: {len(valid)} valid, {len(issues)} issues reported")
+        for label, timing in (("schema (column batch)", schema_timing), ("legacy row by row", legacy_timing)):
+            rate = rows / (timing["median_ms"] / 1000)
+            print(f"  {label:<22} median {timing['median_ms']:>10.3f} ms   {rate / 1e6:.2f}M rows/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless benchmarks for the Student Manager data layer")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    data_parser = subparsers.add_parser("data", help="time load/save/mutations/search/aggregates on synthetic rosters")
+    data_parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10_000, 100_000],
+                             help="roster sizes to generate (up to 1000000)")
+    data_parser.add_argument("--repeats", type=int, default=5)
+    data_parser.add_argument("--output", help="write results as JSON to this path")
+
+    compare_parser = subparsers.add_parser("compare", help="compare two JSON result files")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=0.10,
+                                help="relative change reported as a regression (default 0.10)")
+
+    imports_parser = subparsers.add_parser("imports", help="compare import time of the data layer and the GUI module")
+    imports_parser.add_argument("--runs", type=int, default=10)
+
+    service_parser = subparsers.add_parser("service", help="query throughput of the headless report service")
+    service_parser.add_argument("--rows", type=int, default=9000, help="roster size (capped at the 9000 valid IDs)")
+    service_parser.add_argument("--requests", type=int, default=2000)
+    service_parser.add_argument("--clients", type=int, nargs="+", default=[1, 4, 16])
+
+    stress_parser = subparsers.add_parser("stress", help="many writer processes saving to one roster file")
+    stress_parser.add_argument("--writers", type=int, default=8)
+    stress_parser.add_argument("--ops", type=int, default=40)
+
+    durability_parser = subparsers.add_parser("durability", help="save_data cost for each durability level")
+    durability_parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 100_000])
+    durability_parser.add_argument("--repeats", type=int, default=5)
+
+    faults_parser = subparsers.add_parser("faults", help="kill a writer mid-save and check the roster survives")
+    faults_parser.add_argument("--rows", type=int, default=200_000)
+    faults_parser.add_argument("--trials", type=int, default=10)
+
+    fault_writer_parser = subparsers.add_parser("fault-writer")
+    fault_writer_parser.add_argument("data_dir")
+
+    isolation_parser = subparsers.add_parser("isolation",
+                                             help="reader threads check snapshot consistency while writer threads edit")
+    isolation_parser.add_argument("--rows", type=int, default=5000)
+    isolation_parser.add_argument("--writers", type=int, default=2)
+    isolation_parser.add_argument("--readers", type=int, default=4)
+    isolation_parser.add_argument("--ops", type=int, default=50)
+
+    fuzzy_parser = subparsers.add_parser("fuzzy", help="fuzzy name index build time and query latency")
+    fuzzy_parser.add_argument("--names", type=int, default=1_000_000)
+    fuzzy_parser.add_argument("--queries", type=int, default=500)
+    fuzzy_parser.add_argument("--limit", type=int, default=10)
+
+    validation_parser = subparsers.add_parser("validation", help="roster validation throughput, schema vs row by row")
+    validation_parser.add_argument("--sizes", type=int, nargs="+", default=[100_000, 1_000_000])
+    validation_parser.add_argument("--bad-fraction", type=float, default=0.01)
+    validation_parser.add_argument("--repeats", type=int, default=3)
+
+    alloc_parser = subparsers.add_parser("alloc", help="allocation per UI action for roster read paths")
+    alloc_parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 9000])
+
+    subparsers.add_parser("history", help="two sessions sharing one undo journal, then a reload")
+
+    args = parser.parse_args()
+    if args.command == "data":
+        run_data_benchmarks(args.sizes, args.repeats, args.output)
+    elif args.command == "compare":
+        compare_reports(args.baseline, args.current, args.threshold)
+    elif args.command == "imports":
+        run_import_comparison(args.runs)
+    elif args.command == "service":
+        run_service_benchmark(args.rows, args.requests, args.clients)
+    elif args.command == "stress":
+        if not run_stress_test(args.writers, args.ops):
+            sys.exit(1)
+    elif args.command == "durability":
+        run_durability_benchmark(args.sizes, args.repeats)
+    elif args.command == "faults":
+        if not run_fault_injection(args.rows, args.trials):
+            sys.exit(1)
+    elif args.command == "fault-writer":
+        fault_writer(args.data_dir)
+    elif args.command == "history":
+        if not run_history_test():
+            raise SystemExit(1)
+    elif args.command == "isolation":
+        if not run_isolation_test(args.rows, args.writers, args.readers, args.ops):
+            sys.exit(1)
+    elif args.command == "fuzzy":
+        run_fuzzy_benchmark(args.names, args.queries, args.limit)
+    elif args.command == "validation":
+        run_validation_benchmark(args.sizes, args.bad_fraction, args.repeats)
+    elif args.command == "alloc":
+        run_allocations(args.sizes)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,240 @@
+import datetime
+import json
+import os
+import zlib
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from storage import atomic_write
+from student_data import RosterView, Student, StudentManager
+
+RULE = "════════════════════════════════════════════════════════════════\n"
+THIN_RULE = "────────────────────────────────────────────────\n"
+PROFILE_HEADER = "🎓 STUDENT PROFILE\n"
+REMOVED_HEADER = "🗑️ REMOVED STUDENT\n"
+END_PREFIX = "End of export:"
+
+CHECKPOINT_NAME = "student_export_checkpoint.json"
+STATE_NAME = "student_export_state.json"
+
+# A changed student is written as a profile block, a removed one as just its ID
+ExportItem = Union[Student, int]
+
+
+def fingerprint(student: Student) -> int:
+    return zlib.crc32(student.to_file_format().encode('utf-8'))
+
+
+def format_profile(student: Student) -> str:
+    return (PROFILE_HEADER + THIN_RULE +
+            f"Student ID: {student.student_id}\n"
+            f"Name: {student.name}\n"
+            f"Task Marks: {student.coursework_marks}\n"
+            f"Exam Mark: {student.exam_mark}\n"
+            f"Total Marks: {student.total_marks}/160\n"
+            f"Percentage: {student.percentage:.2f}%\n"
+            f"Grade: {student.grade}\n" +
+            THIN_RULE + "\n")
+
+
+def format_removed(student_id: int) -> str:
+    return REMOVED_HEADER + THIN_RULE + f"Student ID: {student_id}\n" + THIN_RULE + "\n"
+
+
+def format_header(kind: str, base: Optional[str]) -> str:
+    title = "🎓 Harvard University - Student Data Export"
+    if kind == "delta":
+        title += f" (changes since {base})"
+    return (title + "\n" + RULE +
+            f"Exported on: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n" +
+            RULE + "\n")
+
+
+def format_full_export(students: Iterable[Student]) -> str:
+    # A complete export in one string, for writers that do not need resuming
+    profiles = [format_profile(student) for student in students]
+    return format_header("full", None) + "".join(profiles) + f"{END_PREFIX} {len(profiles)} students, 0 removed\n"
+
+
+def parse_export(path: Path) -> Iterator[ExportItem]:
+    # Reads back profile/removed blocks from an export file, full or incremental
+    block = None
+    fields: Dict[str, str] = {}
+    with open(path, 'r', encoding='utf-8') as file:
+        for line in file:
+            if line == PROFILE_HEADER or line == REMOVED_HEADER:
+                block = line
+                fields = {}
+            elif block and ": " in line:
+                key, value = line.rstrip("\n").split(": ", 1)
+                fields[key] = value
+                if block == REMOVED_HEADER and key == "Student ID":
+                    yield int(value)
+                    block = None
+                elif block == PROFILE_HEADER and key == "Exam Mark":
+                    marks = [int(mark) for mark in fields["Task Marks"].strip("[]").split(",")]
+                    yield Student(int(fields["Student ID"]), fields["Name"], marks, int(value))
+                    block = None
+
+
+class IncrementalExporter:
+    def __init__(self, manager: StudentManager, export_dir: Optional[Path] = None, batch_size: int = 500):
+        self.manager = manager
+        self.export_dir = Path(export_dir) if export_dir else manager.script_dir
+        self.batch_size = batch_size
+        self.checkpoint_path = self.export_dir / CHECKPOINT_NAME
+        self.state_path = self.export_dir / STATE_NAME
+
+    def _load_json(self, path: Path) -> Optional[dict]:
+        try:
+            with open(path, 'r', encoding='utf-8') as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return None
+
+    def _save_json(self, path: Path, data: dict):
+        with atomic_write(path, "fast") as file:
+            json.dump(data, file)
+
+    def _new_name(self, suffix: str) -> str:
+        # Microseconds keep exports made in the same second apart; the counter covers a
+        # clock too coarse to tell them apart
+        stamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        name = f"student_export_{stamp}{suffix}.txt"
+        count = 1
+        while (self.export_dir / name).exists() or (self.export_dir / f"{name}.partial").exists():
+            count += 1
+            name = f"student_export_{stamp}_{count}{suffix}.txt"
+        return name
+
+    def _plan(self, view: RosterView, fingerprints: Dict[str, int]) -> Iterator[ExportItem]:
+        # Deterministic for a given roster generation, so an interrupted export can skip ahead
+        seen = set()
+        for student in view:
+            key = str(student.student_id)
+            seen.add(key)
+            if fingerprints.get(key) != fingerprint(student):
+                yield student
+        for key in fingerprints:
+            if key not in seen:
+                yield int(key)
+
+    def export(self, full: bool = False) -> Tuple[Optional[Path], int, int, bool]:
+        # Returns (file written or None if nothing changed, students written, removals written, resumed).
+        # The whole export reads one view, so edits made meanwhile are left for the next export
+        view = self.manager.view()
+        checkpoint = self._load_json(self.checkpoint_path)
+        if checkpoint is None:
+            full = True
+        kind = "full" if full else "delta"
+        fingerprints = {} if full else checkpoint["fingerprints"]
+
+        state = self._load_json(self.state_path)
+        resumed = (state is not None and state.get("kind") == kind and
+                   state.get("generation") == view.generation and
+                   (self.export_dir / state["partial"]).exists())
+        if not resumed:
+            if state is not None:
+                self._discard_partial(state)
+            if not full and next(self._plan(view, fingerprints), None) is None:
+                return None, 0, 0, False
+            target = self._new_name("" if full else "_changes")
+            state = {"kind": kind, "generation": view.generation, "target": target,
+                     "partial": target + ".partial", "written": 0, "students": 0, "removed": 0, "offset": 0}
+
+        partial_path = self.export_dir / state["partial"]
+        with open(partial_path, 'r+b' if resumed else 'wb') as file:
+            if resumed:
+                # Drop anything written after the last recorded batch
+                file.truncate(state["offset"])
+                file.seek(state["offset"])
+            else:
+                base = checkpoint["chain"][-1] if checkpoint and checkpoint.get("chain") else None
+                file.write(format_header(kind, base).encode('utf-8'))
+
+            pending: List[str] = []
+            for index, item in enumerate(self._plan(view, fingerprints)):
+                if index < state["written"]:
+                    continue
+                if isinstance(item, Student):
+                    pending.append(format_profile(item))
+                    state["students"] += 1
+                else:
+                    pending.append(format_removed(item))
+                    state["removed"] += 1
+                if len(pending) >= self.batch_size:
+                    self._flush_batch(file, pending, state)
+            self._flush_batch(file, pending, state)
+            file.write(f"{END_PREFIX} {state['students']} students, {state['removed']} removed\n".encode('utf-8'))
+            file.flush()
+            os.fsync(file.fileno())
+
+        target_path = self.export_dir / state["target"]
+        os.replace(partial_path, target_path)
+        self._update_checkpoint(view, checkpoint, kind, state["target"])
+        try:
+            self.state_path.unlink()
+        except OSError:
+            pass
+        return target_path, state["students"], state["removed"], resumed
+
+    def _flush_batch(self, file, pending: List[str], state: dict):
+        if not pending:
+            return
+        file.write("".join(pending).encode('utf-8'))
+        file.flush()
+        state["written"] += len(pending)
+        state["offset"] = file.tell()
+        pending.clear()
+        self._save_json(self.state_path, state)
+
+    def _discard_partial(self, state: dict):
+        try:
+            (self.export_dir / state["partial"]).unlink()
+        except (OSError, KeyError):
+            pass
+        try:
+            self.state_path.unlink()
+        except OSError:
+            pass
+
+    def _update_checkpoint(self, view: RosterView, checkpoint: Optional[dict], kind: str, target: str):
+        chain = [] if kind == "full" or checkpoint is None else checkpoint.get("chain", [])
+        if target in chain:
+            # The file was overwritten, so replaying the chain would apply it twice
+            raise ValueError(f"{target} is already part of the export chain")
+        chain = chain + [target]
+        fingerprints = {str(student.student_id): fingerprint(student) for student in view}
+        self._save_json(self.checkpoint_path, {"chain": chain, "fingerprints": fingerprints,
+                                               "generation": view.generation})
+
+    def compact(self, prune: bool = False) -> Optional[Path]:
+        # Fold the last full export and every incremental export after it into one full snapshot
+        checkpoint = self._load_json(self.checkpoint_path)
+        if not checkpoint or not checkpoint.get("chain"):
+            return None
+        chain = checkpoint["chain"]
+        if len(set(chain)) != len(chain):
+            raise ValueError("The export checkpoint lists the same file twice; run a full export")
+
+        students: Dict[int, Student] = {}
+        for name in chain:
+            for item in parse_export(self.export_dir / name):
+                if isinstance(item, Student):
+                    students[item.student_id] = item
+                else:
+                    students.pop(item, None)
+
+        target = self._new_name("_compacted")
+        with atomic_write(self.export_dir / target, "safe") as file:
+            file.write(format_full_export(students.values()))
+
+        checkpoint["chain"] = [target]
+        self._save_json(self.checkpoint_path, checkpoint)
+        if prune:
+            for name in chain:
+                try:
+                    (self.export_dir / name).unlink()
+                except OSError:
+                    pass
+        return self.export_dir / target
@@ -0,0 +1,223 @@
+import contextlib
+import itertools
+import json
+import secrets
+from collections import OrderedDict
+from pathlib import Path
+from typing import Iterable, Optional, Tuple
+
+from storage import FileLock
+
+# One edit as (record before, record after) in file format; None means "did not exist",
+# so an add is (None, after) and a remove is (before, None)
+Delta = Tuple[Optional[str], Optional[str]]
+
+# Rough per-entry overhead of the tuple and string objects, on top of the text itself
+ENTRY_OVERHEAD = 120
+
+
+def delta_size(delta: Delta) -> int:
+    before, after = delta
+    return ENTRY_OVERHEAD + len(before or "") + len(after or "")
+
+
+class EditHistory:
+    # The journal may be shared by several sessions on the same roster. Every edit is
+    # journaled as a "do" entry with an ID (session token and sequence number), and every
+    # undo, redo or discard names the ID it acts on, so replaying the journal puts each
+    # session's edits back where that session left them however the entries interleave.
+    # Every write holds the roster's lock (lock_path), and compaction rebuilds the history
+    # from the journal on disk rather than from this session's stacks, so it keeps what
+    # other sessions appended.
+    #
+    # Journals written before entries had IDs still replay: an ID-less marker acts on the
+    # top of its stack and an ID-less "do" clears the redo stack, as they used to
+    def __init__(self, journal_path: Optional[Path] = None, max_bytes: int = 1 << 20,
+                 lock_path: Optional[Path] = None):
+        self.journal_path = journal_path
+        self.lock_path = lock_path
+        self.max_bytes = max_bytes
+        # Entry ID -> delta, oldest first; the last item is the top of each stack
+        self._undo: "OrderedDict[str, Delta]" = OrderedDict()
+        self._redo: "OrderedDict[str, Delta]" = OrderedDict()
+        self._bytes = 0
+        self._journal_lines = 0
+        self._session = secrets.token_hex(4)
+        self._sequence = itertools.count(1)
+        if journal_path is not None:
+            self._replay()
+
+    def can_undo(self) -> bool:
+        return bool(self._undo)
+
+    def can_redo(self) -> bool:
+        return bool(self._redo)
+
+    def peek_undo(self) -> Optional[Delta]:
+        return next(reversed(self._undo.values())) if self._undo else None
+
+    def peek_redo(self) -> Optional[Delta]:
+        return next(reversed(self._redo.values())) if self._redo else None
+
+    def record(self, before: Optional[str], after: Optional[str]):
+        entry_id = f"{self._session}:{next(self._sequence)}"
+        dropped = list(self._redo)
+        self._do(entry_id, (before, after), dropped)
+        entry = {"op": "do", "id": entry_id, "before": before, "after": after}
+        if dropped:
+            entry["drops"] = dropped
+        self._append(entry)
+
+    def undo(self) -> Delta:
+        entry_id, delta = self._undo.popitem()
+        self._redo[entry_id] = delta
+        self._append({"op": "undo", "id": entry_id})
+        return delta
+
+    def redo(self) -> Delta:
+        entry_id, delta = self._redo.popitem()
+        self._undo[entry_id] = delta
+        self._append({"op": "redo", "id": entry_id})
+        return delta
+
+    def discard_undo(self):
+        # Used when the newest edit no longer matches the roster (e.g. changed by another session)
+        entry_id, delta = self._undo.popitem()
+        self._bytes -= delta_size(delta)
+        self._append({"op": "discard_undo", "id": entry_id})
+
+    def discard_redo(self):
+        entry_id, delta = self._redo.popitem()
+        self._bytes -= delta_size(delta)
+        self._append({"op": "discard_redo", "id": entry_id})
+
+    def clear(self):
+        entry_ids = list(self._undo) + list(self._redo)
+        self._undo.clear()
+        self._redo.clear()
+        self._bytes = 0
+        self._append({"op": "clear", "ids": entry_ids})
+
+    def _do(self, entry_id: str, delta: Delta, dropped: Iterable[str]):
+        for dropped_id in dropped:
+            dropped_delta = self._redo.pop(dropped_id, None)
+            if dropped_delta is not None:
+                self._bytes -= delta_size(dropped_delta)
+        self._undo[entry_id] = delta
+        self._bytes += delta_size(delta)
+        # Drop the oldest edits once the history outgrows its memory budget
+        while self._bytes > self.max_bytes and len(self._undo) > 1:
+            self._bytes -= delta_size(self._undo.popitem(last=False)[1])
+
+    def _take(self, stack: "OrderedDict[str, Delta]", entry: dict) -> Optional[Tuple[str, Delta]]:
+        # The entry a marker names, or the top of the stack for a marker without an ID
+        entry_id = entry.get("id")
+        if entry_id is None:
+            return stack.popitem() if stack else None
+        delta = stack.pop(entry_id, None)
+        return None if delta is None else (entry_id, delta)
+
+    def _apply(self, entry: dict):
+        op = entry.get("op")
+        if op == "do":
+            entry_id = entry.get("id")
+            if entry_id is None:
+                # Legacy entry: a new edit cleared the whole redo stack
+                entry_id = f"legacy:{next(self._sequence)}"
+                dropped = list(self._redo)
+            else:
+                dropped = entry.get("drops", ())
+            self._do(entry_id, (entry.get("before"), entry.get("after")), dropped)
+        elif op == "undo":
+            taken = self._take(self._undo, entry)
+            if taken is not None:
+                self._redo[taken[0]] = taken[1]
+        elif op == "redo":
+            taken = self._take(self._redo, entry)
+            if taken is not None:
+                self._undo[taken[0]] = taken[1]
+        elif op in ("discard_undo", "discard_redo"):
+            taken = self._take(self._undo if op == "discard_undo" else self._redo, entry)
+            if taken is not None:
+                self._bytes -= delta_size(taken[1])
+        elif op == "clear":
+            entry_ids = entry.get("ids")
+            if entry_ids is None:
+                self._undo.clear()
+                self._redo.clear()
+                self._bytes = 0
+            for entry_id in entry_ids or ():
+                delta = self._undo.pop(entry_id, None) or self._redo.pop(entry_id, None)
+                if delta is not None:
+                    self._bytes -= delta_size(delta)
+
+    def _read_journal(self) -> Iterable[dict]:
+        with open(self.journal_path, 'r', encoding='utf-8') as file:
+            for line in file:
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    continue
+
+    def _replay(self):
+        try:
+            with open(self.journal_path, 'r', encoding='utf-8') as file:
+                self._journal_lines = sum(1 for _ in file)
+            for entry in self._read_journal():
+                self._apply(entry)
+        except FileNotFoundError:
+            return
+        except OSError as e:
+            print(f"Could not read edit history: {e}")
+            return
+        self._compact_if_needed()
+
+    def _locked(self):
+        return FileLock(self.lock_path) if self.lock_path is not None else contextlib.nullcontext()
+
+    def _append(self, entry: dict):
+        if self.journal_path is None:
+            return
+        try:
+            with self._locked():
+                with open(self.journal_path, 'a', encoding='utf-8') as file:
+                    file.write(json.dumps(entry) + "\n")
+                self._journal_lines += 1
+                if self._needs_compaction():
+                    self._rewrite()
+        except OSError as e:
+            print(f"Could not write edit history: {e}")
+
+    def _needs_compaction(self) -> bool:
+        # Undo/redo markers and trimmed edits pile up; rewrite once the journal is
+        # several times larger than the history it describes
+        live_entries = len(self._undo) + 2 * len(self._redo)
+        return self._journal_lines > 4 * live_entries + 64
+
+    def _compact_if_needed(self):
+        if self.journal_path is None or not self._needs_compaction():
+            return
+        try:
+            with self._locked():
+                self._rewrite()
+        except OSError as e:
+            print(f"Could not compact edit history: {e}")
+
+    def _rewrite(self):
+        # Caller holds the lock. Rebuilt from the journal on disk, which also holds
+        # whatever other sessions appended since this one last read it. Every edit
+        # keeps its ID, so markers those sessions append later still find it
+        merged = EditHistory(max_bytes=self.max_bytes)
+        try:
+            for entry in self._read_journal():
+                merged._apply(entry)
+        except FileNotFoundError:
+            pass
+        entries = [{"op": "do", "id": entry_id, "before": before, "after": after}
+                   for entry_id, (before, after) in itertools.chain(merged._undo.items(), merged._redo.items())]
+        entries += [{"op": "undo", "id": entry_id} for entry_id in merged._redo]
+        temp_path = self.journal_path.with_name(self.journal_path.name + ".tmp")
+        with open(temp_path, 'w', encoding='utf-8') as file:
+            file.writelines(json.dumps(entry) + "\n" for entry in entries)
+        temp_path.replace(self.journal_path)
+        self._journal_lines = len(entries)
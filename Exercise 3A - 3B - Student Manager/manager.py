@@ -1,190 +1,10 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
-from typing import List, Dict, Any
 from pathlib import Path
 from PIL import Image, ImageTk, ImageDraw
-import datetime
-
-class Student:
-    def __init__(self, student_id: int, name: str, coursework_marks: List[int], exam_mark: int):
-        self.student_id = student_id
-        self.name = name
-        self.coursework_marks = coursework_marks
-        self.exam_mark = exam_mark
-    
-    @property
-    def total_coursework(self) -> int:
-        return sum(self.coursework_marks)
-    
-    @property
-    def total_marks(self) -> int:
-        return self.total_coursework + self.exam_mark
-    
-    @property
-    def percentage(self) -> float:
-        return (self.total_marks / 160) * 100
-    
-    @property
-    def grade(self) -> str:
-        percentage = self.percentage
-        if percentage >= 70:
-            return 'A'
-        elif percentage >= 60:
-            return 'B'
-        elif percentage >= 50:
-            return 'C'
-        elif percentage >= 40:
-            return 'D'
-        else:
-            return 'F'
-    
-    def to_file_format(self) -> str:
-        return f"{self.student_id},{self.name},{self.coursework_marks[0]},{self.coursework_marks[1]},{self.coursework_marks[2]},{self.exam_mark}"
-
-class StudentManager:
-    def __init__(self, filename: str = "studentMarks.txt"):
-        self.filename = filename
-        self.students: List[Student] = []
-        self.script_dir = Path(__file__).resolve().parent
-        self.load_data()
-    
-    def load_data(self):
-        text_files = ["studentMarks.txt", "studentsMarks.txt"]
-        loaded = False
-        
-        for text_filename in text_files:
-            text_file_path = self.script_dir / text_filename
-            try:
-                if text_file_path.exists():
-                    print(f"Loading student data from {text_file_path.name}")
-                    with open(text_file_path, 'r') as file:
-                        lines = file.readlines()
-                    
-                    self.students = []
-                    
-                    if not lines:
-                        continue
-
-                    try:
-                        num_students = int(lines[0].strip())
-                    except ValueError:
-                        print(f"First line of {text_filename} should be the student count")
-                        continue
-                    
-                    for i in range(1, len(lines)):
-                        if i <= num_students and i < len(lines):
-                            line = lines[i].strip()
-                            if line:
-                                data = line.split(',')
-                                if len(data) >= 6:
-                                    try:
-                                        student_id = int(data[0])
-                                        name = data[1]
-                                        coursework_marks = [int(data[2]), int(data[3]), int(data[4])]
-                                        exam_mark = int(data[5])
-                                        
-                                        if (1000 <= student_id <= 9999 and 
-                                            len(name) > 0 and 
-                                            all(0 <= mark <= 20 for mark in coursework_marks) and 
-                                            0 <= exam_mark <= 100):
-                                                
-                                            self.students.append(Student(student_id, name, coursework_marks, exam_mark))
-                                        else:
-                                            print(f"Skipping invalid student record on line {i+1}")
-                                    except ValueError as e:
-                                        print(f"Error processing student data on line {i+1}: {e}")
-                                        continue
-
-                    print(f"Successfully loaded {len(self.students)} students")
-                    self.filename = text_filename
-                    loaded = True
-                    break
-                
-            except Exception as e:
-                print(f"Error loading {text_filename}: {e}")
-                continue
-        
-        if not loaded:
-            print("No student data file found, starting with empty database")
-            self.students = []
-    
-    def save_data(self):
-        try:
-            text_file_path = self.script_dir / self.filename
-            
-            with open(text_file_path, 'w') as file:
-                file.write(f"{len(self.students)}\n")
-                
-                for student in self.students:
-                    file.write(student.to_file_format() + "\n")
-            
-            print(f"Saved {len(self.students)} students to {self.filename}")
-            return True
-        except Exception as e:
-            print(f"Error saving student data: {e}")
-            raise
-    
-    def add_student(self, student: Student):
-        if any(s.student_id == student.student_id for s in self.students):
-            raise ValueError(f"Student ID {student.student_id} already exists")
-        
-        self.students.append(student)
-        self.save_data()
-    
-    def remove_student(self, student_id: int):
-        initial_count = len(self.students)
-        self.students = [s for s in self.students if s.student_id != student_id]
-        if len(self.students) < initial_count:
-            self.save_data()
-            return True
-        return False
-    
-    def update_student(self, student_id: int, updated_student: Student):
-        for i, student in enumerate(self.students):
-            if student.student_id == student_id:
-                self.students[i] = updated_student
-                self.save_data()
-                return True
-        return False
-    
-    def get_student(self, student_id: int) -> Student:
-        for student in self.students:
-            if student.student_id == student_id:
-                return student
-        raise ValueError(f"Student ID {student_id} not found")
-    
-    def get_all_students(self) -> List[Student]:
-        return self.students.copy()
-    
-    def get_highest_scoring_student(self) -> Student:
-        if not self.students:
-            raise ValueError("No students available")
-        return max(self.students, key=lambda s: s.percentage)
-    
-    def get_lowest_scoring_student(self) -> Student:
-        if not self.students:
-            raise ValueError("No students available")
-        return min(self.students, key=lambda s: s.percentage)
-    
-    def get_average_percentage(self) -> float:
-        if not self.students:
-            return 0.0
-        return sum(student.percentage for student in self.students) / len(self.students)
-    
-    def get_grade_distribution(self) -> Dict[str, int]:
-        distribution = {'A': 0, 'B': 0, 'C': 0, 'D': 0, 'F': 0}
-        for student in self.students:
-            distribution[student.grade] += 1
-        return distribution
-    
-    def search_students(self, query: str) -> List[Student]:
-        query = query.lower()
-        results = []
-        for student in self.students:
-            if (query in student.name.lower() or 
-                query in str(student.student_id)):
-                results.append(student)
-        return results
+from exporter import IncrementalExporter
+from profiling import instrumentation
+from student_data import StudentManager
 
 class ModernLoginPage:
     def __init__(self, root, on_login_success):
@@ -484,7 +304,9 @@ class ModernStudentManagerApp:
         self.root.geometry("1400x900")
         self.root.configure(bg=self.background_color)
         
-        self.manager = StudentManager()
+        self.manager = StudentManager(sketches=True)
+        # Statistics come from the streaming sketches unless exact figures are asked for
+        self.exact_statistics = False
         
         self.images = {}
         self.load_images()
@@ -616,6 +438,8 @@ class ModernStudentManagerApp:
             ("➕ Add Student", self.add_student_dialog),
             ("✏️ Edit Student", self.update_student_dialog),
             ("🗑️ Remove Student", self.remove_student_dialog),
+            ("↩️ Undo", self.undo_last_change),
+            ("↪️ Redo", self.redo_last_change),
         ]
         
         for i, (text, command) in enumerate(nav_buttons):
@@ -659,6 +483,8 @@ class ModernStudentManagerApp:
         actions = [
             ("💾 Export Data", self.export_data),
             ("🔄 Refresh Data", self.refresh_data),
+            ("🎯 Exact/Approx Stats", self.toggle_exact_statistics),
+            ("⏱️ Performance", self.show_performance_report),
         ]
         
         for text, command in actions:
@@ -727,19 +553,21 @@ class ModernStudentManagerApp:
         
         self.text_display.config(state=tk.DISABLED)
     
+    @instrumentation.timed("view.header_stats")
     def update_stats(self):
-        students = self.manager.get_all_students()
-        if students:
+        student_count = self.manager.count()
+        if student_count:
             try:
                 avg_percentage = self.manager.get_average_percentage()
                 highest = self.manager.get_highest_scoring_student()
-                stats_text = f"👥 {len(students)} Students | 📊 Avg: {avg_percentage:.1f}% | 🏆 Best: {highest.percentage:.1f}%"
+                stats_text = f"👥 {student_count} Students | 📊 Avg: {avg_percentage:.1f}% | 🏆 Best: {highest.percentage:.1f}%"
             except ValueError:
-                stats_text = f"👥 {len(students)} Students | 📊 Analyzing..."
+                stats_text = f"👥 {student_count} Students | 📊 Analyzing..."
         else:
             stats_text = "👥 No students in database"
         self.stats_label.config(text=stats_text)
     
+    @instrumentation.timed("render.display_text")
     def display_text(self, text: str, title: str = "Dashboard"):
         self.content_title.config(text=title)
         self.text_display.config(state=tk.NORMAL)
@@ -762,7 +590,7 @@ class ModernStudentManagerApp:
         
         return '\n'.join(formatted_lines)
     
-    def format_student_info(self, student: Student) -> str:
+    def format_student_info(self, student) -> str:
         grade_emoji = {
             'A': '🟢', 'B': '🔵', 'C': '🟡', 'D': '🟠', 'F': '🔴'
         }
@@ -776,17 +604,16 @@ class ModernStudentManagerApp:
 {'─' * 50}
 """
     
+    @instrumentation.timed("view.dashboard")
     def view_all_students(self):
-        students = self.manager.get_all_students()
-        
-        if not students:
+        if self.manager.is_empty():
             self.display_text("⭐ No students found in the database. Add some students to get started! ⭐", "Dashboard")
             return
         
         output = "🎓 ALL STUDENT RECORDS\n"
         output += "════════════════════════════════════════════════════════════════════════════════\n\n"
         
-        students_sorted = sorted(students, key=lambda s: s.percentage, reverse=True)
+        students_sorted = self.manager.query().sort_by('-percentage')
         
         for i, student in enumerate(students_sorted, 1):
             rank_icon = "🥇" if i == 1 else "🥈" if i == 2 else "🥉" if i == 3 else f"{i:2d}."
@@ -794,7 +621,7 @@ class ModernStudentManagerApp:
         
         output += f"\n🎓 CLASS SUMMARY\n"
         output += "════════════════════════════════════════════════════════════════\n"
-        output += f"👥 Total Students: {len(students)}\n"
+        output += f"👥 Total Students: {self.manager.count()}\n"
         output += f"📈 Average Percentage: {self.manager.get_average_percentage():.2f}%\n"
         
         try:
@@ -809,9 +636,7 @@ class ModernStudentManagerApp:
         self.display_text(output, "Student Dashboard")
     
     def search_students_dialog(self):
-        students = self.manager.get_all_students()
-        
-        if not students:
+        if self.manager.is_empty():
             messagebox.showwarning("No Students", "No students found in the database.")
             return
         
@@ -869,8 +694,19 @@ class ModernStudentManagerApp:
                 for student in results:
                     output += self.format_student_info(student)
                 self.display_text(output, f"Search Results ({len(results)} found)")
-            else:
+                return
+            
+            suggestions = self.manager.fuzzy_search(query)
+            if not suggestions:
                 messagebox.showinfo("No Results", f"No students found matching '{query}'")
+                return
+            
+            output = f"🎓 NO EXACT MATCH FOR: '{query}' - CLOSEST NAMES\n"
+            output += "════════════════════════════════════════════════════════════════\n\n"
+            for student, score in suggestions:
+                output += f"🔎 Match: {score * 100:.0f}%\n"
+                output += self.format_student_info(student)
+            self.display_text(output, f"Did you mean... ({len(suggestions)} suggestions)")
         
         search_btn_frame = tk.Frame(content_frame, bg=self.card_bg)
         search_btn_frame.pack(fill=tk.X, pady=(20, 0))
@@ -889,9 +725,7 @@ class ModernStudentManagerApp:
         search_entry.focus()
     
     def view_individual_student(self):
-        students = self.manager.get_all_students()
-        
-        if not students:
+        if self.manager.is_empty():
             messagebox.showwarning("No Students", "No students found in the database.")
             return
         
@@ -975,6 +809,7 @@ class ModernStudentManagerApp:
         id_entry.bind('<Return>', lambda e: view_student())
         id_entry.focus()
     
+    @instrumentation.timed("view.top_performers")
     def show_highest_student(self):
         try:
             highest = self.manager.get_highest_scoring_student()
@@ -1001,13 +836,61 @@ class ModernStudentManagerApp:
         except ValueError as e:
             messagebox.showwarning("No Data", str(e))
     
-    def show_statistics(self):
-        students = self.manager.get_all_students()
+    def toggle_exact_statistics(self):
+        self.exact_statistics = not self.exact_statistics
+        self.show_statistics()
+    
+    def format_approximate_statistics(self) -> str:
+        sketch = self.manager.sketch
+        marks = sketch.marks
+        total_students = marks.count
+        
+        output = f"🎓 CLASS STATISTICS (APPROXIMATE)\n"
+        output += "════════════════════════════════════════════════════════════════\n"
+        output += "Percentiles are nearest-rank (within one student's rank of exact);\n"
+        output += f"distinct names are estimated to ±{sketch.names.relative_error * 100:.1f}% (one standard error).\n"
+        output += "Use 🎯 Exact/Approx Stats for the full computation.\n\n"
+        
+        output += f"🎓 OVERVIEW\n"
+        output += "────────────────────────────────────────────────\n"
+        output += f"👥 Total Students: {total_students}\n"
+        output += f"🔤 Distinct Names: ≈{sketch.distinct_names()}"
+        if sketch.removed_since_rebuild:
+            output += f" (may still count up to {sketch.removed_since_rebuild} removed)"
+        output += "\n"
+        output += f"📈 Average Percentage: {marks.mean_percentage():.2f}% (std dev {marks.std_dev_percentage():.2f}%)\n\n"
+        
+        highest = marks.highest_percentage()
+        lowest = marks.lowest_percentage()
+        output += f"🎓 PERFORMANCE RANGE\n"
+        output += "────────────────────────────────────────────────\n"
+        output += f"🥇 Highest: {highest:.2f}%\n"
+        output += f"📉 Lowest: {lowest:.2f}%\n"
+        output += f"📏 Range: {highest - lowest:.2f}%\n\n"
+        
+        output += f"🎓 GRADE DISTRIBUTION\n"
+        output += "────────────────────────────────────────────────\n"
+        for grade, count in marks.grade_counts().items():
+            percentage = (count / total_students) * 100
+            output += f"{grade}: {count} students ({percentage:.1f}%)\n"
         
-        if not students:
+        output += f"\n🎓 PERCENTILES\n"
+        output += "────────────────────────────────────────────────\n"
+        output += (f"25th: {marks.quantile(0.25):.2f}%   Median: {marks.quantile(0.5):.2f}%   "
+                   f"75th: {marks.quantile(0.75):.2f}%\n")
+        return output
+    
+    @instrumentation.timed("view.statistics")
+    def show_statistics(self):
+        if self.manager.is_empty():
             messagebox.showwarning("No Students", "No students found in the database.")
             return
         
+        if self.manager.sketch is not None and not self.exact_statistics:
+            self.display_text(self.format_approximate_statistics(), "Class Statistics")
+            return
+        
+        total_students = self.manager.count()
         avg_percentage = self.manager.get_average_percentage()
         
         output = f"🎓 CLASS STATISTICS\n"
@@ -1015,7 +898,8 @@ class ModernStudentManagerApp:
         
         output += f"🎓 OVERVIEW\n"
         output += "────────────────────────────────────────────────\n"
-        output += f"👥 Total Students: {len(students)}\n"
+        output += f"👥 Total Students: {total_students}\n"
+        output += f"🔤 Distinct Names: {len({student.name.lower() for student in self.manager.iter_students()})}\n"
         output += f"📈 Average Percentage: {avg_percentage:.2f}%\n\n"
         
         try:
@@ -1034,15 +918,29 @@ class ModernStudentManagerApp:
         output += f"🎓 GRADE DISTRIBUTION\n"
         output += "────────────────────────────────────────────────\n"
         for grade, count in distribution.items():
-            percentage = (count / len(students)) * 100 if students else 0
+            percentage = (count / total_students) * 100
             output += f"{grade}: {count} students ({percentage:.1f}%)\n"
         
+        analytics = self.manager.analytics()
+        quartiles = analytics.quantiles()
+        output += f"\n🎓 PERCENTILES\n"
+        output += "────────────────────────────────────────────────\n"
+        output += f"25th: {quartiles[0.25]:.2f}%   Median: {quartiles[0.5]:.2f}%   75th: {quartiles[0.75]:.2f}%\n\n"
+        
+        output += f"🎓 ASSESSMENT BREAKDOWN\n"
+        output += "────────────────────────────────────────────────\n"
+        for label, column in (("Task 1", 'task1'), ("Task 2", 'task2'), ("Task 3", 'task3'), ("Exam", 'exam')):
+            stats = analytics.columns[column]
+            output += f"{label}: mean {stats.mean:.2f}, std dev {stats.std_dev:.2f} (range {stats.minimum}-{stats.maximum})\n"
+        correlation = analytics.correlation()
+        if correlation is not None:
+            output += f"Coursework/Exam correlation: {correlation:+.2f}\n"
+        
         self.display_text(output, "Class Statistics")
     
+    @instrumentation.timed("view.distribution")
     def show_grade_distribution(self):
-        students = self.manager.get_all_students()
-        
-        if not students:
+        if self.manager.is_empty():
             messagebox.showwarning("No Students", "No students found in the database.")
             return
         
@@ -1051,7 +949,7 @@ class ModernStudentManagerApp:
         output = f"🎓 GRADE DISTRIBUTION\n"
         output += "════════════════════════════════════════════════════════════════\n\n"
         
-        total_students = len(students)
+        total_students = self.manager.count()
         
         for grade, count in distribution.items():
             percentage = (count / total_students) * 100
@@ -1065,6 +963,12 @@ class ModernStudentManagerApp:
         most_common = max(distribution.items(), key=lambda x: x[1])
         output += f"Most Common Grade: {most_common[0]} ({most_common[1]} students)\n"
         
+        output += f"\n🎓 PERCENTAGE HISTOGRAM\n"
+        output += "────────────────────────────────────────────────\n"
+        for low, high, count in self.manager.analytics().histogram(10):
+            bar = "█" * int((count / total_students) * 30)
+            output += f"{low:>3.0f}-{high:<3.0f}%: {bar} {count}\n"
+        
         self.display_text(output, "Grade Distribution")
     
     def add_student_dialog(self):
@@ -1183,27 +1087,11 @@ class ModernStudentManagerApp:
     
     def add_student_action(self, entries, dialog):
         try:
-            student_id = int(entries['id'].get().strip())
-            name = entries['name'].get().strip()
-            task1 = int(entries['task1'].get().strip())
-            task2 = int(entries['task2'].get().strip())
-            task3 = int(entries['task3'].get().strip())
-            exam = int(entries['exam'].get().strip())
-            
-            if not (1000 <= student_id <= 9999):
-                raise ValueError("Student ID must be between 1000 and 9999")
-            if not name:
-                raise ValueError("Name cannot be empty")
-            if not all(0 <= mark <= 20 for mark in [task1, task2, task3]):
-                raise ValueError("Task marks must be between 0 and 20")
-            if not (0 <= exam <= 100):
-                raise ValueError("Exam mark must be between 0 and 100")
-            
-            student = Student(student_id, name, [task1, task2, task3], exam)
+            student = self.manager.validate_student({field: entry.get() for field, entry in entries.items()})
             self.manager.add_student(student)
             
             dialog.destroy()
-            messagebox.showinfo("Success", f"✅ Student {name} added successfully!")
+            messagebox.showinfo("Success", f"✅ Student {student.name} added successfully!")
             self.view_all_students()
             
         except ValueError as e:
@@ -1212,9 +1100,7 @@ class ModernStudentManagerApp:
             messagebox.showerror("Error", str(e))
     
     def update_student_dialog(self):
-        students = self.manager.get_all_students()
-        
-        if not students:
+        if self.manager.is_empty():
             messagebox.showwarning("No Students", "No students found in the database.")
             return
         
@@ -1349,17 +1235,9 @@ class ModernStudentManagerApp:
         
         def update_student():
             try:
-                task1 = int(entries['task1'].get().strip())
-                task2 = int(entries['task2'].get().strip())
-                task3 = int(entries['task3'].get().strip())
-                exam = int(entries['exam'].get().strip())
-                
-                if not all(0 <= mark <= 20 for mark in [task1, task2, task3]):
-                    raise ValueError("Task marks must be between 0 and 20")
-                if not (0 <= exam <= 100):
-                    raise ValueError("Exam mark must be between 0 and 100")
-                
-                updated_student = Student(student.student_id, student.name, [task1, task2, task3], exam)
+                raw = {field: entry.get() for field, entry in entries.items()}
+                raw.update(id=str(student.student_id), name=student.name)
+                updated_student = self.manager.validate_student(raw)
                 self.manager.update_student(student.student_id, updated_student)
                 
                 dialog.destroy()
@@ -1385,9 +1263,7 @@ class ModernStudentManagerApp:
         update_btn.pack(fill=tk.X, pady=10)
     
     def remove_student_dialog(self):
-        students = self.manager.get_all_students()
-        
-        if not students:
+        if self.manager.is_empty():
             messagebox.showwarning("No Students", "No students found in the database.")
             return
         
@@ -1437,7 +1313,7 @@ class ModernStudentManagerApp:
                 
                 confirm = messagebox.askyesno(
                     "Confirm Removal",
-                    f"Are you sure you want to remove {student.name} (ID: {student_id})?\n\nThis action cannot be undone."
+                    f"Are you sure you want to remove {student.name} (ID: {student_id})?\n\nYou can undo this from the sidebar."
                 )
                 
                 if confirm:
@@ -1469,45 +1345,82 @@ class ModernStudentManagerApp:
         id_entry.bind('<Return>', lambda e: remove_student())
         id_entry.focus()
     
+    @instrumentation.timed("export.write")
     def export_data(self):
-        students = self.manager.get_all_students()
-        
-        if not students:
+        if self.manager.is_empty():
             messagebox.showwarning("No Data", "No student data to export.")
             return
         
         try:
-            timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-            export_filename = f"student_export_{timestamp}.txt"
-            export_path = self.manager.script_dir / export_filename
-            
-            with open(export_path, 'w', encoding='utf-8') as file:
-                file.write("🎓 Harvard University - Student Data Export\n")
-                file.write("════════════════════════════════════════════════════════════════\n")
-                file.write(f"Exported on: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                file.write("════════════════════════════════════════════════════════════════\n\n")
-                
-                for student in students:
-                    file.write(f"🎓 STUDENT PROFILE\n")
-                    file.write(f"────────────────────────────────────────────────\n")
-                    file.write(f"Student ID: {student.student_id}\n")
-                    file.write(f"Name: {student.name}\n")
-                    file.write(f"Task Marks: {student.coursework_marks}\n")
-                    file.write(f"Exam Mark: {student.exam_mark}\n")
-                    file.write(f"Total Marks: {student.total_marks}/160\n")
-                    file.write(f"Percentage: {student.percentage:.2f}%\n")
-                    file.write(f"Grade: {student.grade}\n")
-                    file.write("────────────────────────────────────────────────\n\n")
-            
-            messagebox.showinfo("Export Successful", f"Student data exported to:\n{export_path}")
-            
+            # Only students changed since the last export are written; the first export is a full one
+            export_path, written, removed, resumed = IncrementalExporter(self.manager).export()
         except Exception as e:
             messagebox.showerror("Export Failed", f"Could not export data: {str(e)}")
+            return
+        
+        if export_path is None:
+            messagebox.showinfo("Nothing to Export", "No students have changed since the last export.")
+            return
+        
+        details = f"{written} student(s) written"
+        if removed:
+            details += f", {removed} removal(s) recorded"
+        if resumed:
+            details += " (resumed an interrupted export)"
+        messagebox.showinfo("Export Successful", f"Student data exported to:\n{export_path}\n\n{details}")
+    
+    def undo_last_change(self):
+        try:
+            message = self.manager.undo()
+        except ValueError as e:
+            messagebox.showerror("Undo Failed", str(e))
+            return
+        
+        if message is None:
+            messagebox.showinfo("Nothing to Undo", "There are no changes to undo.")
+            return
+        
+        self.view_all_students()
+        messagebox.showinfo("Undone", f"↩️ {message}")
+    
+    def redo_last_change(self):
+        try:
+            message = self.manager.redo()
+        except ValueError as e:
+            messagebox.showerror("Redo Failed", str(e))
+            return
+        
+        if message is None:
+            messagebox.showinfo("Nothing to Redo", "There are no undone changes to redo.")
+            return
+        
+        self.view_all_students()
+        messagebox.showinfo("Redone", f"↪️ {message}")
     
     def refresh_data(self):
         self.manager.load_data()
         self.view_all_students()
         messagebox.showinfo("Refreshed", "Student data has been refreshed from file.")
+    
+    def show_performance_report(self):
+        if not instrumentation.enabled:
+            instrumentation.enable()
+            messagebox.showinfo("Performance Tracking",
+                                "⏱️ Performance tracking is now on.\n\n"
+                                "Use the system as normal, then open this report again to see where time is spent.")
+            return
+        
+        output = f"🎓 PERFORMANCE REPORT\n"
+        output += "════════════════════════════════════════════════════════════════\n\n"
+        output += instrumentation.summary() + "\n"
+        
+        try:
+            report_path = instrumentation.export(self.manager.script_dir / "performance_summary.txt")
+            output += f"\n💾 Summary saved to {report_path.name}\n"
+        except OSError as e:
+            output += f"\nCould not save summary: {e}\n"
+        
+        self.display_text(output, "Performance Report")
 
 def main():
     root = tk.Tk()
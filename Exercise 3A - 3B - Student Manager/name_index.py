@@ -0,0 +1,190 @@
+import heapq
+import re
+import unicodedata
+from array import array
+from collections import Counter
+from itertools import chain
+from typing import Dict, Iterable, List, Set, Tuple
+
+NON_ALPHANUMERIC = re.compile(r"[^0-9a-z]+")
+
+# Vocabulary words kept per query word, and how many of the words sharing the most
+# trigrams get a similarity score before that cut
+WORD_MATCHES = 48
+WORD_RERANK = 8 * WORD_MATCHES
+MIN_WORD_SIMILARITY = 1 / 3
+# How much each name word beyond the query's own counts against a match, so that
+# "jon" still finds "John Curry" but ranks plain "Jon" first
+EXTRA_WORD_WEIGHT = 0.25
+
+
+def normalize_name(name: str) -> str:
+    # "  José  O'Brien" -> "jose o brien": accents stripped, case folded, punctuation as spaces
+    decomposed = unicodedata.normalize('NFKD', name)
+    stripped = "".join(char for char in decomposed if not unicodedata.combining(char))
+    return NON_ALPHANUMERIC.sub(" ", stripped.casefold()).strip()
+
+
+def trigrams(word: str) -> Set[str]:
+    # Padded so the start and end of the word form trigrams of their own ("  j", " jo", ..., "ry ")
+    padded = f"  {word} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class FuzzyNameIndex:
+    # Two levels: trigram postings over the vocabulary of distinct name words, and
+    # word -> names postings. A query word is matched against the (small) vocabulary
+    # first, so a query only touches the names containing a similar word rather than
+    # every name sharing a common trigram. Students with the same name share one
+    # entry and a removed name just stops matching, so edits are O(1)
+    def __init__(self, entries: Iterable[Tuple[int, str]] = ()):
+        self._word_ids: Dict[str, int] = {}
+        self._words: List[str] = []
+        self._gram_postings: Dict[str, array] = {}
+        self._gram_counts = array('H')
+        self._word_names: List[array] = []
+        self._name_ids: Dict[str, int] = {}
+        self._name_words: List[Tuple[int, ...]] = []
+        # Student IDs per name entry: a bare int for the common single-student case
+        self._owners: List[object] = []
+        for student_id, name in entries:
+            self.add(student_id, name)
+
+    def __len__(self) -> int:
+        return len(self._name_words)
+
+    def _word(self, word: str) -> int:
+        word_id = self._word_ids.get(word)
+        if word_id is None:
+            word_id = len(self._words)
+            self._word_ids[word] = word_id
+            self._words.append(word)
+            self._word_names.append(array('I'))
+            grams = trigrams(word)
+            self._gram_counts.append(min(len(grams), 0xFFFF))
+            for gram in grams:
+                posting = self._gram_postings.get(gram)
+                if posting is None:
+                    posting = self._gram_postings[gram] = array('I')
+                posting.append(word_id)
+        return word_id
+
+    def _entry(self, normalized: str) -> int:
+        entry = self._name_ids.get(normalized)
+        if entry is None:
+            entry = len(self._name_words)
+            self._name_ids[normalized] = entry
+            word_ids = tuple(dict.fromkeys(self._word(word) for word in normalized.split()))
+            self._name_words.append(word_ids)
+            self._owners.append(None)
+            for word_id in word_ids:
+                self._word_names[word_id].append(entry)
+        return entry
+
+    def add(self, student_id: int, name: str):
+        normalized = normalize_name(name)
+        if not normalized:
+            return
+        entry = self._entry(normalized)
+        owners = self._owners[entry]
+        if owners is None:
+            self._owners[entry] = student_id
+        elif isinstance(owners, list):
+            owners.append(student_id)
+        else:
+            self._owners[entry] = [owners, student_id]
+
+    def remove(self, student_id: int, name: str):
+        entry = self._name_ids.get(normalize_name(name))
+        if entry is None:
+            return
+        owners = self._owners[entry]
+        if owners == student_id:
+            self._owners[entry] = None
+        elif isinstance(owners, list) and student_id in owners:
+            owners.remove(student_id)
+            if len(owners) == 1:
+                self._owners[entry] = owners[0]
+
+    def _similar_words(self, word: str) -> Dict[int, float]:
+        # Counting the postings (at C speed) gives each vocabulary word's shared trigrams,
+        # which is all the Dice similarity needs besides the two trigram counts. Dice
+        # rather than Jaccard so that short words ("jon"/"john") are not marked down
+        # just for having few trigrams
+        grams = trigrams(word)
+        postings = [self._gram_postings[gram] for gram in grams if gram in self._gram_postings]
+        hits = Counter(chain.from_iterable(postings))
+        scored = {}
+        for word_id, shared in hits.most_common(WORD_RERANK):
+            similarity = 2 * shared / (len(grams) + self._gram_counts[word_id])
+            if similarity >= MIN_WORD_SIMILARITY:
+                scored[word_id] = similarity
+        best = sorted(scored.items(), key=lambda item: -item[1])[:WORD_MATCHES]
+        return dict(best)
+
+    def search(self, query: str, limit: int = 10, min_score: float = 0.3) -> List[Tuple[int, float]]:
+        # Returns (student ID, score) best first. Each query word is paired with its most
+        # similar word in the name (trigram Dice similarity); the score averages those over
+        # the query words, lightly marked down for each extra word in the name, so 1.0
+        # means the same words and a surname alone still finds the full name
+        words = list(dict.fromkeys(normalize_name(query).split()))
+        if not words or limit <= 0:
+            return []
+        matches = [self._similar_words(word) for word in words]
+        usable = [match for match in matches if match]
+        if not usable:
+            return []
+
+        top: List[Tuple[float, int]] = []
+        seen: Set[int] = set()
+
+        def consider(entry: int):
+            seen.add(entry)
+            if self._owners[entry] is None:
+                return
+            name_words = self._name_words[entry]
+            total = 0.0
+            for match in matches:
+                best = 0.0
+                for word_id in name_words:
+                    similarity = match.get(word_id, 0.0)
+                    if similarity > best:
+                        best = similarity
+                total += best
+            score = total / (len(matches) + EXTRA_WORD_WEIGHT * max(0, len(name_words) - len(matches)))
+            if score < min_score:
+                return
+            if len(top) < limit:
+                heapq.heappush(top, (score, -entry))
+            elif (score, -entry) > top[0]:
+                heapq.heapreplace(top, (score, -entry))
+
+        # Names with a similar word for every query word are usually the answer; the set
+        # intersection finds them at C speed
+        if len(usable) > 1:
+            reachable = [set(chain.from_iterable(self._word_names[word_id] for word_id in match)) for match in usable]
+            for entry in set.intersection(*reachable):
+                consider(entry)
+
+        # Any other name lacks at least one query word, which caps its score; walk each
+        # query word's similar words best first and stop once that cap cannot beat the top results
+        bests = [max(match.values()) for match in usable]
+        for index, match in enumerate(usable):
+            others = bests[:index] + bests[index + 1:]
+            rest = sum(others) - min(others) if others else 0.0
+            for word_id, similarity in sorted(match.items(), key=lambda item: -item[1]):
+                if len(top) >= limit and top[0][0] >= (similarity + rest) / len(matches):
+                    break
+                for entry in self._word_names[word_id]:
+                    if entry not in seen:
+                        consider(entry)
+        scored = sorted(((score, -negative_entry) for score, negative_entry in top), key=lambda item: (-item[0], item[1]))
+
+        results = []
+        for score, entry in scored:
+            owners = self._owners[entry]
+            for student_id in (owners if isinstance(owners, list) else (owners,)):
+                results.append((student_id, score))
+                if len(results) == limit:
+                    return results
+        return results
@@ -0,0 +1,175 @@
+import atexit
+import functools
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+# STUDENT_MANAGER_PROFILE=1 records timings, =cprofile also runs cProfile.
+# STUDENT_MANAGER_PROFILE_OUT=<path> writes the summary (and <path>.pstats) on exit.
+PROFILE_ENV = "STUDENT_MANAGER_PROFILE"
+PROFILE_OUT_ENV = "STUDENT_MANAGER_PROFILE_OUT"
+
+# Span names are "<category>.<operation>"; categories let a report separate
+# storage, computation and Tk rendering time
+CATEGORY_LABELS = {
+    'storage': "Storage (file I/O)",
+    'query': "Search / queries",
+    'stats': "Statistics",
+    'mutation': "Add / update / remove",
+    'view': "View building",
+    'render': "Tk rendering",
+    'export': "Export",
+}
+
+
+class _Span:
+    __slots__ = ('owner', 'name')
+
+    def __init__(self, owner: 'Instrumentation', name: str):
+        self.owner = owner
+        self.name = name
+
+    def __enter__(self):
+        self.owner._begin()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.owner._end(self.name)
+        return False
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class Instrumentation:
+    def __init__(self):
+        self.enabled = False
+        # name -> [count, total seconds, max seconds, self seconds excluding nested spans]
+        self.stats: Dict[str, List[float]] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        # cProfile/pstats are imported on demand to keep import time low when profiling is off
+        self._profiler: Optional[Any] = None
+
+    def configure_from_env(self):
+        mode = os.environ.get(PROFILE_ENV, "").strip().lower()
+        if mode in ("", "0", "off", "false"):
+            return
+        self.enable(use_cprofile=(mode == "cprofile"))
+        out_path = os.environ.get(PROFILE_OUT_ENV)
+        if out_path:
+            atexit.register(self.export, out_path)
+
+    def enable(self, use_cprofile: bool = False):
+        self.enabled = True
+        if use_cprofile and self._profiler is None:
+            import cProfile
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+
+    def disable(self):
+        self.enabled = False
+        if self._profiler is not None:
+            self._profiler.disable()
+
+    def reset(self):
+        with self._lock:
+            self.stats.clear()
+
+    def record(self, name: str, elapsed: float, self_time: Optional[float] = None):
+        if self_time is None:
+            self_time = elapsed
+        with self._lock:
+            entry = self.stats.get(name)
+            if entry is None:
+                self.stats[name] = [1, elapsed, elapsed, self_time]
+            else:
+                entry[0] += 1
+                entry[1] += elapsed
+                entry[3] += self_time
+                if elapsed > entry[2]:
+                    entry[2] = elapsed
+
+    def _begin(self):
+        # Each open span is [start time, time spent in nested spans]
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        stack.append([time.perf_counter(), 0.0])
+
+    def _end(self, name: str):
+        stack = self._local.stack
+        start, nested = stack.pop()
+        elapsed = time.perf_counter() - start
+        if stack:
+            stack[-1][1] += elapsed
+        self.record(name, elapsed, elapsed - nested)
+
+    def span(self, name: str):
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name)
+
+    def timed(self, name: str) -> Callable:
+        def decorator(func: Callable) -> Callable:
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                self._begin()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    self._end(name)
+            return wrapper
+        return decorator
+
+    def summary(self) -> str:
+        with self._lock:
+            items = {name: list(entry) for name, entry in self.stats.items()}
+        if not items:
+            return "No timings recorded yet."
+
+        lines = [f"{'Operation':<32}{'Calls':>8}{'Total ms':>12}{'Avg ms':>10}{'Max ms':>10}"]
+        for name, (count, total, worst, _) in sorted(items.items(), key=lambda x: x[1][1], reverse=True):
+            lines.append(f"{name:<32}{count:>8}{total * 1000:>12.2f}{total / count * 1000:>10.3f}{worst * 1000:>10.3f}")
+
+        totals: Dict[str, float] = {}
+        for name, (_, _, _, self_time) in items.items():
+            category = name.split('.', 1)[0]
+            totals[category] = totals.get(category, 0.0) + self_time
+        grand_total = sum(totals.values()) or 1.0
+        lines.append("")
+        lines.append("Time by category (nested operations counted once)")
+        for category, total in sorted(totals.items(), key=lambda x: x[1], reverse=True):
+            label = CATEGORY_LABELS.get(category, category)
+            lines.append(f"  {label:<28}{total * 1000:>10.2f} ms  ({total / grand_total * 100:.1f}%)")
+        return "\n".join(lines)
+
+    def export(self, path) -> Path:
+        path = Path(path)
+        with open(path, 'w', encoding='utf-8') as file:
+            file.write(self.summary() + "\n")
+        if self._profiler is not None:
+            import pstats
+            # Building Stats stops the profiler, so resume it if profiling is still on
+            pstats.Stats(self._profiler).dump_stats(str(path) + ".pstats")
+            if self.enabled:
+                self._profiler.enable()
+        return path
+
+
+instrumentation = Instrumentation()
+instrumentation.configure_from_env()
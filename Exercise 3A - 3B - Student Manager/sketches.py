@@ -0,0 +1,137 @@
+import hashlib
+import math
+from typing import TYPE_CHECKING, Dict, Iterable, Optional
+
+from analytics import DEFAULT_GRADE_BOUNDARIES, TOTAL_MARKS
+
+if TYPE_CHECKING:
+    from student_data import Student
+
+
+class MarkHistogram:
+    # One counter per possible total mark (0-160): O(1) to add or remove a student,
+    # and every summary below scans a fixed 161 buckets however large the roster is
+    def __init__(self):
+        self.buckets = [0] * (TOTAL_MARKS + 1)
+        self.count = 0
+        self.sum = 0
+        self.sum_of_squares = 0
+
+    def _bucket(self, total: int) -> int:
+        return min(max(total, 0), TOTAL_MARKS)
+
+    def add(self, total: int):
+        self.buckets[self._bucket(total)] += 1
+        self.count += 1
+        self.sum += total
+        self.sum_of_squares += total * total
+
+    def remove(self, total: int):
+        self.buckets[self._bucket(total)] -= 1
+        self.count -= 1
+        self.sum -= total
+        self.sum_of_squares -= total * total
+
+    def mean_percentage(self) -> float:
+        return self.sum / self.count / TOTAL_MARKS * 100 if self.count else 0.0
+
+    def std_dev_percentage(self) -> float:
+        if not self.count:
+            return 0.0
+        variance = (self.sum_of_squares * self.count - self.sum ** 2) / (self.count ** 2)
+        return math.sqrt(max(variance, 0)) / TOTAL_MARKS * 100
+
+    def quantile(self, q: float) -> float:
+        # Nearest-rank percentile: the mark of the student at rank round(q * (n - 1)),
+        # so it is off from the interpolated exact value by less than one rank
+        if not self.count:
+            raise ValueError("No students available")
+        rank = round(q * (self.count - 1))
+        seen = 0
+        for total, count in enumerate(self.buckets):
+            seen += count
+            if seen > rank:
+                return total / TOTAL_MARKS * 100
+        return 100.0
+
+    def lowest_percentage(self) -> float:
+        return next(total for total, count in enumerate(self.buckets) if count) / TOTAL_MARKS * 100
+
+    def highest_percentage(self) -> float:
+        return next(total for total in range(TOTAL_MARKS, -1, -1) if self.buckets[total]) / TOTAL_MARKS * 100
+
+    def grade_counts(self) -> Dict[str, int]:
+        counts = {grade: 0 for grade, _ in DEFAULT_GRADE_BOUNDARIES}
+        for total, count in enumerate(self.buckets):
+            if count:
+                percentage = total / TOTAL_MARKS * 100
+                for grade, minimum in DEFAULT_GRADE_BOUNDARIES:
+                    if percentage >= minimum:
+                        counts[grade] += count
+                        break
+        return counts
+
+
+class HyperLogLog:
+    # Distinct-count estimate in 2**precision bytes, with relative standard error
+    # 1.04 / sqrt(2**precision) (about 1.6% at the default precision of 12)
+    def __init__(self, precision: int = 12):
+        if not 4 <= precision <= 16:
+            raise ValueError("Precision must be between 4 and 16")
+        self.precision = precision
+        self.size = 1 << precision
+        self.registers = bytearray(self.size)
+        self.alpha = 0.7213 / (1 + 1.079 / self.size)
+
+    @property
+    def relative_error(self) -> float:
+        return 1.04 / math.sqrt(self.size)
+
+    def add(self, value: str):
+        hashed = int.from_bytes(hashlib.blake2b(value.encode('utf-8'), digest_size=8).digest(), 'big')
+        index = hashed >> (64 - self.precision)
+        remainder = hashed & ((1 << (64 - self.precision)) - 1)
+        rank = (64 - self.precision) - remainder.bit_length() + 1
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    def estimate(self) -> int:
+        harmonic = sum(2.0 ** -register for register in self.registers)
+        estimate = self.alpha * self.size * self.size / harmonic
+        empty = self.registers.count(0)
+        if estimate <= 2.5 * self.size and empty:
+            # Linear counting is more accurate while many registers are still empty
+            estimate = self.size * math.log(self.size / empty)
+        return round(estimate)
+
+
+class RosterSketch:
+    # Summaries kept up to date on every add/update/remove so the statistics view
+    # does not have to scan the roster
+    def __init__(self, students: Iterable['Student'] = (), precision: int = 12):
+        self.marks = MarkHistogram()
+        self.names = HyperLogLog(precision)
+        # HyperLogLog cannot forget a value, so removed names stay counted until the next rebuild
+        self.removed_since_rebuild = 0
+        for student in students:
+            self.add(student)
+
+    def add(self, student: 'Student'):
+        self.marks.add(student.total_marks)
+        self.names.add(student.name.lower())
+
+    def remove(self, student: 'Student'):
+        self.marks.remove(student.total_marks)
+        self.removed_since_rebuild += 1
+
+    def replace(self, old: Optional['Student'], new: Optional['Student']):
+        if old is not None:
+            if new is not None and new.name.lower() == old.name.lower():
+                self.marks.remove(old.total_marks)
+            else:
+                self.remove(old)
+        if new is not None:
+            self.add(new)
+
+    def distinct_names(self) -> int:
+        return self.names.estimate()
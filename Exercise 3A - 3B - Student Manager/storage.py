@@ -0,0 +1,172 @@
+import contextlib
+import os
+import stat
+import tempfile
+import time
+from pathlib import Path
+from typing import Iterator, TextIO
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+    import msvcrt
+
+
+# fast: temp file + atomic rename only (survives a crashed process, not power loss)
+# safe: also flushes the file data to disk before the rename
+# full: also fsyncs the file metadata and the directory entry after the rename
+DURABILITY_LEVELS = ("fast", "safe", "full")
+
+
+def _read_umask() -> int:
+    # os.umask can only be read by setting it, so do it once, at import, before any
+    # threads could be creating files in the meantime
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
+
+
+UMASK = _read_umask()
+
+
+class FileLock:
+    # Advisory lock on a sidecar file, shared by every process using the same roster
+    def __init__(self, path, timeout: float = 30.0):
+        self.path = Path(path)
+        self.timeout = timeout
+        self._file = None
+
+    def acquire(self):
+        lock_file = open(self.path, 'a+')
+        deadline = time.monotonic() + self.timeout
+        while True:
+            try:
+                if fcntl is not None:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                else:
+                    lock_file.seek(0)
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_NBLCK, 1)
+                self._file = lock_file
+                return
+            except OSError:
+                if time.monotonic() >= deadline:
+                    lock_file.close()
+                    raise TimeoutError(f"Timed out waiting for lock on {self.path.name}")
+                time.sleep(0.005)
+
+    def release(self):
+        if self._file is None:
+            return
+        try:
+            if fcntl is not None:
+                fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+            else:
+                self._file.seek(0)
+                msvcrt.locking(self._file.fileno(), msvcrt.LK_UNLCK, 1)
+        finally:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.release()
+        return False
+
+
+@contextlib.contextmanager
+def read_lock(path, timeout: float = 30.0) -> Iterator[None]:
+    # The lock for a read. Where the lock file cannot be created (a read-only directory
+    # or filesystem) this session could never write there, and writers replace the
+    # roster atomically, so the read goes ahead unlocked rather than failing
+    lock = FileLock(path, timeout)
+    try:
+        lock.acquire()
+    except TimeoutError:
+        raise
+    except OSError:
+        yield
+        return
+    try:
+        yield
+    finally:
+        lock.release()
+
+
+def read_last_line(path, max_bytes: int = 256) -> str:
+    # Reads only the tail of the file, so checking the trailer does not re-read the roster
+    with open(path, 'rb') as file:
+        file.seek(0, os.SEEK_END)
+        size = file.tell()
+        file.seek(max(0, size - max_bytes))
+        tail = file.read().decode('utf-8', errors='replace')
+    lines = tail.strip().splitlines()
+    return lines[-1] if lines else ""
+
+
+def _sync_file(fd: int, durability: str):
+    if durability == "safe" and hasattr(os, "fdatasync"):
+        os.fdatasync(fd)
+    elif durability != "fast":
+        os.fsync(fd)
+
+
+def _sync_directory(directory: Path):
+    if os.name == "nt":
+        # Windows cannot open a directory for fsync; NTFS journals the rename itself
+        return
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def temp_prefix(path) -> str:
+    return f".{Path(path).name}."
+
+
+def remove_stale_temp_files(path):
+    # Left behind by a writer that died mid-save; only call while holding the roster lock
+    path = Path(path)
+    for stale in path.parent.glob(f"{temp_prefix(path)}*.tmp"):
+        try:
+            stale.unlink()
+        except OSError:
+            pass
+
+
+@contextlib.contextmanager
+def atomic_write(path, durability: str = "safe", buffer_size: int = 1 << 16) -> Iterator[TextIO]:
+    # Readers see either the old file or the complete new one, never a truncated roster
+    if durability not in DURABILITY_LEVELS:
+        raise ValueError(f"Durability must be one of {', '.join(DURABILITY_LEVELS)}")
+    path = Path(path)
+    fd, temp_name = tempfile.mkstemp(prefix=temp_prefix(path), suffix=".tmp", dir=path.parent)
+    try:
+        with open(fd, 'w', buffering=buffer_size) as file:
+            yield file
+            file.flush()
+            _sync_file(file.fileno(), durability)
+        # mkstemp creates the file 0600: keep the mode of the file being replaced, or
+        # give a new file the mode open() would have
+        try:
+            mode = stat.S_IMODE(os.stat(path).st_mode)
+        except FileNotFoundError:
+            mode = 0o666 & ~UMASK
+        try:
+            os.chmod(temp_name, mode)
+        except OSError:
+            pass
+        os.replace(temp_name, path)
+    except BaseException:
+        try:
+            os.unlink(temp_name)
+        except OSError:
+            pass
+        raise
+    if durability == "full":
+        _sync_directory(path.parent)
@@ -0,0 +1,356 @@
+import argparse
+import contextlib
+import os
+import shlex
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlparse
+
+from exporter import IncrementalExporter, format_full_export
+from student_data import Student, StudentManager
+
+RULE = "=" * 64
+THIN_RULE = "-" * 48
+
+COMMANDS = ("summary", "search", "student", "distribution", "analytics", "export")
+# Reports that only change when the roster does, so their text is cached
+CACHEABLE_COMMANDS = {"summary", "distribution", "analytics", "export"}
+
+
+def load_manager(data_dir: Optional[str], filename: str) -> StudentManager:
+    # Keep the loader's progress messages off stdout so reports can be piped
+    with contextlib.redirect_stdout(sys.stderr):
+        return StudentManager(filename, data_dir=data_dir)
+
+
+def format_student(student: Student) -> str:
+    return "\n".join([
+        f"{student.name} (ID {student.student_id})",
+        f"  Coursework: {student.coursework_marks} (Total: {student.total_coursework}/60)",
+        f"  Exam: {student.exam_mark}/100",
+        f"  Overall: {student.percentage:.2f}% ({student.total_marks}/160)",
+        f"  Grade: {student.grade}",
+    ])
+
+
+def format_summary(manager: StudentManager) -> str:
+    if manager.is_empty():
+        return "No students found in the database."
+
+    total_students = manager.count()
+    highest = manager.get_highest_scoring_student()
+    lowest = manager.get_lowest_scoring_student()
+
+    lines = ["CLASS STATISTICS", RULE,
+             f"Total Students: {total_students}",
+             f"Average Percentage: {manager.get_average_percentage():.2f}%",
+             "",
+             "PERFORMANCE RANGE", THIN_RULE,
+             f"Highest: {highest.percentage:.2f}% ({highest.name}, ID {highest.student_id})",
+             f"Lowest: {lowest.percentage:.2f}% ({lowest.name}, ID {lowest.student_id})",
+             f"Range: {highest.percentage - lowest.percentage:.2f}%",
+             ""]
+    lines.append(format_distribution(manager))
+    return "\n".join(lines)
+
+
+def format_distribution(manager: StudentManager) -> str:
+    if manager.is_empty():
+        return "No students found in the database."
+
+    total_students = manager.count()
+    lines = ["GRADE DISTRIBUTION", THIN_RULE]
+    for grade, count in manager.get_grade_distribution().items():
+        percentage = (count / total_students) * 100
+        bar = "#" * int((count / total_students) * 30)
+        lines.append(f"{grade}: {bar} {count} ({percentage:.1f}%)")
+    return "\n".join(lines)
+
+
+def format_analytics(manager: StudentManager, bin_width: str = "") -> str:
+    if manager.is_empty():
+        return "No students found in the database."
+    try:
+        width = float(bin_width) if bin_width else 10.0
+    except ValueError:
+        raise ValueError("Bin width must be a number")
+
+    analytics = manager.analytics()
+    quartiles = analytics.quantiles()
+    lines = ["ANALYTICS", RULE,
+             f"25th percentile: {quartiles[0.25]:.2f}%",
+             f"Median: {quartiles[0.5]:.2f}%",
+             f"75th percentile: {quartiles[0.75]:.2f}%",
+             "",
+             "ASSESSMENTS", THIN_RULE]
+    for column, stats in analytics.columns.items():
+        lines.append(f"{column}: mean {stats.mean:.2f}, variance {stats.variance:.2f}, "
+                     f"range {stats.minimum}-{stats.maximum}")
+    correlation = analytics.correlation()
+    if correlation is not None:
+        lines.append(f"coursework/exam correlation: {correlation:+.3f}")
+    lines.extend(["", f"PERCENTAGE HISTOGRAM ({width:g}-point bins)", THIN_RULE])
+    total_students = analytics.count
+    for low, high, count in analytics.histogram(width):
+        bar = "#" * int((count / total_students) * 30)
+        lines.append(f"{low:6.1f}-{high:5.1f}: {bar} {count}")
+    return "\n".join(lines)
+
+
+def format_search(manager: StudentManager, query: str) -> str:
+    if not query:
+        raise ValueError("Please enter a search term.")
+    results = manager.search_students(query)
+    if not results:
+        suggestions = manager.fuzzy_search(query)
+        if not suggestions:
+            return f"No students found matching '{query}'"
+        lines = [f"NO EXACT MATCH FOR: '{query}' - CLOSEST NAMES", RULE]
+        lines.extend(f"[{score * 100:.0f}% match] {format_student(student)}" for student, score in suggestions)
+        return "\n".join(lines)
+    lines = [f"SEARCH RESULTS FOR: '{query}' ({len(results)} found)", RULE]
+    lines.extend(format_student(student) for student in results)
+    return "\n".join(lines)
+
+
+def format_student_report(manager: StudentManager, student_id: str) -> str:
+    try:
+        parsed_id = int(student_id)
+    except ValueError:
+        raise ValueError("Please enter a valid numeric Student ID")
+    return "\n".join(["STUDENT PROFILE", RULE, format_student(manager.get_student(parsed_id))])
+
+
+def format_export(manager: StudentManager) -> str:
+    # Same text as the GUI's export file, so exporter.parse_export and compact() read it back
+    return format_full_export(manager.iter_students()).rstrip("\n")
+
+
+class ReportService:
+    def __init__(self, data_dir: Optional[str] = None, filename: str = "studentMarks.txt"):
+        self.data_dir = data_dir
+        self.filename = filename
+        self._reload_lock = threading.Lock()
+        self._cache: Dict[Tuple[str, str], str] = {}
+        self.manager = load_manager(data_dir, filename)
+        self._loaded_mtime = self._file_mtime()
+
+    def _file_mtime(self) -> Optional[float]:
+        try:
+            return os.stat(self.manager.data_dir / self.manager.filename).st_mtime
+        except OSError:
+            return None
+
+    def refresh_if_changed(self):
+        if self._file_mtime() == self._loaded_mtime:
+            return
+        with self._reload_lock:
+            mtime = self._file_mtime()
+            if mtime == self._loaded_mtime:
+                return
+            # Load into a fresh manager and swap it in, so requests already
+            # running keep reading the old roster instead of a half-loaded one
+            manager = load_manager(self.data_dir, self.filename)
+            self._cache = {}
+            self.manager = manager
+            self._loaded_mtime = mtime
+
+    def run(self, command: str, argument: str = "") -> str:
+        if command not in COMMANDS:
+            raise KeyError(f"Unknown command '{command}'. Available: {', '.join(COMMANDS)}")
+        self.refresh_if_changed()
+        manager = self.manager
+        cache = self._cache
+        key = (command, argument)
+        if command in CACHEABLE_COMMANDS and key in cache:
+            return cache[key]
+
+        if command == "summary":
+            report = format_summary(manager)
+        elif command == "distribution":
+            report = format_distribution(manager)
+        elif command == "analytics":
+            report = format_analytics(manager, argument)
+        elif command == "export":
+            report = format_export(manager)
+        elif command == "search":
+            report = format_search(manager, argument)
+        else:
+            report = format_student_report(manager, argument)
+
+        if command in CACHEABLE_COMMANDS:
+            cache[key] = report
+        return report
+
+
+def make_handler(service: ReportService, log_requests: bool = True):
+    class ReportRequestHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            url = urlparse(self.path)
+            parts = [unquote(part) for part in url.path.strip("/").split("/") if part]
+            params = parse_qs(url.query)
+            command = parts[0] if parts else "summary"
+            argument = parts[1] if len(parts) > 1 else params.get("q", [""])[0]
+
+            try:
+                status, body = 200, service.run(command, argument)
+            except KeyError as e:
+                status, body = 404, str(e.args[0])
+            except ValueError as e:
+                status, body = 400 if command != "student" else 404, str(e)
+
+            data = (body + "\n").encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "text/plain; charset=utf-8")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, format, *args):
+            if log_requests:
+                super().log_message(format, *args)
+
+    return ReportRequestHandler
+
+
+def make_server(service: ReportService, host: str = "127.0.0.1", port: int = 8765,
+                log_requests: bool = True) -> ThreadingHTTPServer:
+    return ThreadingHTTPServer((host, port), make_handler(service, log_requests))
+
+
+def run_shell(service: ReportService, stream) -> int:
+    # One command per line (e.g. "search curry"), all answered from the same loaded roster
+    failures = 0
+    for line in stream:
+        try:
+            # An unbalanced quote ("search o'brien") fails this line, not the session
+            words = shlex.split(line)
+            if not words:
+                continue
+            print(service.run(words[0], " ".join(words[1:])))
+        except (KeyError, ValueError) as e:
+            failures += 1
+            print(f"Error: {e.args[0] if isinstance(e, KeyError) else e}", file=sys.stderr)
+        print()
+    return 1 if failures else 0
+
+
+def run_export_command(args) -> int:
+    exporter = IncrementalExporter(load_manager(args.data_dir, args.file), args.output_dir)
+    try:
+        if args.command == "compact-exports":
+            path = exporter.compact(prune=args.prune)
+        else:
+            path, written, removed, resumed = exporter.export(full=args.full)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    if args.command == "compact-exports":
+        if path is None:
+            print("Error: no export checkpoint found; run export-changes first", file=sys.stderr)
+            return 1
+        print(f"Exports compacted into {path}", file=sys.stderr)
+        return 0
+
+    if path is None:
+        print("No students have changed since the last export", file=sys.stderr)
+        return 0
+    note = " (resumed)" if resumed else ""
+    print(f"Exported {written} students and {removed} removals to {path}{note}", file=sys.stderr)
+    return 0
+
+
+def run_validate(args) -> int:
+    manager = load_manager(args.data_dir, args.file)
+    try:
+        with contextlib.redirect_stdout(sys.stderr):
+            valid, issues = manager.check_file(args.path)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    print(f"{args.path}: {valid} valid records, {len(issues)} problems")
+    for issue in issues:
+        print(f"  {issue}")
+    return 1 if issues else 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Student Manager reports without the GUI")
+    parser.add_argument("--data-dir", help="directory containing the roster (default: this folder)")
+    parser.add_argument("--file", default="studentMarks.txt", help="roster file name")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser("summary", help="class statistics and grade distribution")
+    subparsers.add_parser("distribution", help="grade distribution only")
+    search_parser = subparsers.add_parser("search", help="search by name or ID")
+    search_parser.add_argument("query")
+    student_parser = subparsers.add_parser("student", help="show one student's profile")
+    student_parser.add_argument("student_id")
+    analytics_parser = subparsers.add_parser("analytics", help="percentiles, per-assessment statistics and a histogram")
+    analytics_parser.add_argument("bin_width", nargs="?", default="", help="histogram bin width in percent (default 10)")
+    export_parser = subparsers.add_parser("export", help="full export in the GUI export format")
+    export_parser.add_argument("--output", help="write to this file instead of stdout")
+    changes_parser = subparsers.add_parser("export-changes",
+                                           help="write students changed since the last export (resumes an interrupted one)")
+    changes_parser.add_argument("--full", action="store_true", help="write every student and start a new export chain")
+    changes_parser.add_argument("--output-dir", help="directory for export files (default: this folder)")
+    compact_parser = subparsers.add_parser("compact-exports",
+                                           help="fold the last full export and its change exports into one snapshot")
+    compact_parser.add_argument("--output-dir", help="directory for export files (default: this folder)")
+    compact_parser.add_argument("--prune", action="store_true", help="delete the exports that were folded")
+    validate_parser = subparsers.add_parser("validate", help="check a roster file and list every invalid line")
+    validate_parser.add_argument("path")
+    subparsers.add_parser("shell", help="read commands from stdin, one per line, loading the roster once")
+    serve_parser = subparsers.add_parser("serve", help="serve reports over HTTP from one loaded roster")
+    serve_parser.add_argument("--host", default="127.0.0.1")
+    serve_parser.add_argument("--port", type=int, default=8765)
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+
+    if args.command in ("export-changes", "compact-exports"):
+        return run_export_command(args)
+
+    if args.command == "validate":
+        return run_validate(args)
+
+    service = ReportService(args.data_dir, args.file)
+
+    if args.command == "shell":
+        return run_shell(service, sys.stdin)
+
+    if args.command == "serve":
+        server = make_server(service, args.host, args.port)
+        print(f"Serving reports on http://{args.host}:{server.server_address[1]}/ "
+              f"({', '.join(COMMANDS)}); press Ctrl+C to stop", file=sys.stderr)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+        return 0
+
+    argument = (getattr(args, "query", None) or getattr(args, "student_id", None) or
+                getattr(args, "bin_width", None) or "")
+    try:
+        report = service.run(args.command, argument)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    if args.command == "export" and args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            file.write(report + "\n")
+        print(f"Student data exported to {args.output}", file=sys.stderr)
+    else:
+        print(report)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,687 @@
+from typing import List, Dict, Any, Callable, Iterable, Iterator, Optional, Tuple
+import threading
+from pathlib import Path
+from bisect import bisect_left, bisect_right
+from itertools import islice
+from profiling import instrumentation
+from analytics import RosterAnalytics
+from name_index import FuzzyNameIndex
+from sketches import RosterSketch
+from validation import StudentSchema, ValidationIssue, format_issues
+from history import Delta, EditHistory
+from storage import DURABILITY_LEVELS, FileLock, atomic_write, read_last_line, read_lock, remove_stale_temp_files
+
+# Trailer written after the student rows; older readers stop at the header count and ignore it
+GENERATION_PREFIX = "#generation="
+
+class Student:
+    def __init__(self, student_id: int, name: str, coursework_marks: List[int], exam_mark: int):
+        self.student_id = student_id
+        self.name = name
+        self.coursework_marks = coursework_marks
+        self.exam_mark = exam_mark
+    
+    @property
+    def total_coursework(self) -> int:
+        return sum(self.coursework_marks)
+    
+    @property
+    def total_marks(self) -> int:
+        return self.total_coursework + self.exam_mark
+    
+    @property
+    def percentage(self) -> float:
+        return (self.total_marks / 160) * 100
+    
+    @property
+    def grade(self) -> str:
+        percentage = self.percentage
+        if percentage >= 70:
+            return 'A'
+        elif percentage >= 60:
+            return 'B'
+        elif percentage >= 50:
+            return 'C'
+        elif percentage >= 40:
+            return 'D'
+        else:
+            return 'F'
+    
+    def to_file_format(self) -> str:
+        return f"{self.student_id},{self.name},{self.coursework_marks[0]},{self.coursework_marks[1]},{self.coursework_marks[2]},{self.exam_mark}"
+    
+    @classmethod
+    def from_file_format(cls, line: str) -> 'Student':
+        data = line.strip().split(',')
+        return cls(int(data[0]), data[1], [int(data[2]), int(data[3]), int(data[4])], int(data[5]))
+    
+    @classmethod
+    def from_values(cls, values: Tuple[Any, ...]) -> 'Student':
+        # Values in StudentSchema field order, already validated
+        student_id, name, task1, task2, task3, exam_mark = values
+        return cls(student_id, name, [task1, task2, task3], exam_mark)
+
+# Sort keys accepted by StudentQuery.sort_by; prefix a key with '-' for descending order
+SORT_KEYS: Dict[str, Callable[[Student], Any]] = {
+    'id': lambda s: s.student_id,
+    'name': lambda s: s.name.lower(),
+    'coursework': lambda s: s.total_coursework,
+    'exam': lambda s: s.exam_mark,
+    'total': lambda s: s.total_marks,
+    'percentage': lambda s: s.percentage,
+    'grade': lambda s: s.grade,
+}
+
+class StudentQuery:
+    def __init__(self, view: 'RosterView'):
+        self._view = view
+        self._grades: Optional[set] = None
+        self._percentage_range: Tuple[Optional[float], Optional[float]] = (None, None)
+        self._predicates: List[Callable[[Student], bool]] = []
+        self._sort_keys: List[Tuple[str, bool]] = []
+        self._offset = 0
+        self._limit: Optional[int] = None
+    
+    def grade(self, *grades: str) -> 'StudentQuery':
+        wanted = {g.upper() for g in grades}
+        self._grades = wanted if self._grades is None else self._grades & wanted
+        return self
+    
+    def percentage_between(self, low: Optional[float] = None, high: Optional[float] = None) -> 'StudentQuery':
+        current_low, current_high = self._percentage_range
+        if low is not None and (current_low is None or low > current_low):
+            current_low = low
+        if high is not None and (current_high is None or high < current_high):
+            current_high = high
+        self._percentage_range = (current_low, current_high)
+        return self
+    
+    def exam_at_least(self, mark: int) -> 'StudentQuery':
+        self._predicates.append(lambda s: s.exam_mark >= mark)
+        return self
+    
+    def exam_below(self, mark: int) -> 'StudentQuery':
+        self._predicates.append(lambda s: s.exam_mark < mark)
+        return self
+    
+    def coursework_at_least(self, total: int) -> 'StudentQuery':
+        self._predicates.append(lambda s: s.total_coursework >= total)
+        return self
+    
+    def coursework_below(self, total: int) -> 'StudentQuery':
+        self._predicates.append(lambda s: s.total_coursework < total)
+        return self
+    
+    def name_prefix(self, prefix: str) -> 'StudentQuery':
+        prefix = prefix.lower()
+        self._predicates.append(lambda s: s.name.lower().startswith(prefix))
+        return self
+    
+    def where(self, predicate: Callable[[Student], bool]) -> 'StudentQuery':
+        self._predicates.append(predicate)
+        return self
+    
+    def sort_by(self, *keys: str) -> 'StudentQuery':
+        for key in keys:
+            descending = key.startswith('-')
+            key = key.lstrip('-')
+            if key not in SORT_KEYS:
+                raise ValueError(f"Unknown sort key '{key}'")
+            self._sort_keys.append((key, descending))
+        return self
+    
+    def offset(self, count: int) -> 'StudentQuery':
+        if count < 0:
+            raise ValueError("Offset cannot be negative")
+        self._offset = count
+        return self
+    
+    def limit(self, count: int) -> 'StudentQuery':
+        if count < 0:
+            raise ValueError("Limit cannot be negative")
+        self._limit = count
+        return self
+    
+    def _matches(self, student: Student) -> bool:
+        if self._grades is not None and student.grade not in self._grades:
+            return False
+        low, high = self._percentage_range
+        if low is not None or high is not None:
+            percentage = student.percentage
+            if low is not None and percentage < low:
+                return False
+            if high is not None and percentage > high:
+                return False
+        return all(predicate(student) for predicate in self._predicates)
+    
+    def _source(self) -> Iterable[Student]:
+        low, high = self._percentage_range
+        if self._grades is not None:
+            grade_index = self._view.grade_index()
+            return (s for grade in sorted(self._grades) for s in grade_index.get(grade, ()))
+        if low is not None or high is not None:
+            return self._percentage_slice(False)
+        return self._view.students
+    
+    def _percentage_slice(self, descending: bool) -> Iterable[Student]:
+        ordered, keys = self._view.sorted_index('percentage')
+        low, high = self._percentage_range
+        start = 0 if low is None else bisect_left(keys, low)
+        stop = len(keys) if high is None else bisect_right(keys, high)
+        if descending:
+            return (ordered[i] for i in range(stop - 1, start - 1, -1))
+        return islice(ordered, start, stop)
+    
+    def __iter__(self) -> Iterator[Student]:
+        if len(self._sort_keys) == 1:
+            key, descending = self._sort_keys[0]
+            low, high = self._percentage_range
+            if key == 'percentage' and (low is not None or high is not None):
+                candidates = self._percentage_slice(descending)
+            else:
+                ordered, _ = self._view.sorted_index(key)
+                candidates = reversed(ordered) if descending else ordered
+        elif self._sort_keys:
+            candidates = [s for s in self._source() if self._matches(s)]
+            for key, descending in reversed(self._sort_keys):
+                candidates.sort(key=SORT_KEYS[key], reverse=descending)
+        else:
+            candidates = self._source()
+        
+        results = (s for s in candidates if self._matches(s))
+        stop = None if self._limit is None else self._offset + self._limit
+        return islice(results, self._offset, stop)
+    
+    @instrumentation.timed("query.run")
+    def all(self) -> List[Student]:
+        return list(self)
+    
+    def first(self) -> Optional[Student]:
+        return next(iter(self), None)
+    
+    def count(self) -> int:
+        return sum(1 for _ in self)
+
+class RosterView:
+    # Immutable copy of the roster at one version. Readers holding a view keep seeing
+    # the same students however many edits happen meanwhile; edits never modify a
+    # Student in place, they swap in a new object and start a new view
+    def __init__(self, students: Tuple[Student, ...], version: int, generation: int):
+        self.students = students
+        self.version = version
+        self.generation = generation
+        # Built on demand and owned by this view, so an index finished after an edit
+        # can never end up cached for the newer roster
+        self._indexes: Dict[str, Any] = {}
+    
+    def __len__(self) -> int:
+        return len(self.students)
+    
+    def __iter__(self) -> Iterator[Student]:
+        return iter(self.students)
+    
+    def grade_index(self) -> Dict[str, List[Student]]:
+        index = self._indexes.get('grade')
+        if index is None:
+            index = {'A': [], 'B': [], 'C': [], 'D': [], 'F': []}
+            for student in self.students:
+                index[student.grade].append(student)
+            self._indexes['grade'] = index
+        return index
+    
+    def sorted_index(self, key: str) -> Tuple[List[Student], List[Any]]:
+        cache_key = f"sorted:{key}"
+        index = self._indexes.get(cache_key)
+        if index is None:
+            key_func = SORT_KEYS[key]
+            ordered = sorted(self.students, key=key_func)
+            index = (ordered, [key_func(s) for s in ordered])
+            self._indexes[cache_key] = index
+        return index
+    
+    def by_id(self) -> Dict[int, Student]:
+        index = self._indexes.get('id')
+        if index is None:
+            index = {student.student_id: student for student in self.students}
+            self._indexes['id'] = index
+        return index
+    
+    def get_student(self, student_id: int) -> Student:
+        student = self.by_id().get(student_id)
+        if student is None:
+            raise ValueError(f"Student ID {student_id} not found")
+        return student
+    
+    def analytics(self) -> RosterAnalytics:
+        analytics = self._indexes.get('analytics')
+        if analytics is None:
+            analytics = RosterAnalytics(self.students)
+            self._indexes['analytics'] = analytics
+        return analytics
+    
+    def query(self) -> StudentQuery:
+        return StudentQuery(self)
+
+class StudentManager:
+    MIN_STUDENT_ID = 1000
+    MAX_STUDENT_ID = 9999
+    
+    def __init__(self, filename: str = "studentMarks.txt", data_dir: Optional[str] = None, durability: str = "safe",
+                 history_bytes: int = 1 << 20, sketches: bool = False):
+        if durability not in DURABILITY_LEVELS:
+            raise ValueError(f"Durability must be one of {', '.join(DURABILITY_LEVELS)}")
+        self.filename = filename
+        self.durability = durability
+        # Students keyed by ID; dicts keep insertion order so file order is preserved
+        self._records: Dict[int, Student] = {}
+        # Edits hold this lock; readers take it only to copy the roster into a new view
+        self._lock = threading.RLock()
+        # Bumped on every change; the current view (with its lazily built indexes) is
+        # dropped at the same time and rebuilt by the next reader
+        self._version = 0
+        self._view: Optional[RosterView] = None
+        # Save counter stored in the file trailer, used to detect saves by other sessions
+        self.generation = 0
+        # Student ID -> file line before our first unsaved change (None if it did not exist)
+        self._dirty: Dict[int, Optional[str]] = {}
+        self.last_conflicts: List[int] = []
+        # One schema validates dialog input and whole files alike
+        self.schema = StudentSchema(self.MIN_STUDENT_ID, self.MAX_STUDENT_ID)
+        self.last_load_issues: List[ValidationIssue] = []
+        # Optional streaming summaries, updated per edit so statistics need no roster scan
+        self.use_sketches = sketches
+        self.sketch: Optional[RosterSketch] = None
+        # Fuzzy name index, built by the first fuzzy search and then kept up to date per edit
+        self._name_index: Optional[FuzzyNameIndex] = None
+        self.script_dir = Path(__file__).resolve().parent
+        self.data_dir = Path(data_dir).resolve() if data_dir else self.script_dir
+        self.load_data()
+        # Undo/redo log of compact per-record deltas, journaled next to the roster
+        self.history = EditHistory(self.data_dir / f"{self.filename}.history", history_bytes,
+                                   self._lock_path(self.filename))
+    
+    def _invalidate_indexes(self):
+        self._version += 1
+        self._view = None
+    
+    def _rebuild_summaries(self):
+        # After a load or merge; the name index is rebuilt lazily by the next fuzzy search
+        if self.use_sketches:
+            self.sketch = RosterSketch(self._records.values())
+        self._name_index = None
+    
+    def _update_summaries(self, old: Optional[Student], new: Optional[Student]):
+        if self.sketch is not None:
+            self.sketch.replace(old, new)
+        if self._name_index is not None:
+            if old is not None:
+                self._name_index.remove(old.student_id, old.name)
+            if new is not None:
+                self._name_index.add(new.student_id, new.name)
+    
+    def _lock_path(self, filename: str) -> Path:
+        return self.data_dir / f"{filename}.lock"
+    
+    def _mark_dirty(self, student_id: int):
+        # Remember how a record looked on disk before its first unsaved change,
+        # so a save can tell our edits apart from another session's
+        if student_id not in self._dirty:
+            student = self._records.get(student_id)
+            self._dirty[student_id] = student.to_file_format() if student else None
+    
+    def _read_roster(self, text_file_path: Path) -> Optional[Tuple[Dict[int, Student], int]]:
+        with open(text_file_path, 'r') as file:
+            lines = file.readlines()
+        
+        if not lines:
+            return None
+
+        try:
+            num_students = int(lines[0].strip())
+        except ValueError:
+            print(f"First line of {text_file_path.name} should be the student count")
+            return None
+        
+        texts = list(map(str.strip, lines[1:num_students + 1]))
+        line_numbers, columns, issues = self.schema.validate_rows(texts, first_line=2)
+        
+        records: Dict[int, Student] = {}
+        for line_number, student_id, name, task1, task2, task3, exam_mark in zip(line_numbers, *columns):
+            if student_id in records:
+                issues.append(ValidationIssue(line_number, 'id', str(student_id),
+                                              "Duplicate student ID; the first record is kept"))
+            else:
+                records[student_id] = Student(student_id, name, [task1, task2, task3], exam_mark)
+        issues.sort(key=lambda issue: issue.line)
+        self.last_load_issues = issues
+        for message in format_issues(issues):
+            print(f"Skipping record - {message}")
+        
+        generation = 0
+        for line in lines[num_students + 1:]:
+            if line.startswith(GENERATION_PREFIX):
+                try:
+                    generation = int(line[len(GENERATION_PREFIX):])
+                except ValueError:
+                    pass
+        return records, generation
+    
+    def _disk_generation(self, text_file_path: Path) -> int:
+        last_line = read_last_line(text_file_path)
+        if last_line.startswith(GENERATION_PREFIX):
+            try:
+                return int(last_line[len(GENERATION_PREFIX):])
+            except ValueError:
+                pass
+        return 0
+    
+    def _merge_from_disk(self, text_file_path: Path):
+        roster = self._read_roster(text_file_path)
+        theirs, generation = roster if roster is not None else ({}, 0)
+        
+        conflicts = []
+        for student_id, base_line in self._dirty.items():
+            their_student = theirs.get(student_id)
+            their_line = their_student.to_file_format() if their_student else None
+            our_student = self._records.get(student_id)
+            our_line = our_student.to_file_format() if our_student else None
+            if their_line != base_line and their_line != our_line:
+                conflicts.append(student_id)
+            
+            if our_student is None:
+                theirs.pop(student_id, None)
+            else:
+                theirs[student_id] = our_student
+        
+        self._records = theirs
+        self.generation = generation
+        self.last_conflicts = conflicts
+        self._invalidate_indexes()
+        self._rebuild_summaries()
+        print(f"Merged changes saved by another session (file generation {generation})")
+        if conflicts:
+            print(f"Student IDs {conflicts} were also changed by another session; keeping this session's version")
+    
+    @instrumentation.timed("storage.load")
+    def load_data(self):
+        with self._lock:
+            text_files = [self.filename] + [name for name in ("studentMarks.txt", "studentsMarks.txt") if name != self.filename]
+            loaded = False
+            self._invalidate_indexes()
+            
+            for text_filename in text_files:
+                text_file_path = self.data_dir / text_filename
+                try:
+                    if text_file_path.exists():
+                        print(f"Loading student data from {text_file_path.name}")
+                        with read_lock(self._lock_path(text_filename)):
+                            roster = self._read_roster(text_file_path)
+                        
+                        self._records = {}
+                        
+                        if roster is None:
+                            continue
+                        
+                        self._records, self.generation = roster
+                        self._dirty = {}
+                        print(f"Successfully loaded {len(self._records)} students")
+                        self.filename = text_filename
+                        loaded = True
+                        break
+                    
+                except Exception as e:
+                    print(f"Error loading {text_filename}: {e}")
+                    continue
+            
+            if not loaded:
+                print("No student data file found, starting with empty database")
+                self._records = {}
+                self.generation = 0
+                self._dirty = {}
+            self._rebuild_summaries()
+    
+    def check_file(self, text_file_path: Path) -> Tuple[int, List[ValidationIssue]]:
+        # Validates a roster file without loading it; returns (valid records, issues)
+        roster = self._read_roster(Path(text_file_path))
+        if roster is None:
+            raise ValueError(f"{Path(text_file_path).name} is empty or has no student count on its first line")
+        return len(roster[0]), self.last_load_issues
+    
+    def validate_student(self, raw: Dict[str, str]) -> Student:
+        # Raw text keyed by schema field name (id, name, task1, task2, task3, exam);
+        # raises ValidationFailed (a ValueError) listing every problem
+        return Student.from_values(self.schema.validate_record(raw))
+    
+    @instrumentation.timed("storage.save")
+    def save_data(self, durability: Optional[str] = None):
+        with self._lock:
+            try:
+                text_file_path = self.data_dir / self.filename
+                
+                with FileLock(self._lock_path(self.filename)):
+                    remove_stale_temp_files(text_file_path)
+                    
+                    # Another session saved since we last read the file: fold its changes in
+                    # rather than overwriting them
+                    if text_file_path.exists() and self._disk_generation(text_file_path) != self.generation:
+                        self._merge_from_disk(text_file_path)
+                    
+                    next_generation = self.generation + 1
+                    with atomic_write(text_file_path, durability or self.durability) as file:
+                        file.write(f"{len(self._records)}\n")
+                        file.writelines(f"{student.to_file_format()}\n" for student in self._records.values())
+                        file.write(f"{GENERATION_PREFIX}{next_generation}\n")
+                    
+                    self.generation = next_generation
+                    self._dirty = {}
+                    # New views should carry the generation just written
+                    self._invalidate_indexes()
+                
+                print(f"Saved {len(self._records)} students to {self.filename}")
+                return True
+            except Exception as e:
+                print(f"Error saving student data: {e}")
+                raise
+    
+    @instrumentation.timed("mutation.add")
+    def add_student(self, student: Student):
+        with self._lock:
+            if student.student_id in self._records:
+                raise ValueError(f"Student ID {student.student_id} already exists")
+            
+            self._mark_dirty(student.student_id)
+            self._records[student.student_id] = student
+            self._invalidate_indexes()
+            self._update_summaries(None, student)
+            self.save_data()
+            self.history.record(None, student.to_file_format())
+    
+    @instrumentation.timed("mutation.remove")
+    def remove_student(self, student_id: int):
+        with self._lock:
+            if student_id in self._records:
+                self._mark_dirty(student_id)
+                removed = self._records.pop(student_id)
+                self._invalidate_indexes()
+                self._update_summaries(removed, None)
+                self.save_data()
+                self.history.record(removed.to_file_format(), None)
+                return True
+            return False
+    
+    @instrumentation.timed("mutation.update")
+    def update_student(self, student_id: int, updated_student: Student):
+        with self._lock:
+            if student_id not in self._records:
+                return False
+            
+            new_id = updated_student.student_id
+            if new_id != student_id and new_id in self._records:
+                raise ValueError(f"Student ID {new_id} already exists")
+            
+            self._mark_dirty(student_id)
+            self._mark_dirty(new_id)
+            previous = self._records[student_id]
+            before = previous.to_file_format()
+            if new_id == student_id:
+                self._records[student_id] = updated_student
+            else:
+                # Rebuild so the renamed record keeps its position in the file
+                self._records = {new_id if sid == student_id else sid: updated_student if sid == student_id else s
+                                 for sid, s in self._records.items()}
+            self._invalidate_indexes()
+            self._update_summaries(previous, updated_student)
+            self.save_data()
+            self.history.record(before, updated_student.to_file_format())
+            return True
+    
+    def _replace_record(self, current: Optional[str], target: Optional[str]):
+        # Swap one record state for another in O(1); current must still match the roster.
+        # Callers (undo/redo) hold self._lock
+        current_student = Student.from_file_format(current) if current else None
+        target_student = Student.from_file_format(target) if target else None
+        
+        if current_student is not None:
+            existing = self._records.get(current_student.student_id)
+            if existing is None or existing.to_file_format() != current:
+                raise ValueError(f"Student ID {current_student.student_id} has changed since this edit, so it cannot be reverted")
+        if (target_student is not None and target_student.student_id in self._records and
+                (current_student is None or current_student.student_id != target_student.student_id)):
+            raise ValueError(f"Student ID {target_student.student_id} already exists")
+        
+        for student in (current_student, target_student):
+            if student is not None:
+                self._mark_dirty(student.student_id)
+        if current_student is not None and target_student is not None and current_student.student_id == target_student.student_id:
+            self._records[target_student.student_id] = target_student
+        else:
+            if current_student is not None:
+                del self._records[current_student.student_id]
+            if target_student is not None:
+                self._records[target_student.student_id] = target_student
+        self._invalidate_indexes()
+        self._update_summaries(current_student, target_student)
+        self.save_data()
+    
+    def _describe_delta(self, delta: Delta) -> str:
+        before, after = delta
+        student = Student.from_file_format(after or before)
+        if before is None:
+            return f"adding {student.name} (ID {student.student_id})"
+        if after is None:
+            return f"removing {student.name} (ID {student.student_id})"
+        return f"changes to {student.name} (ID {student.student_id})"
+    
+    @instrumentation.timed("mutation.undo")
+    def undo(self) -> Optional[str]:
+        with self._lock:
+            delta = self.history.peek_undo()
+            if delta is None:
+                return None
+            before, after = delta
+            try:
+                self._replace_record(after, before)
+            except ValueError:
+                self.history.discard_undo()
+                raise
+            self.history.undo()
+            return f"Undid {self._describe_delta(delta)}"
+    
+    @instrumentation.timed("mutation.redo")
+    def redo(self) -> Optional[str]:
+        with self._lock:
+            delta = self.history.peek_redo()
+            if delta is None:
+                return None
+            before, after = delta
+            try:
+                self._replace_record(before, after)
+            except ValueError:
+                self.history.discard_redo()
+                raise
+            self.history.redo()
+            return f"Redid {self._describe_delta(delta)}"
+    
+    def get_student(self, student_id: int) -> Student:
+        student = self._records.get(student_id)
+        if student is None:
+            raise ValueError(f"Student ID {student_id} not found")
+        return student
+    
+    def get_all_students(self) -> List[Student]:
+        return list(self.snapshot())
+    
+    def count(self) -> int:
+        return len(self._records)
+    
+    def is_empty(self) -> bool:
+        return not self._records
+    
+    def view(self) -> RosterView:
+        # Copy-on-write: one immutable view is shared by every reader until the next mutation
+        view = self._view
+        if view is None:
+            with self._lock:
+                view = self._view
+                if view is None:
+                    view = RosterView(tuple(self._records.values()), self._version, self.generation)
+                    self._view = view
+        return view
+    
+    def snapshot(self) -> Tuple[Student, ...]:
+        return self.view().students
+    
+    def iter_students(self) -> Iterator[Student]:
+        return iter(self.snapshot())
+    
+    def query(self) -> StudentQuery:
+        return StudentQuery(self.view())
+    
+    @instrumentation.timed("stats.highest")
+    def get_highest_scoring_student(self) -> Student:
+        students = self.snapshot()
+        if not students:
+            raise ValueError("No students available")
+        return max(students, key=lambda s: s.percentage)
+    
+    @instrumentation.timed("stats.lowest")
+    def get_lowest_scoring_student(self) -> Student:
+        students = self.snapshot()
+        if not students:
+            raise ValueError("No students available")
+        return min(students, key=lambda s: s.percentage)
+    
+    @instrumentation.timed("stats.average")
+    def get_average_percentage(self) -> float:
+        students = self.snapshot()
+        if not students:
+            return 0.0
+        return sum(student.percentage for student in students) / len(students)
+    
+    @instrumentation.timed("stats.distribution")
+    def get_grade_distribution(self) -> Dict[str, int]:
+        return {grade: len(students) for grade, students in self.view().grade_index().items()}
+    
+    @instrumentation.timed("stats.analytics")
+    def analytics(self) -> RosterAnalytics:
+        # Built in one pass over the roster and reused until the next mutation
+        return self.view().analytics()
+    
+    @instrumentation.timed("query.fuzzy_search")
+    def fuzzy_search(self, query: str, limit: int = 10) -> List[Tuple[Student, float]]:
+        # Ranked by name similarity, so "jon cury" still finds John Curry
+        with self._lock:
+            if self._name_index is None:
+                self._name_index = FuzzyNameIndex((s.student_id, s.name) for s in self._records.values())
+            matches = self._name_index.search(query, limit)
+            return [(self._records[student_id], score) for student_id, score in matches]
+    
+    @instrumentation.timed("query.search")
+    def search_students(self, query: str) -> List[Student]:
+        query = query.lower()
+        results = []
+        for student in self.snapshot():
+            if (query in student.name.lower() or 
+                query in str(student.student_id)):
+                results.append(student)
+        return results
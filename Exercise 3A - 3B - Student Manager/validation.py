@@ -0,0 +1,167 @@
+from itertools import compress, repeat
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+
+class Field:
+    def __init__(self, name: str, label: str, kind: type = int, minimum: Optional[int] = None,
+                 maximum: Optional[int] = None):
+        self.name = name
+        self.label = label
+        self.kind = kind
+        self.minimum = minimum
+        self.maximum = maximum
+
+    def range_message(self) -> str:
+        return f"{self.label} must be between {self.minimum} and {self.maximum}"
+
+    def convert(self, raw: str) -> Tuple[Any, Optional[str]]:
+        # Returns (value, error message or None) for one raw value
+        raw = raw.strip()
+        if self.kind is str:
+            return raw, None if raw else f"{self.label} cannot be empty"
+        try:
+            value = int(raw)
+        except ValueError:
+            return None, f"{self.label} must be a whole number"
+        if not self.minimum <= value <= self.maximum:
+            return value, self.range_message()
+        return value, None
+
+
+class ValidationIssue:
+    def __init__(self, line: Optional[int], field: Optional[str], value: str, message: str):
+        self.line = line
+        self.field = field
+        self.value = value
+        self.message = message
+
+    def __str__(self) -> str:
+        location = f"Line {self.line}: " if self.line is not None else ""
+        return f"{location}{self.message} (got '{self.value}')"
+
+
+class ValidationFailed(ValueError):
+    # Raised for a single record; the message lists every problem, one per line
+    def __init__(self, issues: List[ValidationIssue]):
+        super().__init__("\n".join(issue.message for issue in issues))
+        self.issues = issues
+
+
+class StudentSchema:
+    # Column order matches the roster file: id,name,task1,task2,task3,exam
+    def __init__(self, min_id: int = 1000, max_id: int = 9999):
+        self.fields = (
+            Field('id', "Student ID", int, min_id, max_id),
+            Field('name', "Name", str),
+            Field('task1', "Task 1 mark", int, 0, 20),
+            Field('task2', "Task 2 mark", int, 0, 20),
+            Field('task3', "Task 3 mark", int, 0, 20),
+            Field('exam', "Exam mark", int, 0, 100),
+        )
+
+    def validate_record(self, raw: Dict[str, str]) -> Tuple[Any, ...]:
+        # One record from a dialog, keyed by field name; raises ValidationFailed
+        values, issues = [], []
+        for field in self.fields:
+            text = raw.get(field.name, "")
+            value, message = field.convert(text)
+            if message:
+                issues.append(ValidationIssue(None, field.name, text.strip(), message))
+            values.append(value)
+        if issues:
+            raise ValidationFailed(issues)
+        return tuple(values)
+
+    def validate_rows(self, texts: Sequence[str], first_line: int = 1) -> Tuple[List[int], List[List[Any]], List[ValidationIssue]]:
+        # A whole file at once; texts[i] is stripped line first_line + i and blank lines
+        # are skipped. The rows are joined and split once into flat columns, and each
+        # column is converted and range-checked with builtins (map/min/max); per-value
+        # checks only run for a column that actually holds a bad value.
+        # Returns (line numbers, columns) of the valid rows and the issues in line order
+        width = len(self.fields)
+        issues: List[ValidationIssue] = []
+        line_numbers: Sequence[int] = range(first_line, first_line + len(texts))
+        commas = list(map(str.count, texts, repeat(',', len(texts))))
+        if not texts or min(commas) != width - 1 or max(commas) != width - 1 or not all(texts):
+            kept_lines, kept_texts = [], []
+            for line, text, count in zip(line_numbers, texts, commas):
+                if not text:
+                    continue
+                if count < width - 1:
+                    issues.append(ValidationIssue(line, None, text, f"Expected {width} values, found {count + 1}"))
+                    continue
+                kept_lines.append(line)
+                # Extra trailing values are ignored, as they always have been
+                kept_texts.append(text if count == width - 1 else ",".join(text.split(',')[:width]))
+            line_numbers, texts = kept_lines, kept_texts
+        if not texts:
+            return [], [[] for _ in self.fields], issues
+
+        flat = ",".join(texts).split(',')
+        columns: List[List[Any]] = []
+        bad_rows: Set[int] = set()
+        for position, field in enumerate(self.fields):
+            raw_column = flat[position::width]
+            column, bad = self._check_column(field, raw_column)
+            for index, message in bad:
+                bad_rows.add(index)
+                issues.append(ValidationIssue(line_numbers[index], field.name, raw_column[index].strip(), message))
+            columns.append(column)
+
+        if bad_rows:
+            keep = bytearray(b"\x01") * len(texts)
+            for index in bad_rows:
+                keep[index] = 0
+            line_numbers = list(compress(line_numbers, keep))
+            columns = [list(compress(column, keep)) for column in columns]
+        issues.sort(key=lambda issue: issue.line)
+        return list(line_numbers), columns, issues
+
+    def _check_column(self, field: Field, raw_column: Sequence[str]) -> Tuple[List[Any], List[Tuple[int, str]]]:
+        if field.kind is str:
+            column = list(map(str.strip, raw_column))
+            if all(column):
+                return column, []
+            return column, [(index, f"{field.label} cannot be empty") for index, value in enumerate(column) if not value]
+
+        try:
+            # int() ignores surrounding whitespace, so the column needs no stripping
+            column, bad = list(map(int, raw_column)), []
+        except ValueError:
+            column, bad = self._convert_irregular(field, raw_column)
+        if min(column) >= field.minimum and max(column) <= field.maximum:
+            return column, bad
+        bad.extend((index, field.range_message()) for index, value in enumerate(column)
+                   if not field.minimum <= value <= field.maximum)
+        return column, bad
+
+    def _convert_irregular(self, field: Field, raw_column: Sequence[str]) -> Tuple[List[int], List[Tuple[int, str]]]:
+        # Only the values that are not plain digits go through Field.convert, and a
+        # bytes scan finds them; rows that fail get an in-range placeholder, so the
+        # range check does not report them twice (they are dropped anyway)
+        plain = bytes(map(str.isdecimal, raw_column))
+        irregular = []
+        index = plain.find(0)
+        while index != -1:
+            irregular.append(index)
+            index = plain.find(0, index + 1)
+        fixed = list(raw_column)
+        for index in irregular:
+            fixed[index] = '0'
+        column = list(map(int, fixed))
+        bad = []
+        for index in irregular:
+            value, message = field.convert(raw_column[index])
+            if message:
+                bad.append((index, message))
+                value = field.minimum
+            column[index] = value
+        return column, bad
+
+
+def format_issues(issues: Iterable[ValidationIssue], limit: int = 20) -> List[str]:
+    issues = list(issues)
+    lines = [str(issue) for issue in issues[:limit]]
+    if len(issues) > limit:
+        lines.append(f"... and {len(issues) - limit} more")
+    return lines